@@ -0,0 +1,422 @@
+# Análisis incremental de programas PL/0 para un editor, que vuelve a
+# analizar el programa después de cada cambio del texto.
+#
+# Una SesionIncremental guarda el texto, su AST y un árbol de fragmentos:
+# las sentencias y los bloques del último análisis correcto, con su posición
+# en el texto, el tipo de su primer token y del token que los sigue, y el
+# estado del parser LALR bajo cada uno. Tras un cambio (editar()) no se
+# analiza todo el programa, sino solo el fragmento más pequeño que contiene
+# el cambio:
+#   - Solo se vuelven a obtener los tokens del texto de ese fragmento.
+#   - El parser continúa desde el estado guardado bajo el fragmento, con
+#     parser.parsefragment(), en vez de empezar desde el principio.
+#   - Los fragmentos de dentro que el cambio no toca se reutilizan enteros
+#     (por ejemplo, el bloque de un procedimiento o el cuerpo de un while).
+#   - En una lista begin ... end solo se analizan las sentencias tocadas, y
+#     se sustituyen en la lista.
+# Si el fragmento no basta (por ejemplo, el cambio añade un punto y coma que
+# parte una sentencia en dos), se prueba con el fragmento que lo contiene.
+# El AST nuevo comparte con el anterior todos los nodos que no cambian.
+#
+# Si el texto tiene errores de sintaxis, errores lleva solo el primero de los
+# que daría analizar(), porque el parser se detiene en él en lugar de
+# recuperarse y seguir, y ast es None. La sesión conserva entonces el árbol
+# del último análisis correcto y la zona del texto cambiada desde entonces:
+# la siguiente edición vuelve a analizar el fragmento que contiene esa zona.
+#
+# La posición de cada fragmento es relativa al inicio de su padre. Así un
+# cambio solo desplaza a los hermanos posteriores de los fragmentos que lo
+# contienen, no a todos los fragmentos que hay detrás.
+
+import bisect
+
+from AnalizadorLexico import analizador, mensajeCaracterIlegal
+import AnalizadorSintactico
+from AnalizadorSintactico import parser
+from ArbolSintactico import Block, ProcDecl, Begin, If, While
+
+# Símbolos de la gramática que se guardan como fragmentos
+FRAGMENTOS = ('statement', 'block')
+
+
+class Fragmento:
+    """Sentencia o bloque del último análisis correcto."""
+    __slots__ = ('nombre', 'longitud', 'estado', 'valor', 'primero', 'siguiente', 'hijos', 'inicios')
+
+    def __init__(self, nombre, longitud, estado, valor, primero, siguiente):
+        self.nombre = nombre        # 'statement' o 'block'
+        self.longitud = longitud    # Caracteres desde su primer token hasta el token siguiente
+        self.estado = estado        # Estado del parser bajo el fragmento
+        self.valor = valor          # Nodo del AST (None si es una sentencia vacía)
+        self.primero = primero      # Tipo de su primer token (el siguiente si está vacío)
+        self.siguiente = siguiente  # Tipo del token que sigue al fragmento
+        self.hijos = []             # Fragmentos que contiene, en orden
+        self.inicios = []           # Posición de cada hijo, relativa al inicio de este fragmento
+
+
+# El cambio no cabe en el fragmento elegido: hay que probar con el que lo contiene
+class _Reanalizar(Exception):
+    pass
+
+
+# El fragmento tiene un error de sintaxis (ya anotado por p_error)
+class _ErrorSintaxis(Exception):
+    pass
+
+
+# Devuelve el valor de un fragmento con los valores de sus hijos hijos[k1:k2]
+# sustituidos por nuevos (viejo es el valor del hijo sustituido si solo es
+# uno). Un begin tiene un hijo por sentencia de su lista; un if o un while,
+# su cuerpo; un bloque, el bloque de su procedimiento (si lo tiene) y su
+# sentencia.
+def valorConHijos(fragmento, k1, k2, nombre, viejo, nuevos):
+    valor = fragmento.valor
+    if isinstance(valor, Begin):
+        return Begin(valor.statements[:k1] + nuevos + valor.statements[k2:])
+    nuevo, = nuevos
+    if isinstance(valor, (If, While)):
+        return type(valor)(valor.cond, nuevo)
+    if nombre == 'statement':
+        return Block(valor.consts, valor.vars, valor.procs, nuevo)
+    procs = [ProcDecl(p.name, nuevo) if p.block is viejo else p for p in valor.procs]
+    return Block(valor.consts, valor.vars, procs, valor.body)
+
+
+class SesionIncremental:
+    """Texto de un programa PL/0 que se analiza de nuevo tras cada edición."""
+
+    def __init__(self, texto=''):
+        # Analizador léxico propio, que anota las posiciones de los caracteres
+        # ilegales en vez de añadir un mensaje a la lista global de errores
+        self.lexer = analizador.clone()
+        self.lexer.lexerrorf = self._caracterIlegal
+        self.texto = texto
+        self.ast = None          # AST del texto actual (None si tiene errores de sintaxis)
+        self.errores = []        # Mensajes de error del texto actual
+        self.raiz = None         # Fragmento del bloque principal del último análisis correcto
+        self.inicioRaiz = 0      # Posición de la raíz
+        self.ilegales = []       # Posiciones de los caracteres ilegales de ese análisis
+        self.danado = None       # Zona (inicio, fin) cambiada desde entonces, en posiciones de aquel texto
+        self.desplazamiento = 0  # Diferencia de longitud entre el texto actual y aquel
+        self._nuevosIlegales = []
+        self._reutilizados = []
+        self.analizarTodo()
+
+    # Sustituye texto[inicio:fin] por texto y vuelve a analizar.
+    # Devuelve el AST nuevo (o None si hay errores de sintaxis).
+    def editar(self, inicio, fin, texto):
+        if not 0 <= inicio <= fin <= len(self.texto):
+            raise ValueError(f'Rango de edición no válido: {inicio}..{fin}')
+        self.texto = self.texto[:inicio] + texto + self.texto[fin:]
+        if self.raiz is None:
+            return self.analizarTodo()
+        if self.danado is None:
+            self.danado = (inicio, fin)
+        else:
+            ds, de = self.danado
+            self.danado = (min(ds, inicio), max(de, fin - self.desplazamiento))
+        self.desplazamiento += len(texto) - (fin - inicio)
+        return self._reanalizar()
+
+    # Analiza todo el texto y reconstruye el árbol de fragmentos
+    def analizarTodo(self):
+        self.raiz = None
+        self.ilegales = []
+        self.danado = None
+        self.desplazamiento = 0
+        self._preparar()
+        registros = []
+        try:
+            valor, siguiente = self._analizar('block', 0, None, registros, {})
+            if siguiente.type != '$end':
+                # El bloque principal termina antes que el texto: el parser
+                # completo daría el error en el token siguiente
+                AnalizadorSintactico.p_error(siguiente)
+                while self.lexer.token() is not None:
+                    pass
+                raise _ErrorSintaxis
+        except _Reanalizar:
+            # Una regla lanzó SyntaxError: solo el parser completo sabe recuperarse
+            ast = AnalizadorSintactico.analizar(self.texto)
+            if AnalizadorSintactico.errores:
+                ast = None
+            self.ast = ast
+            self.errores = AnalizadorSintactico.erroresLexicos + AnalizadorSintactico.errores[:1]
+            return ast
+        except _ErrorSintaxis:
+            return self._terminar(None, self._nuevosIlegales)
+        (self.inicioRaiz, self.raiz), = self._construir(registros)
+        self.ilegales = self._nuevosIlegales
+        return self._terminar(valor, self.ilegales)
+
+    # Prepara los analizadores léxicos para el texto actual. p_error calcula
+    # la línea y la columna de los errores con el analizador compartido.
+    def _preparar(self):
+        del AnalizadorSintactico.errores[:]
+        analizador.input(self.texto)
+        self.lexer.input(self.texto)
+        self._nuevosIlegales = []
+        self._reutilizados = []
+
+    def _caracterIlegal(self, t):
+        self._nuevosIlegales.append(t.lexpos)
+        t.lexer.skip(1)
+
+    def _terminar(self, ast, ilegales):
+        self.ast = ast
+        self.errores = [mensajeCaracterIlegal(self.texto[p], *analizador.position(p)) for p in ilegales]
+        self.errores.extend(AnalizadorSintactico.errores)
+        return ast
+
+    # Posición en el texto actual de una posición del último texto correcto
+    # que no está dentro de la zona cambiada
+    def _nueva(self, posicion):
+        return posicion + self.desplazamiento if posicion >= self.danado[1] else posicion
+
+    # Comprueba si un fragmento que empieza en inicio contiene la zona cambiada.
+    # Puede empezar justo donde empieza el cambio si le precede un espacio, ya
+    # que entonces el cambio no puede alargar el token anterior.
+    def _contiene(self, fragmento, inicio):
+        ds, de = self.danado
+        if de > inicio + fragmento.longitud:
+            return False
+        if inicio < ds:
+            return True
+        return inicio == ds and (inicio == 0 or self.texto[inicio - 1] in self.lexer.lexignore)
+
+    # Fragmentos (fragmento, inicio, índice en su padre) desde la raíz hasta el
+    # más pequeño que contiene la zona cambiada
+    def _camino(self):
+        ds = self.danado[0]
+        fragmento, inicio = self.raiz, self.inicioRaiz
+        if not self._contiene(fragmento, inicio):
+            return []
+        camino = [(fragmento, inicio, None)]
+        while True:
+            i = bisect.bisect_right(fragmento.inicios, ds - inicio) - 1
+            if i < 0:
+                return camino
+            hijo, inicioHijo = fragmento.hijos[i], inicio + fragmento.inicios[i]
+            if not self._contiene(hijo, inicioHijo):
+                return camino
+            camino.append((hijo, inicioHijo, i))
+            fragmento, inicio = hijo, inicioHijo
+
+    # Vuelve a analizar el fragmento más pequeño que contiene la zona cambiada.
+    # Si no basta, prueba con los que lo contienen y, al final, con todo el texto.
+    def _reanalizar(self):
+        camino = self._camino()
+        while camino:
+            fragmento, inicio, _ = camino[-1]
+            intentos = [self._reanalizarFragmento]
+            if isinstance(fragmento.valor, Begin):
+                intentos.insert(0, self._reanalizarLista)
+            for intento in intentos:
+                self._preparar()
+                try:
+                    intento(camino)
+                except _Reanalizar:
+                    continue
+                except _ErrorSintaxis:
+                    return self._terminar(None, self._ilegalesRegion())
+                self.ilegales = self._ilegalesRegion()
+                self.danado = None
+                self.desplazamiento = 0
+                return self._terminar(self.raiz.valor, self.ilegales)
+            camino.pop()
+        return self.analizarTodo()
+
+    # Vuelve a analizar un fragmento entero, desde el estado guardado bajo él.
+    # Ese estado se alcanzó con reducciones que dependen del tipo del primer
+    # token del fragmento, así que ese tipo no puede cambiar.
+    def _reanalizarFragmento(self, camino):
+        fragmento, inicio, indice = camino[-1]
+        fin = inicio + fragmento.longitud
+        self._region = (inicio, fin)
+        self.lexer.lexpos = inicio
+        token = self.lexer.token()
+        if (token.type if token else '$end') != fragmento.primero:
+            raise _Reanalizar
+        del self._nuevosIlegales[:]  # Se vuelven a encontrar al analizar
+        candidatos = {}
+        self._candidatos(fragmento, inicio, 0, len(fragmento.hijos), candidatos)
+        self.lexer.lexpos = inicio
+        registros = []
+        valor, siguiente = self._analizar(fragmento.nombre, fragmento.estado, self._nueva(fin),
+                                          registros, candidatos)
+        self._comprobarFin(siguiente, self._nueva(fin), fragmento.siguiente)
+        if len(camino) == 1:
+            (self.inicioRaiz, self.raiz), = self._construir(registros)
+        else:
+            self._sustituir(camino[:-1], indice, indice + 1, self._construir(registros))
+
+    # Vuelve a analizar solo las sentencias de un begin ... end que toca el
+    # cambio. Empieza por el token anterior a la primera (BEGIN o el punto y
+    # coma que la separa de la anterior) para comprobar que no ha cambiado, y
+    # termina en el punto y coma o el END que sigue a la última.
+    def _reanalizarLista(self, camino):
+        bloque, inicio, _ = camino[-1]
+        ds, de = self.danado
+        hijos, inicios = bloque.hijos, bloque.inicios
+        if ds <= inicio:
+            raise _Reanalizar
+        k1 = max(bisect.bisect_left(inicios, ds - inicio) - 1, 0)
+        k2 = k1 + 1
+        while inicio + inicios[k2 - 1] + hijos[k2 - 1].longitud < de:
+            k2 += 1
+            if k2 > len(hijos):
+                raise _Reanalizar
+        if k1:
+            anterior = inicio + inicios[k1 - 1] + hijos[k1 - 1].longitud
+            tipoAnterior = hijos[k1 - 1].siguiente
+        else:
+            anterior, tipoAnterior = inicio, 'BEGIN'
+        fin = inicio + inicios[k2 - 1] + hijos[k2 - 1].longitud
+        tipoFin = hijos[k2 - 1].siguiente
+        self._region = (anterior, fin)
+        fin = self._nueva(fin)
+
+        self.lexer.lexpos = anterior
+        token = self.lexer.token()
+        if token is None or token.lexpos != anterior or token.type != tipoAnterior:
+            raise _Reanalizar
+        candidatos = {}
+        self._candidatos(bloque, inicio, k1, k2, candidatos)
+        estado = hijos[k1].estado
+        nuevos = []
+        while True:
+            registros = []
+            valor, siguiente = self._analizar('statement', estado, fin, registros, candidatos)
+            nuevos.extend(self._construir(registros))
+            if siguiente.type != 'SEMICOLON' or siguiente.lexpos >= fin:
+                break
+            estado = self._estadoSeparador(bloque)
+        self._comprobarFin(siguiente, fin, tipoFin)
+        self._sustituir(camino, k1, k2, nuevos)
+
+    # Estado del parser tras el punto y coma que separa dos sentencias de un begin
+    def _estadoSeparador(self, bloque):
+        if len(bloque.hijos) > 1:
+            return bloque.hijos[1].estado
+        lista = parser.goto[bloque.hijos[0].estado]['statementList']
+        return parser.action[lista]['SEMICOLON']
+
+    # Fragmentos hijos[desde:hasta] de fragmento (y, dentro de los que toca el
+    # cambio, sus hijos) que el parser puede reutilizar, por su posición en el
+    # texto actual. También el primer carácter del token que sigue a cada uno
+    # debe quedar fuera del cambio; el tipo de ese token se comprueba al
+    # reutilizarlo.
+    def _candidatos(self, fragmento, inicio, desde, hasta, candidatos):
+        ds, de = self.danado
+        for i in range(desde, hasta):
+            hijo, inicioHijo = fragmento.hijos[i], inicio + fragmento.inicios[i]
+            if inicioHijo + hijo.longitud < ds:
+                candidatos[inicioHijo] = (hijo, inicioHijo)
+            elif inicioHijo >= de:
+                candidatos[inicioHijo + self.desplazamiento] = (hijo, inicioHijo)
+            else:
+                self._candidatos(hijo, inicioHijo, 0, len(hijo.hijos), candidatos)
+
+    # Analiza con parser.parsefragment() el símbolo que empieza en la posición
+    # actual del analizador léxico y debe terminar en fin (None: al final del
+    # texto). Devuelve su valor y el token que lo sigue.
+    def _analizar(self, simbolo, estado, fin, registros, candidatos):
+        lexer = self.lexer
+
+        def fuente():
+            token = lexer.token()
+            if token is not None and fin is not None and token.lexpos < fin < lexer.lexpos:
+                raise _Reanalizar  # El cambio ha unido el último token con el siguiente
+            return token
+
+        def reutilizar(token, estadoActual):
+            candidato = candidatos.get(token.lexpos)
+            if candidato is None or candidato[0].estado != estadoActual:
+                return None
+            fragmento, inicio = candidato
+            posicion = lexer.lexpos
+            lexer.lexpos = self._nueva(inicio + fragmento.longitud)
+            siguiente = fuente()
+            if (siguiente.type if siguiente else '$end') != fragmento.siguiente:
+                lexer.lexpos = posicion
+                return None
+            registros.append((fragmento, token.lexpos))
+            self._reutilizados.append((inicio, inicio + fragmento.longitud))
+            return fragmento.nombre, fragmento.valor, siguiente
+
+        estado, valor, siguiente = parser.parsefragment(simbolo, estado, lexer, fuente, fin, FRAGMENTOS,
+                                                        registros, reutilizar if candidatos else None)
+        if estado is None:
+            raise _Reanalizar
+        if estado is False:
+            # Se sigue hasta el final de la zona para conocer sus errores léxicos
+            token = siguiente if siguiente.type != '$end' else None
+            while token is not None and (fin is None or token.lexpos < fin):
+                token = lexer.token()
+            raise _ErrorSintaxis
+        return valor, siguiente
+
+    # El fragmento debe terminar justo antes del token que lo seguía
+    def _comprobarFin(self, siguiente, fin, tipo):
+        if siguiente.type != tipo or getattr(siguiente, 'lexpos', len(self.texto)) != fin:
+            raise _Reanalizar
+
+    # Crea los fragmentos de los registros de parsefragment(). Los registros
+    # llegan en postorden, así que los hijos de cada fragmento son los
+    # anteriores que empiezan dentro de él. Devuelve los fragmentos de más
+    # arriba con su posición, en orden.
+    def _construir(self, registros):
+        pila = []
+        for registro in registros:
+            if len(registro) == 2:
+                fragmento, inicio = registro  # Fragmento reutilizado
+            else:
+                nombre, primero, estado, valor, siguiente = registro
+                inicio = getattr(primero, 'lexpos', len(self.texto))
+                fin = getattr(siguiente, 'lexpos', len(self.texto))
+                fragmento = Fragmento(nombre, fin - inicio, estado, valor, primero.type, siguiente.type)
+                k = len(pila)
+                while k and pila[k - 1][0] >= inicio:
+                    k -= 1
+                fragmento.hijos = [hijo for _, hijo in pila[k:]]
+                fragmento.inicios = [posicion - inicio for posicion, _ in pila[k:]]
+                del pila[k:]
+            pila.append((inicio, fragmento))
+        return pila
+
+    # Sustituye los hijos hijos[k1:k2] del último fragmento del camino por los
+    # fragmentos nuevos (con su posición) y actualiza la longitud, el valor y
+    # la posición de los hijos posteriores de todos los fragmentos del camino
+    def _sustituir(self, camino, k1, k2, nuevos):
+        desplazamiento = self.desplazamiento
+        padre, inicioPadre, _ = camino[-1]
+        fragmentos = [fragmento for _, fragmento in nuevos]
+        viejo = padre.hijos[k1].valor if k2 == k1 + 1 else None
+        anterior = padre.valor
+        padre.valor = valorConHijos(padre, k1, k2, fragmentos[0].nombre if fragmentos else None, viejo,
+                                    [fragmento.valor for fragmento in fragmentos])
+        padre.hijos[k1:k2] = fragmentos
+        padre.inicios[k1:k2] = [posicion - inicioPadre for posicion, _ in nuevos]
+        k = k1 + len(nuevos)
+        padre.inicios[k:] = [posicion + desplazamiento for posicion in padre.inicios[k:]]
+        padre.longitud += desplazamiento
+        for i in range(len(camino) - 1, 0, -1):
+            fragmento, _, _ = camino[i - 1]
+            hijo, _, indice = camino[i]
+            anterior, fragmento.valor = fragmento.valor, valorConHijos(fragmento, indice, indice + 1, hijo.nombre,
+                                                                     anterior, [hijo.valor])
+            fragmento.inicios[indice + 1:] = [posicion + desplazamiento for posicion in fragmento.inicios[indice + 1:]]
+            fragmento.longitud += desplazamiento
+
+    # Posiciones en el texto actual de los caracteres ilegales: las del último
+    # análisis correcto fuera de la zona analizada de nuevo o dentro de los
+    # fragmentos reutilizados, y las encontradas al analizarla
+    def _ilegalesRegion(self):
+        inicio, fin = self._region
+        ilegales = [p for p in self.ilegales if p < inicio]
+        if self.ilegales:
+            for a, b in self._reutilizados:
+                ilegales.extend(self._nueva(p) for p in self.ilegales if a <= p < b)
+        ilegales.extend(self._nuevosIlegales)
+        ilegales.extend(p + self.desplazamiento for p in self.ilegales if p >= fin)
+        return sorted(ilegales)
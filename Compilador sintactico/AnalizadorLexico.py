@@ -1,5 +1,6 @@
 import ply.lex as lex  # Importamos la librería PLY para el análisis léxico
 import re  # Importamos el módulo de expresiones regulares para manejar patrones
+from sys import intern
 
 # Definición de palabras reservadas con su representación
 reservadas = {
@@ -13,9 +14,15 @@ reservadas = {
     'const': 'CONST',
     'var': 'VAR',
     'procedure': 'PROCEDURE',
+    'odd': 'ODD',
     # Se puede eliminar 'OUT', 'IN', 'ELSE' si no son utilizados
 }
 
+# Longitudes de las palabras reservadas. t_ID solo crea una copia en minúsculas
+# de un identificador (para reconocer 'Begin' o 'BEGIN') si tiene una de estas
+# longitudes y no está ya en minúsculas.
+longitudesReservadas = frozenset(map(len, reservadas))
+
 # Definición de tokens regulares. Aquí incluimos tokens como identificadores (ID),
 # operadores matemáticos, comparaciones, paréntesis y otros.
 tokens = [
@@ -25,7 +32,6 @@ tokens = [
     'MINUS',    # Resta (-)
     'TIMES',    # Multiplicación (*)
     'DIVIDE',   # División (/)
-    'ODD',      # Operador especial ODD
     'ASSIGN',   # Asignación (=)
     'NE',       # Desigualdad (<>)
     'LT',       # Menor que (<)
@@ -46,7 +52,6 @@ t_PLUS = r'\+'           # Suma
 t_MINUS = r'-'           # Resta
 t_TIMES = r'\*'          # Multiplicación
 t_DIVIDE = r'/'          # División
-t_ODD = r'ODD'           # Operador especial ODD
 t_ASSIGN = r'='          # Asignación
 t_NE = r'<>'             # Desigualdad
 t_LT = r'<'              # Menor que
@@ -59,15 +64,21 @@ t_COMMA = r','           # Coma
 t_SEMICOLON = r';'       # Punto y coma
 t_UPDATE = r':='         # Operador de actualización
 
-# Definimos qué ignorar: espacios en blanco y tabulaciones
-t_ignore = '\t '         
+# Definimos qué ignorar: espacios en blanco, tabulaciones y saltos de línea
+t_ignore = '\t \r\n'
 
 # Regla para reconocer identificadores (ID) y palabras reservadas
 # Un identificador debe comenzar con una letra o guion bajo y puede contener números
 def t_ID(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'  # Expresión regular para un ID
     # Verifica si el identificador es una palabra reservada, de lo contrario, es un ID
-    t.type = reservadas.get(t.value.lower(), 'ID')  
+    tipo = reservadas.get(t.value)
+    if tipo is None and len(t.value) in longitudesReservadas and not t.value.islower():
+        tipo = reservadas.get(t.value.lower())
+    t.type = tipo or 'ID'
+    # Todas las apariciones de un nombre comparten la misma cadena, y la tabla
+    # de símbolos (AnalizadorSemantico.py) la encuentra por identidad
+    t.value = intern(t.value)
     return t
 
 # Regla para reconocer números
@@ -76,9 +87,20 @@ def t_NUMBER(t):
     t.value = int(t.value)  # Convierte el valor a entero
     return t
 
-# Regla para manejar errores léxicos: cuando se encuentra un caracter ilegal
+# Mensajes de error léxico del último análisis
+errores = []
+
+# Mensaje de error de un caracter ilegal (también lo usa AnalisisIncremental.py)
+def mensajeCaracterIlegal(caracter, linea, columna):
+    return f"Caracter ilegal '{caracter}' en la línea {linea}, columna {columna}"
+
+# Regla para manejar errores léxicos: cuando se encuentra un caracter ilegal.
+# No hay regla para los saltos de línea: la línea y la columna se calculan
+# solo cuando hacen falta, con position().
 def t_error(t):
-    print(f"Caracter ilegal '{t.value[0]}'")  # Imprime el carácter no válido
+    linea, columna = t.lexer.position(t.lexpos)
+    mensaje = mensajeCaracterIlegal(t.value[0], linea, columna)
+    errores.append(mensaje)  # Quien llama al analizador decide si los muestra
     t.lexer.skip(1)  # Salta el carácter no válido y continúa con el análisis
 
 # Inicialización del analizador léxico
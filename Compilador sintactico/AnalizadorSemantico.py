@@ -0,0 +1,162 @@
+from ArbolSintactico import (Assign, Call, Begin, If, While,
+                             BinOp, UnaryOp, Odd, Num, Var)
+from CodigoP import CABECERA, ARGUMENTO_MINIMO, ARGUMENTO_MAXIMO
+
+# Análisis semántico de PL/0: tabla de símbolos y resolución de identificadores.
+#
+# Recorre el AST una vez, después del análisis sintáctico. Cada bloque abre un
+# ámbito, un diccionario nombre -> entrada con sus constantes, variables y
+# procedimientos. La entrada es una tupla:
+#   ('const', valor)
+#   ('var', nivel, desplazamiento)
+#   ('proc', nivel, número)
+# donde nivel es el nivel léxico del bloque que declara el nombre,
+# desplazamiento la posición de la variable en el registro de activación y
+# número el orden del procedimiento en un recorrido en preorden de los bloques
+# (el mismo en que GeneradorCodigo los genera).
+#
+# Además de los ámbitos, el diccionario visibles guarda la entrada visible de
+# cada nombre, así que buscar un nombre es una sola consulta y no hace falta
+# recorrer los ámbitos de dentro hacia fuera. Al entrar en un bloque sus
+# declaraciones tapan en visibles a las de fuera, que se restauran al salir.
+# Los nombres llegan internados desde el analizador léxico (ver t_ID).
+#
+# Cada uso de un identificador (Var, Assign y Call) se resuelve una sola vez:
+# su entrada queda en el campo ref del nodo y las fases siguientes la usan sin
+# volver a buscar el nombre. En la misma pasada se anotan los identificadores
+# no declarados, los declarados dos veces en un bloque y los usos que no
+# corresponden a lo declarado (asignar a una constante, llamar a una variable...).
+# También se comprueba que cada número (literal o valor de una constante) cabe
+# en el argumento de una instrucción del código P.
+
+
+class AnalizadorSemantico:
+    def __init__(self):
+        self.errores = []         # Mensajes de error
+        self.visibles = {}        # Nombre -> entrada visible en el punto actual
+        self.procedimientos = 0   # Procedimientos numerados hasta ahora
+
+        # Tabla de despacho por tipo de sentencia
+        self.sentencias = {
+            Assign: self.resolverAssign,
+            Call: self.resolverCall,
+            Begin: self.resolverBegin,
+            If: self.resolverIf,
+            While: self.resolverWhile,
+        }
+
+    # Resuelve todo el programa y devuelve la lista de errores
+    def resolver(self, ast):
+        self.resolverBlock(ast, 0)
+        return self.errores
+
+    # Busca la entrada visible de un nombre (None si no está declarado)
+    def buscar(self, nombre):
+        entrada = self.visibles.get(nombre)
+        if entrada is None:
+            self.errores.append(f'Error: identificador no declarado "{nombre}"')
+        return entrada
+
+    # Añade un nombre al ámbito del bloque. ocultos guarda la entrada que tapa
+    # (o None) para restaurarla al salir del bloque.
+    def declarar(self, ambito, ocultos, nombre, entrada):
+        if nombre in ambito:
+            self.errores.append(f'Error: identificador declarado dos veces "{nombre}"')
+            return
+        ambito[nombre] = entrada
+        ocultos[nombre] = self.visibles.get(nombre)
+        self.visibles[nombre] = entrada
+
+    # Anota un error si el número no cabe en una instrucción LIT
+    def comprobarNumero(self, valor):
+        if not ARGUMENTO_MINIMO <= valor <= ARGUMENTO_MAXIMO:
+            self.errores.append(f'Error: número fuera de rango {valor}')
+
+    def resolverBlock(self, bloque, nivel):
+        ambito = {}
+        ocultos = {}
+        for c in bloque.consts:
+            self.comprobarNumero(c.value)
+            self.declarar(ambito, ocultos, c.name, ('const', c.value))
+        for i, v in enumerate(bloque.vars):
+            self.declarar(ambito, ocultos, v.name, ('var', nivel, CABECERA + i))
+        for proc in bloque.procs:
+            # Se declara antes de su cuerpo para permitir la recursión. El número
+            # se consume aunque el nombre esté repetido, como en GeneradorCodigo.
+            self.declarar(ambito, ocultos, proc.name, ('proc', nivel, self.procedimientos))
+            self.procedimientos += 1
+            self.resolverBlock(proc.block, nivel + 1)
+
+        self.resolverSentencia(bloque.body)
+
+        visibles = self.visibles
+        for nombre, entrada in ocultos.items():
+            if entrada is None:
+                del visibles[nombre]
+            else:
+                visibles[nombre] = entrada
+
+    # Sentencias
+
+    def resolverSentencia(self, nodo):
+        if nodo is not None:
+            self.sentencias[type(nodo)](nodo)
+
+    def resolverAssign(self, nodo):
+        entrada = self.buscar(nodo.name)
+        if entrada is not None and entrada[0] != 'var':
+            self.errores.append(f'Error: no se puede asignar a "{nodo.name}"')
+            entrada = None
+        nodo.ref = entrada
+        self.resolverExpresion(nodo.expr)
+
+    def resolverCall(self, nodo):
+        entrada = self.buscar(nodo.name)
+        if entrada is not None and entrada[0] != 'proc':
+            self.errores.append(f'Error: "{nodo.name}" no es un procedimiento')
+            entrada = None
+        nodo.ref = entrada
+
+    def resolverBegin(self, nodo):
+        for sentencia in nodo.statements:
+            self.resolverSentencia(sentencia)
+
+    def resolverIf(self, nodo):
+        if nodo.cond is None:
+            # La recuperación de errores del parser descartó la condición
+            self.errores.append('Error: condición con errores de sintaxis')
+        else:
+            self.resolverExpresion(nodo.cond)
+        self.resolverSentencia(nodo.body)
+
+    resolverWhile = resolverIf
+
+    # Expresiones y condiciones. Se recorren con una pila en lugar de con
+    # recursión: una expresión larga como a + b + c + ... es un árbol tan
+    # profundo como términos tiene.
+    def resolverExpresion(self, nodo):
+        pendientes = [nodo]
+        while pendientes:
+            nodo = pendientes.pop()
+            tipo = type(nodo)
+            if tipo is Var:
+                entrada = self.buscar(nodo.name)
+                if entrada is not None and entrada[0] == 'proc':
+                    self.errores.append(f'Error: el procedimiento "{nodo.name}" no es un valor')
+                    entrada = None
+                nodo.ref = entrada
+            elif tipo is BinOp:
+                pendientes.append(nodo.right)
+                pendientes.append(nodo.left)   # El operando izquierdo se resuelve antes
+            elif tipo is UnaryOp:
+                pendientes.append(nodo.operand)
+            elif tipo is Odd:
+                pendientes.append(nodo.expr)
+            elif tipo is Num:
+                self.comprobarNumero(nodo.value)
+
+
+# Función de conveniencia: resuelve los identificadores del AST y devuelve la
+# lista de errores
+def resolver(ast):
+    return AnalizadorSemantico().resolver(ast)
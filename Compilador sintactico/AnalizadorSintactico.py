@@ -1,7 +1,18 @@
 import ply.yacc as yacc  # Importamos el módulo yacc de PLY para el análisis sintáctico
 import os
+import sys
+import mmap  # Para analizar archivos grandes sin copiarlos a memoria
 import codecs  # Para manejar archivos con codificación
-from AnalizadorLexico import tokens  # Importamos los tokens definidos en el analizador léxico
+import functools
+from AnalizadorLexico import tokens, analizador  # Importamos los tokens y el analizador léxico
+from AnalizadorLexico import errores as erroresLexicos
+from ArbolSintactico import (Block, ConstDecl, VarDecl, ProcDecl, Assign, Call, Begin,
+                             If, While, BinOp, UnaryOp, Odd, Num, Var)
+
+# Modo depuración: si está activo, cada reducción imprime el nombre de la regla.
+# Por defecto está apagado porque escribir en pantalla en cada reducción es lo
+# que más tiempo consume al analizar archivos grandes.
+DEBUG = False
 
 # Precedencia de operadores
 precedence = (
@@ -16,244 +27,402 @@ precedence = (
 )
 
 # Reglas de producción para el analizador sintáctico
+#
+# Las reglas marcadas con @yacc.passthrough solo copian p[1] en p[0] (y, en
+# modo depuración, imprimen su nombre). El parser las reduce él mismo sin
+# llamar a la función, lo que evita una llamada por cada término, factor u
+# operador de las expresiones. Con --debug se desactiva para ver la traza.
 
 # La regla principal que define un programa
+@yacc.passthrough
 def p_program(p):
     '''program : block'''
-    print("program")
+    p[0] = p[1]
+    if DEBUG:
+        print("program")
 
 # Regla para un bloque de código (constantes, variables, procedimientos y sentencias)
 def p_block(p):
     '''block : constDecl varDecl procDecl statement'''
-    print("block")
+    p[0] = Block(p[1], p[2], p[3], p[4])
+    if DEBUG:
+        print("block")
 
 # Reglas para la declaración de constantes
 
 # Definición de una lista de constantes
 def p_constDecl(p):
     '''constDecl : CONST constAssignmentList SEMICOLON'''
-    print("constDecl")
+    p[0] = p[2]
+    if DEBUG:
+        print("constDecl")
+
+# Recuperación de errores: si la lista de constantes tiene un error se
+# descarta hasta el punto y coma
+def p_constDeclError(p):
+    '''constDecl : CONST error SEMICOLON'''
+    p[0] = []
+    if DEBUG:
+        print("constDecl error")
 
 # Regla vacía para casos donde no haya declaración de constantes
 def p_constDeclEmpty(p):
     '''constDecl : empty'''
-    print("nulo")
+    p[0] = []
+    if DEBUG:
+        print("nulo")
 
 # Asignación de una constante
 def p_constAssignmentList1(p):
     '''constAssignmentList : ID ASSIGN NUMBER'''
-    print("constAssignmentList 1")
+    p[0] = [ConstDecl(p[1], p[3])]
+    if DEBUG:
+        print("constAssignmentList 1")
 
 # Asignación de múltiples constantes separadas por comas
 def p_constAssignmentList2(p):
     '''constAssignmentList : constAssignmentList COMMA ID ASSIGN NUMBER'''
-    print("constAssignmentList 2")
+    p[0] = p[1]
+    p[0].append(ConstDecl(p[3], p[5]))
+    if DEBUG:
+        print("constAssignmentList 2")
 
 # Declaración de variables
 
 # Lista de variables separadas por punto y coma
 def p_varDecl1(p):
     '''varDecl : VAR identList SEMICOLON'''
-    print("varDecl 1")
+    p[0] = p[2]
+    if DEBUG:
+        print("varDecl 1")
+
+# Recuperación de errores: si la lista de variables tiene un error se
+# descarta hasta el punto y coma
+def p_varDeclError(p):
+    '''varDecl : VAR error SEMICOLON'''
+    p[0] = []
+    if DEBUG:
+        print("varDecl error")
 
 # Regla vacía para casos donde no haya declaración de variables
 def p_varDeclEmpty(p):
     '''varDecl : empty'''
-    print("nulo")
+    p[0] = []
+    if DEBUG:
+        print("nulo")
 
 # Lista de identificadores de variables
 
 # Un solo identificador
 def p_identList1(p):
     '''identList : ID'''
-    print("identList 1")
+    p[0] = [VarDecl(p[1])]
+    if DEBUG:
+        print("identList 1")
 
 # Lista de identificadores separados por comas
 def p_identList2(p):
     '''identList : identList COMMA ID'''
-    print("identList 2")
+    p[0] = p[1]
+    p[0].append(VarDecl(p[3]))
+    if DEBUG:
+        print("identList 2")
 
 # Declaración de procedimientos
 
 # Definición de un procedimiento con su cuerpo (bloque de código)
 def p_procDecl1(p):
     '''procDecl : PROCEDURE ID SEMICOLON block SEMICOLON'''
-    print("procDecl 1")
+    p[0] = [ProcDecl(p[2], p[4])]
+    if DEBUG:
+        print("procDecl 1")
 
 # Regla vacía para casos donde no haya procedimientos
 def p_procDeclEmpty(p):
     '''procDecl : empty'''
-    print("nulo")
+    p[0] = []
+    if DEBUG:
+        print("nulo")
 
 # Sentencias
 
 # Asignación de una expresión a una variable
 def p_statement1(p):
     '''statement : ID UPDATE expression'''
-    print("statement 1")
+    p[0] = Assign(p[1], p[3])
+    if DEBUG:
+        print("statement 1")
 
 # Llamada a un procedimiento
 def p_statement2(p):
     '''statement : CALL ID'''
-    print("statement 2")
+    p[0] = Call(p[2])
+    if DEBUG:
+        print("statement 2")
 
 # Bloque de sentencias agrupadas por BEGIN y END
 def p_statement3(p):
     '''statement : BEGIN statementList END'''
-    print("statement 3")
+    p[0] = Begin(p[2])
+    if DEBUG:
+        print("statement 3")
 
 # Sentencia condicional IF-THEN
 def p_statement4(p):
     '''statement : IF condition THEN statement'''
-    print("statement 4")
+    p[0] = If(p[2], p[4])
+    if DEBUG:
+        print("statement 4")
 
 # Sentencia WHILE con condición y cuerpo
 def p_statement5(p):
     '''statement : WHILE condition DO statement'''
-    print("statement 5")
+    p[0] = While(p[2], p[4])
+    if DEBUG:
+        print("statement 5")
+
+# Una condición con errores se descarta hasta el THEN
+def p_statement4Error(p):
+    '''statement : IF error THEN statement'''
+    p[0] = If(None, p[4])
+    if DEBUG:
+        print("statement 4 error")
+
+# Una condición con errores se descarta hasta el DO
+def p_statement5Error(p):
+    '''statement : WHILE error DO statement'''
+    p[0] = While(None, p[4])
+    if DEBUG:
+        print("statement 5 error")
 
 # Regla vacía para sentencias opcionales
 def p_statementEmpty(p):
     '''statement : empty'''
-    print("nulo")
+    p[0] = None
+    if DEBUG:
+        print("nulo")
 
 # Lista de sentencias
 
 # Una única sentencia
 def p_statementList1(p):
     '''statementList : statement'''
-    print("statementList 1")
+    p[0] = [p[1]]
+    if DEBUG:
+        print("statementList 1")
 
 # Múltiples sentencias separadas por punto y coma
 def p_statementList2(p):
     '''statementList : statementList SEMICOLON statement'''
-    print("statementList 2")
+    p[0] = p[1]
+    p[0].append(p[3])
+    if DEBUG:
+        print("statementList 2")
+
+# Recuperación de errores en modo pánico. Ante un error, el parser desapila
+# hasta el comienzo de la sentencia de la lista en la que está, la sustituye
+# por el token especial error y descarta los tokens siguientes hasta un punto
+# y coma o un END. Así el análisis continúa y los errores de las sentencias
+# siguientes también se encuentran. La regla está en la lista y no en
+# statement porque tras una sentencia suelta (el cuerpo de un bloque) no
+# siempre puede venir un END: el parser reduciría la sentencia con el error,
+# volvería a fallar con el mismo token sin haber avanzado y repetiría la
+# recuperación indefinidamente.
+def p_statementListError1(p):
+    '''statementList : error'''
+    p[0] = [None]
+    if DEBUG:
+        print("statementList error 1")
+
+def p_statementListError2(p):
+    '''statementList : statementList SEMICOLON error'''
+    p[0] = p[1]
+    p[0].append(None)
+    if DEBUG:
+        print("statementList error 2")
 
 # Condiciones
 
 # Condición ODD (paridad impar)
 def p_condition1(p):
     '''condition : ODD expression'''
-    print("condition 1")
+    p[0] = Odd(p[2])
+    if DEBUG:
+        print("condition 1")
 
 # Condición de comparación entre dos expresiones
 def p_condition2(p):
     '''condition : expression relation expression'''
-    print("condition 2")
+    p[0] = BinOp(p[2], p[1], p[3])
+    if DEBUG:
+        print("condition 2")
 
 # Relaciones (comparaciones)
 
 # Relación de asignación
+@yacc.passthrough
 def p_relation1(p):
     '''relation : ASSIGN'''
-    print("relation 1")
+    p[0] = p[1]
+    if DEBUG:
+        print("relation 1")
 
 # Relación de desigualdad (<>)
+@yacc.passthrough
 def p_relation2(p):
     '''relation : NE'''
-    print("relation 2")
+    p[0] = p[1]
+    if DEBUG:
+        print("relation 2")
 
 # Relación menor que (<)
+@yacc.passthrough
 def p_relation3(p):
     '''relation : LT'''
-    print("relation 3")
+    p[0] = p[1]
+    if DEBUG:
+        print("relation 3")
 
 # Relación mayor que (>)
+@yacc.passthrough
 def p_relation4(p):
     '''relation : GT'''
-    print("relation 4")
+    p[0] = p[1]
+    if DEBUG:
+        print("relation 4")
 
 # Relación menor o igual que (<=)
+@yacc.passthrough
 def p_relation5(p):
     '''relation : LTE'''
-    print("relation 5")
+    p[0] = p[1]
+    if DEBUG:
+        print("relation 5")
 
 # Relación mayor o igual que (>=)
+@yacc.passthrough
 def p_relation6(p):
     '''relation : GTE'''
-    print("relation 6")
+    p[0] = p[1]
+    if DEBUG:
+        print("relation 6")
 
 # Expresiones
 
 # Una expresión simple
+@yacc.passthrough
 def p_expression1(p):
     '''expression : term'''
-    print("expression 1")
+    p[0] = p[1]
+    if DEBUG:
+        print("expression 1")
 
 # Expresión con un operador unario (suma o resta)
 def p_expression2(p):
     '''expression : addingOperator term'''
-    print("expression 2")
+    p[0] = UnaryOp(p[1], p[2])
+    if DEBUG:
+        print("expression 2")
 
 # Expresión con un operador binario (suma o resta entre expresiones)
 def p_expression3(p):
     '''expression : expression addingOperator term'''
-    print("expression 3")
+    p[0] = BinOp(p[2], p[1], p[3])
+    if DEBUG:
+        print("expression 3")
 
 # Operadores de suma/resta
 
 # Operador suma
+@yacc.passthrough
 def p_addingOperator1(p):
     '''addingOperator : PLUS'''
-    print("addingOperator 1")
+    p[0] = p[1]
+    if DEBUG:
+        print("addingOperator 1")
 
 # Operador resta
+@yacc.passthrough
 def p_addingOperator2(p):
     '''addingOperator : MINUS'''
-    print("addingOperator 2")
+    p[0] = p[1]
+    if DEBUG:
+        print("addingOperator 2")
 
 # Términos
 
 # Un término simple
+@yacc.passthrough
 def p_term1(p):
     '''term : factor'''
-    print("term 1")
+    p[0] = p[1]
+    if DEBUG:
+        print("term 1")
 
 # Un término multiplicado o dividido por otro factor
 def p_term2(p):
     '''term : term multiplyingOperator factor'''
-    print("term 2")
+    p[0] = BinOp(p[2], p[1], p[3])
+    if DEBUG:
+        print("term 2")
 
 # Operadores de multiplicación/división
 
 # Operador multiplicación
+@yacc.passthrough
 def p_multiplyingOperator1(p):
     '''multiplyingOperator : TIMES'''
-    print("multiplyingOperator 1")
+    p[0] = p[1]
+    if DEBUG:
+        print("multiplyingOperator 1")
 
 # Operador división
+@yacc.passthrough
 def p_multiplyingOperator2(p):
     '''multiplyingOperator : DIVIDE'''
-    print("multiplyingOperator 2")
+    p[0] = p[1]
+    if DEBUG:
+        print("multiplyingOperator 2")
 
 # Factores
 
 # Un factor puede ser una variable (ID)
 def p_factor1(p):
     '''factor : ID'''
-    print("factor 1")
+    p[0] = Var(p[1])
+    if DEBUG:
+        print("factor 1")
 
 # O puede ser un número
 def p_factor2(p):
     '''factor : NUMBER'''
-    print("factor 2")
+    p[0] = Num(p[1])
+    if DEBUG:
+        print("factor 2")
 
 # O una expresión agrupada en paréntesis
 def p_factor3(p):
     '''factor : LPARENT expression RPARENT'''
-    print("factor 3")
+    p[0] = p[2]
+    if DEBUG:
+        print("factor 3")
 
 # Producción vacía
 def p_empty(p):
     '''empty :'''
     pass
 
+# Mensajes de error sintáctico del último análisis
+errores = []
+
 # Manejo de errores de sintaxis
 def p_error(p):
     if p:
-        print(f"Error de sintaxis en '{p.value}' en la línea {p.lineno}")
+        linea, columna = analizador.position(p.lexpos)
+        mensaje = f"Error de sintaxis en '{p.value}' en la línea {linea}, columna {columna}"
     else:
-        print("Error de sintaxis en EOF")
+        mensaje = "Error de sintaxis en EOF"
+    errores.append(mensaje)  # Quien llama al parser decide si los muestra
 
 # Función para buscar archivos de prueba en el directorio
 def buscarFicheros(directorio):
@@ -279,15 +448,128 @@ def buscarFicheros(directorio):
         except (ValueError, IndexError):
             print("Por favor, selecciona un número válido.")
 
-# Selección y apertura del archivo de prueba
-directorio = 'C://Users//_//Desktop//Compilador sintactico//test//'
-archivo = buscarFicheros(directorio)  # Selecciona un archivo del directorio
-test = directorio + archivo
-with codecs.open(test, "r", "utf-8") as fp:  # Abrimos el archivo seleccionado en modo lectura
-    cadena = fp.read()
+# Inicialización del parser. ParserGenerado.py es un módulo generado con
+# ply/ygen.py a partir de esta gramática: lleva las tablas LALR como
+# constantes y un bucle de análisis especializado para ellas, de modo que no
+# hace falta ejecutar yacc.yacc() (que inspecciona este módulo y carga las
+# tablas). Si la gramática ha cambiado, ParserGenerado.check() lo detecta y
+# el parser se construye con yacc en memoria, sin escribir ningún archivo:
+# importar este módulo nunca modifica el directorio. ParserGenerado.py, las
+# tablas binarias parsetab.lrb y parser.out se vuelven a generar a propósito,
+# con python AnalizadorSintactico.py --regenerar (ver regenerar()).
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+TABLAS = os.path.join(DIRECTORIO, 'parsetab.lrb')
+try:
+    import ParserGenerado
+except ImportError:
+    ParserGenerado = None
+if ParserGenerado is not None and ParserGenerado.check(globals()):
+    parser = ParserGenerado.Parser(globals())
+else:
+    print("ParserGenerado.py no corresponde a la gramática; "
+          "ejecute python AnalizadorSintactico.py --regenerar", file=sys.stderr)
+    parser = yacc.yacc(dense=True, write_tables=False, debug=False)
+
+# Vuelve a generar parsetab.lrb, parser.out y ParserGenerado.py a partir de
+# la gramática de este módulo
+def regenerar():
+    from ply import ygen
+    modulo = sys.modules[__name__]
+    nuevo = yacc.yacc(module=modulo, binaryfile=TABLAS, dense=True, outputdir=DIRECTORIO)
+    ygen.write_parser(nuevo, vars(modulo), os.path.join(DIRECTORIO, 'ParserGenerado.py'))
+
+# Con dense=True el parser numera los símbolos de la gramática y consulta la
+# tabla de acciones como una lista plana, por índice. El analizador léxico
+# marca cada token con el número de su tipo para que el parser no tenga que
+# buscarlo por nombre.
+analizador.settypeids(parser.termids)
+
+# Prepara un nuevo análisis: vacía las listas de errores
+def reiniciar():
+    del errores[:]
+    del erroresLexicos[:]
+    analizador.lineno = 1  # El analizador léxico es compartido; reiniciamos la línea
+
+# Analiza una cadena con código PL/0 y devuelve el AST (o None si no se pudo
+# recuperar de algún error).
+# Los mensajes de error quedan en errores y erroresLexicos.
+def analizar(cadena):
+    reiniciar()
+    # Se obtienen todos los tokens de una vez con tokenize_all(), que es más
+    # rápido que pedírselos uno a uno al analizador léxico durante el análisis
+    analizador.input(cadena)
+    tokens = analizador.tokenize_all()
+    return parser.parse(lexer=analizador, tokenfunc=functools.partial(next, iter(tokens), None))
+
+# Analiza una cadena y devuelve (ast, errores), donde errores es la lista de
+# todos los mensajes de error, léxicos y sintácticos. Con las reglas de
+# recuperación una sola pasada encuentra todos los errores sintácticos; el
+# AST de un programa con errores tiene None en las partes descartadas.
+def analizarConErrores(cadena):
+    ast = analizar(cadena)
+    return ast, erroresLexicos + errores
+
+# Analiza un archivo proyectándolo en memoria con mmap. El analizador léxico
+# recorre directamente los bytes del archivo y solo decodifica el texto de cada
+# token, sin crear una copia str de todo el programa. Los tokens se piden uno
+# a uno, así que tampoco se guarda la lista completa.
+def analizarArchivo(ruta):
+    with open(ruta, 'rb') as fp:
+        try:
+            datos = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return analizar(b'')  # Un archivo vacío no se puede proyectar
+        try:
+            reiniciar()
+            return parser.parse(datos, lexer=analizador)
+        finally:
+            analizador.input('')  # Suelta la referencia antes de cerrar la proyección
+            datos.close()
+
+# Convierte una cadena en un TokenBuffer: los tokens quedan guardados en
+# columnas array('I') (tipo, inicio, fin y línea) en lugar de un objeto por
+# token, y su texto se extrae de la cadena solo cuando se pide.
+def tokenizar(cadena):
+    del erroresLexicos[:]
+    analizador.lineno = 1
+    analizador.input(cadena)
+    return analizador.tokenbuffer()
+
+# Analiza los tokens de un TokenBuffer y devuelve el AST (o None si hubo errores)
+def analizarTokens(buffer):
+    del errores[:]
+    buffer.rewind()
+    return parser.parse(lexer=buffer)
+
+if __name__ == '__main__':
+    if '--regenerar' in sys.argv:
+        regenerar()
+        sys.exit(0)
+
+    DEBUG = '--debug' in sys.argv  # Con --debug se imprime la traza de reducciones
+    if DEBUG:
+        parser.disable_passthrough_rules()  # Para que esas reglas también impriman su nombre
+
+    # Si se pasa un archivo por la línea de órdenes no se pregunta nada
+    argumentos = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if argumentos:
+        test = argumentos[0]
+    else:
+        # Selección y apertura del archivo de prueba
+        directorio = 'C://Users//_//Desktop//Compilador sintactico//test//'
+        archivo = buscarFicheros(directorio)  # Selecciona un archivo del directorio
+        test = directorio + archivo
+    if '--mmap' in sys.argv:
+        result = analizarArchivo(test)  # Se analiza el archivo proyectado en memoria
+    else:
+        with codecs.open(test, "r", "utf-8") as fp:  # Abrimos el archivo seleccionado en modo lectura
+            cadena = fp.read()
 
-# Inicialización del parser
-parser = yacc.yacc()
-result = parser.parse(cadena)  # Se analiza la cadena del archivo
+        if '--columnar' in sys.argv:
+            result = analizarTokens(tokenizar(cadena))  # Tokens en formato columnar
+        else:
+            result = analizar(cadena)  # Se analiza la cadena del archivo
 
-print(result)  # Imprimir
+    for mensaje in erroresLexicos + errores:
+        print(mensaje)
+    print(result)  # Imprimir el árbol sintáctico
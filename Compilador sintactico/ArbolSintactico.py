@@ -0,0 +1,147 @@
+# Nodos del árbol sintáctico abstracto (AST) de PL/0.
+#
+# Cada nodo declara __slots__ para que no lleve un __dict__ por instancia:
+# un programa grande genera decenas de miles de nodos y así ocupan mucha
+# menos memoria y se crean más rápido.
+#
+# Los nodos que usan un identificador (Assign, Call y Var) tienen además el
+# campo ref, con la entrada de la tabla de símbolos a la que se refiere el
+# nombre. El parser lo deja a None y lo rellena AnalizadorSemantico.
+
+
+class Nodo:
+    """Clase base de todos los nodos del AST."""
+    __slots__ = ()
+
+    def __repr__(self):
+        campos = ', '.join(f'{nombre}={getattr(self, nombre)!r}' for nombre in self.__slots__)
+        return f'{type(self).__name__}({campos})'
+
+    def __eq__(self, otro):
+        if type(self) is not type(otro):
+            return NotImplemented
+        return all(getattr(self, nombre) == getattr(otro, nombre) for nombre in self.__slots__)
+
+    __hash__ = None
+
+
+# Declaraciones
+
+class Block(Nodo):
+    """Bloque: constantes, variables, procedimientos y la sentencia principal."""
+    __slots__ = ('consts', 'vars', 'procs', 'body')
+
+    def __init__(self, consts, vars, procs, body):
+        self.consts = consts    # Lista de ConstDecl
+        self.vars = vars        # Lista de VarDecl
+        self.procs = procs      # Lista de ProcDecl
+        self.body = body        # Sentencia (o None si está vacía)
+
+
+class ConstDecl(Nodo):
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+
+class VarDecl(Nodo):
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class ProcDecl(Nodo):
+    __slots__ = ('name', 'block')
+
+    def __init__(self, name, block):
+        self.name = name
+        self.block = block
+
+
+# Sentencias
+
+class Assign(Nodo):
+    __slots__ = ('name', 'expr', 'ref')
+
+    def __init__(self, name, expr):
+        self.name = name
+        self.expr = expr
+        self.ref = None
+
+
+class Call(Nodo):
+    __slots__ = ('name', 'ref')
+
+    def __init__(self, name):
+        self.name = name
+        self.ref = None
+
+
+class Begin(Nodo):
+    """Sentencias agrupadas entre BEGIN y END."""
+    __slots__ = ('statements',)
+
+    def __init__(self, statements):
+        self.statements = statements
+
+
+class If(Nodo):
+    __slots__ = ('cond', 'body')
+
+    def __init__(self, cond, body):
+        self.cond = cond
+        self.body = body
+
+
+class While(Nodo):
+    __slots__ = ('cond', 'body')
+
+    def __init__(self, cond, body):
+        self.cond = cond
+        self.body = body
+
+
+# Expresiones y condiciones
+
+class BinOp(Nodo):
+    """Operación binaria: aritmética (+ - * /) o relacional (= <> < > <= >=)."""
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+
+class UnaryOp(Nodo):
+    """Signo delante del primer término de una expresión (+x, -x)."""
+    __slots__ = ('op', 'operand')
+
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+
+
+class Odd(Nodo):
+    __slots__ = ('expr',)
+
+    def __init__(self, expr):
+        self.expr = expr
+
+
+class Num(Nodo):
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Var(Nodo):
+    __slots__ = ('name', 'ref')
+
+    def __init__(self, name):
+        self.name = name
+        self.ref = None
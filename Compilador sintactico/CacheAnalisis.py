@@ -0,0 +1,143 @@
+# Caché persistente de análisis sintácticos.
+#
+# Guarda en disco el AST (o la lista de errores) de cada programa, con una
+# clave que combina el hash del contenido del archivo y la firma de la
+# gramática. Si ni el programa ni la gramática cambian, no hace falta volver
+# a analizarlo.
+#
+# La caché es una base de datos SQLite en modo WAL, así que varios procesos
+# pueden leer y escribir a la vez. Cuando supera el tamaño máximo se expulsan
+# las entradas usadas hace más tiempo (LRU).
+
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+
+import ply.yacc as yacc
+import AnalizadorSintactico
+from ArbolSintactico import Nodo
+
+TAMANO_MAXIMO = 256 * 1024 * 1024  # Bytes de AST serializado que se conservan
+ESPERA = 30.0                      # Segundos que se espera si otro proceso tiene bloqueada la base
+
+_ESQUEMA = '''
+CREATE TABLE IF NOT EXISTS analisis (
+    clave    TEXT PRIMARY KEY,
+    ast      BLOB,
+    errores  TEXT NOT NULL,
+    correcto INTEGER NOT NULL,
+    tamano   INTEGER NOT NULL,
+    acceso   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS analisis_acceso ON analisis (acceso);
+CREATE TABLE IF NOT EXISTS total (
+    id    INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO total VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS analisis_alta AFTER INSERT ON analisis
+    BEGIN UPDATE total SET bytes = bytes + new.tamano; END;
+CREATE TRIGGER IF NOT EXISTS analisis_baja AFTER DELETE ON analisis
+    BEGIN UPDATE total SET bytes = bytes - old.tamano; END;
+'''
+
+
+# Firma de la gramática: la de PLY (reglas, tokens y precedencia) más el
+# código de las acciones y los campos de los nodos, que es lo que decide la
+# forma del AST guardado.
+def firmaGramatica(modulo=AnalizadorSintactico):
+    pinfo = yacc.ParserReflect(vars(modulo), log=yacc.NullLogger())
+    pinfo.get_all()
+    firma = hashlib.sha256(pinfo.signature().encode('latin-1'))
+    for linea, mod, nombre, doc in pinfo.pfuncs:
+        codigo = vars(modulo)[nombre].__code__
+        firma.update(nombre.encode('latin-1'))
+        firma.update(codigo.co_code)
+        firma.update(repr(codigo.co_consts).encode('utf-8'))
+    for clase in sorted(Nodo.__subclasses__(), key=lambda c: c.__name__):
+        firma.update(f'{clase.__name__}{clase.__slots__}'.encode('utf-8'))
+    return firma.hexdigest()
+
+
+class CacheAnalisis:
+    def __init__(self, ruta, tamanoMaximo=TAMANO_MAXIMO):
+        self.ruta = ruta
+        self.tamanoMaximo = tamanoMaximo
+        self.firma = firmaGramatica()
+        # isolation_level=None: las transacciones se abren a mano con BEGIN IMMEDIATE
+        self.conexion = sqlite3.connect(ruta, timeout=ESPERA, isolation_level=None)
+        self.conexion.execute('PRAGMA journal_mode=WAL')
+        self.conexion.execute('PRAGMA synchronous=NORMAL')
+        self.conexion.executescript('BEGIN IMMEDIATE;' + _ESQUEMA + 'COMMIT;')
+
+    def cerrar(self):
+        self.conexion.close()
+
+    # Clave de un programa: hash de la firma de la gramática y del contenido.
+    # El contenido puede ser str o bytes en UTF-8 (por ejemplo, un mmap).
+    def clave(self, cadena):
+        h = hashlib.sha256(self.firma.encode('ascii'))
+        h.update(cadena.encode('utf-8') if isinstance(cadena, str) else cadena)
+        return h.hexdigest()
+
+    # Devuelve (ast, errores, correcto) o None si no está en la caché.
+    # Con conAst=False no se deserializa el AST (ast será None).
+    def obtener(self, cadena, conAst=True):
+        clave = self.clave(cadena)
+        columnas = 'ast, errores, correcto' if conAst else 'NULL, errores, correcto'
+        fila = self.conexion.execute(f'SELECT {columnas} FROM analisis WHERE clave = ?', (clave,)).fetchone()
+        if fila is None:
+            return None
+        try:
+            ast = pickle.loads(fila[0]) if conAst and fila[0] is not None else None
+        except Exception:
+            return None  # Entrada ilegible (p. ej. clases del AST cambiadas): se trata como fallo
+        self.conexion.execute('UPDATE analisis SET acceso = ? WHERE clave = ?', (time.time(), clave))
+        return ast, json.loads(fila[1]), bool(fila[2])
+
+    # Guarda el resultado de analizar un programa
+    def guardar(self, cadena, ast, errores):
+        try:
+            datos = pickle.dumps(ast, pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            return  # AST demasiado profundo para serializarlo; simplemente no se guarda
+        correcto = ast is not None and not errores
+        clave = self.clave(cadena)
+        c = self.conexion
+        c.execute('BEGIN IMMEDIATE')
+        try:
+            c.execute('DELETE FROM analisis WHERE clave = ?', (clave,))
+            c.execute('INSERT INTO analisis VALUES (?, ?, ?, ?, ?, ?)',
+                      (clave, datos, json.dumps(errores), int(correcto), len(datos), time.time()))
+            self.expulsar()
+            c.execute('COMMIT')
+        except BaseException:
+            c.execute('ROLLBACK')
+            raise
+
+    # Borra las entradas menos usadas hasta quedar por debajo del tamaño máximo.
+    # Se llama dentro de la transacción de guardar().
+    def expulsar(self):
+        total = self.conexion.execute('SELECT bytes FROM total').fetchone()[0]
+        if total <= self.tamanoMaximo:
+            return
+        objetivo = total - self.tamanoMaximo * 9 // 10  # Se deja algo de margen
+        borrar = []
+        liberado = 0
+        for clave, tamano in self.conexion.execute('SELECT clave, tamano FROM analisis ORDER BY acceso'):
+            borrar.append((clave,))
+            liberado += tamano
+            if liberado >= objetivo:
+                break
+        self.conexion.executemany('DELETE FROM analisis WHERE clave = ?', borrar)
+
+    # Analiza usando la caché. Devuelve (ast, errores, acierto)
+    def analizar(self, cadena):
+        guardado = self.obtener(cadena)
+        if guardado is not None:
+            return guardado[0], guardado[1], True
+        ast, errores = AnalizadorSintactico.analizarConErrores(cadena)
+        self.guardar(cadena, ast, errores)
+        return ast, errores, False
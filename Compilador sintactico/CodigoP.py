@@ -0,0 +1,77 @@
+from array import array  # Vectores compactos de enteros para guardar las instrucciones
+
+# Representación del código P de Wirth que genera el compilador y ejecuta la
+# máquina virtual. Cada instrucción tiene tres campos: (f, l, a)
+#   f - código de operación
+#   l - diferencia de nivel léxico (solo para LOD, STO y CAL)
+#   a - argumento: literal, desplazamiento, dirección u operación de OPR
+
+# Códigos de operación
+LIT = 0   # Apila la constante a
+OPR = 1   # Operación aritmética o relacional a (ver abajo)
+LOD = 2   # Apila la variable de nivel l y desplazamiento a
+STO = 3   # Desapila y guarda en la variable de nivel l y desplazamiento a
+CAL = 4   # Llama al procedimiento de la dirección a
+INT = 5   # Reserva a posiciones en la pila
+JMP = 6   # Salta a la dirección a
+JPC = 7   # Desapila y salta a la dirección a si el valor es 0 (falso)
+
+MNEMONICOS = ('LIT', 'OPR', 'LOD', 'STO', 'CAL', 'INT', 'JMP', 'JPC')
+
+# Operaciones de OPR (numeración de Wirth)
+RET = 0   # Retorno de procedimiento
+NEG = 1   # Cambio de signo
+ADD = 2   # Suma
+SUB = 3   # Resta
+MUL = 4   # Multiplicación
+DIV = 5   # División entera
+ODD = 6   # Paridad impar
+EQ = 8    # =
+NE = 9    # <>
+LT = 10   # <
+GE = 11   # >=
+GT = 12   # >
+LE = 13   # <=
+
+# Operadores del AST y su operación OPR equivalente
+OPERACIONES = {
+    '+': ADD, '-': SUB, '*': MUL, '/': DIV,
+    '=': EQ, '<>': NE, '<': LT, '>=': GE, '>': GT, '<=': LE,
+}
+
+# Tamaño de la cabecera de cada registro de activación:
+# enlace estático, enlace dinámico y dirección de retorno
+CABECERA = 3
+
+# Rango de valores que cabe en el argumento de una instrucción (array('i'))
+ARGUMENTO_MAXIMO = 2 ** (8 * array('i').itemsize - 1) - 1
+ARGUMENTO_MINIMO = -ARGUMENTO_MAXIMO - 1
+
+
+class Programa:
+    """Programa en código P guardado en tres vectores paralelos array('i')."""
+
+    def __init__(self):
+        self.f = array('i')   # Códigos de operación
+        self.l = array('i')   # Niveles
+        self.a = array('i')   # Argumentos
+        self.globales = []    # Nombres de las variables del programa principal
+
+    def __len__(self):
+        return len(self.f)
+
+    # Añade una instrucción y devuelve su dirección
+    def emitir(self, f, l, a):
+        self.f.append(f)
+        self.l.append(l)
+        self.a.append(a)
+        return len(self.f) - 1
+
+    # Cambia el argumento de una instrucción ya emitida (saltos hacia delante)
+    def parchear(self, direccion, a):
+        self.a[direccion] = a
+
+    # Devuelve el listado legible del programa
+    def listado(self):
+        return '\n'.join(f'{i:5d} {MNEMONICOS[f]} {l} {a}'
+                         for i, (f, l, a) in enumerate(zip(self.f, self.l, self.a)))
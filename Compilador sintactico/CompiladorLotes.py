@@ -0,0 +1,151 @@
+# Compilación por lotes de programas PL/0.
+#
+# Analiza (léxico y sintáctico) todos los archivos .pl0 indicados por rutas,
+# directorios o patrones glob, repartiendo el trabajo entre varios procesos.
+# Cada resultado se escribe como una línea JSON (JSONL).
+#
+# Uso: python CompiladorLotes.py RUTA [RUTA ...] [-o resultados.jsonl] [-j PROCESOS]
+#                                [--cache analisis.db] [--mmap]
+
+import os
+import sys
+import glob
+import json
+import time
+import mmap
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Importar el analizador sintáctico construye el analizador léxico y el parser.
+# Cada proceso trabajador lo hace una sola vez al importar este módulo (o lo
+# hereda ya construido del proceso padre).
+import AnalizadorSintactico
+from CacheAnalisis import CacheAnalisis
+
+EXTENSION = '.pl0'
+
+cache = None       # Caché de análisis del proceso trabajador (si se pidió)
+proyectar = False  # Leer los archivos con mmap en lugar de decodificarlos enteros
+
+
+# Convierte la lista de rutas, directorios y patrones en una lista de archivos
+def expandirRutas(rutas):
+    archivos = []
+    vistos = set()
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            encontrados = []
+            for base, dirs, files in os.walk(ruta):
+                dirs.sort()
+                encontrados.extend(os.path.join(base, f) for f in sorted(files) if f.endswith(EXTENSION))
+        elif glob.has_magic(ruta):
+            encontrados = sorted(glob.glob(ruta, recursive=True))
+        else:
+            encontrados = [ruta]
+        for archivo in encontrados:
+            if archivo not in vistos:
+                vistos.add(archivo)
+                archivos.append(archivo)
+    return archivos
+
+
+# Se ejecuta una vez al arrancar cada proceso trabajador
+def inicializarTrabajador(rutaCache=None, usarMmap=False):
+    global cache, proyectar
+    proyectar = usarMmap
+    # Cada proceso abre su propia conexión a la caché
+    if rutaCache:
+        cache = CacheAnalisis(rutaCache)
+
+
+# Resultado de un archivo que no se pudo leer
+def errorLectura(ruta, error, inicio):
+    return {'archivo': ruta, 'correcto': False, 'errores': [f'No se pudo leer el archivo: {error}'],
+            'segundos': time.perf_counter() - inicio}
+
+
+# Analiza un archivo y devuelve su resultado como diccionario
+def procesarArchivo(ruta):
+    inicio = time.perf_counter()
+    if not proyectar:
+        try:
+            # Como codecs.open, sin traducir los saltos de línea; pero a diferencia
+            # de él, un carácter cortado al final del archivo también es un error
+            with open(ruta, encoding="utf-8", newline="") as fp:
+                cadena = fp.read()
+        except (OSError, UnicodeDecodeError) as e:
+            return errorLectura(ruta, e, inicio)
+        return analizarContenido(ruta, cadena, inicio)
+
+    # Con mmap el contenido se analiza directamente sobre los bytes del archivo
+    try:
+        with open(ruta, 'rb') as fp:
+            try:
+                datos = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                datos = b''  # Un archivo vacío no se puede proyectar
+    except OSError as e:
+        return errorLectura(ruta, e, inicio)
+    try:
+        return analizarContenido(ruta, datos, inicio)
+    except UnicodeDecodeError as e:
+        return errorLectura(ruta, e, inicio)
+    finally:
+        AnalizadorSintactico.analizador.input('')  # Suelta la referencia antes de cerrar
+        if isinstance(datos, mmap.mmap):
+            datos.close()
+
+
+# Analiza el contenido (str o bytes) de un archivo, usando la caché si la hay
+def analizarContenido(ruta, cadena, inicio):
+    # Con caché no hace falta deserializar el AST: basta con los errores
+    guardado = cache.obtener(cadena, conAst=False) if cache is not None else None
+    if guardado is not None:
+        ast, errores, correcto = guardado
+    else:
+        ast, errores = AnalizadorSintactico.analizarConErrores(cadena)
+        correcto = ast is not None and not errores
+        if cache is not None:
+            cache.guardar(cadena, ast, errores)
+    return {
+        'archivo': ruta,
+        'correcto': correcto,
+        'errores': errores,
+        'cache': guardado is not None,
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+def main(argv=None):
+    argumentos = argparse.ArgumentParser(description='Analiza por lotes programas PL/0')
+    argumentos.add_argument('rutas', nargs='+', help='Archivos, directorios o patrones glob')
+    argumentos.add_argument('-o', '--salida', help='Archivo JSONL de resultados (por defecto, la salida estándar)')
+    argumentos.add_argument('-j', '--procesos', type=int, default=None, help='Número de procesos trabajadores')
+    argumentos.add_argument('--bloque', type=int, default=32, help='Archivos que se envían juntos a cada trabajador')
+    argumentos.add_argument('--cache', help='Base de datos de la caché de análisis (se crea si no existe)')
+    argumentos.add_argument('--mmap', action='store_true', help='Proyectar los archivos en memoria en lugar de leerlos')
+    opciones = argumentos.parse_args(argv)
+
+    archivos = expandirRutas(opciones.rutas)
+    salida = open(opciones.salida, 'w', encoding='utf-8') if opciones.salida else sys.stdout
+
+    fallidos = 0
+    inicio = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=opciones.procesos, initializer=inicializarTrabajador,
+                                 initargs=(opciones.cache, opciones.mmap)) as ejecutor:
+            for resultado in ejecutor.map(procesarArchivo, archivos, chunksize=opciones.bloque):
+                if not resultado['correcto']:
+                    fallidos += 1
+                salida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f'{len(archivos)} archivos, {fallidos} con errores, {time.perf_counter() - inicio:.2f} s',
+          file=sys.stderr)
+    return 1 if fallidos else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
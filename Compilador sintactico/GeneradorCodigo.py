@@ -0,0 +1,142 @@
+from ArbolSintactico import (Assign, Call, Begin, If, While,
+                             BinOp, UnaryOp, Odd, Num, Var)
+from CodigoP import (Programa, LIT, OPR, LOD, STO, CAL, INT, JMP, JPC,
+                     RET, NEG, ODD, OPERACIONES, CABECERA)
+from AnalizadorSemantico import resolver
+import Optimizador
+
+# Generador de código P a partir del AST de PL/0.
+#
+# El AST tiene que estar resuelto por AnalizadorSemantico (la función
+# generar() de este módulo lo hace): cada uso de un identificador lleva en ref
+# su entrada de la tabla de símbolos, así que aquí no se busca ningún nombre.
+# Los procedimientos se numeran en el mismo orden que en AnalizadorSemantico
+# y direcciones guarda la dirección de cada uno.
+
+
+class GeneradorCodigo:
+    def __init__(self):
+        self.programa = Programa()
+        self.direcciones = []  # Dirección de cada procedimiento, por número
+
+        # Tabla de despacho por tipo de nodo (evita cadenas de isinstance)
+        self.sentencias = {
+            Assign: self.genAssign,
+            Call: self.genCall,
+            Begin: self.genBegin,
+            If: self.genIf,
+            While: self.genWhile,
+        }
+        self.expresiones = {
+            BinOp: self.genBinOp,
+            UnaryOp: self.genUnaryOp,
+            Odd: self.genOdd,
+            Num: self.genNum,
+            Var: self.genVar,
+        }
+
+    # Genera el programa completo a partir del bloque principal
+    def generar(self, ast):
+        self.genBlock(ast, 0)
+        self.programa.globales = [v.name for v in ast.vars]
+        return self.programa
+
+    def genBlock(self, bloque, nivel, numero=None):
+        emitir = self.programa.emitir
+
+        # Si hay procedimientos, sus cuerpos van antes y hay que saltarlos
+        salto = emitir(JMP, 0, 0) if bloque.procs else None
+        for proc in bloque.procs:
+            # La dirección provisional (el salto del bloque) permite la recursión
+            self.direcciones.append(len(self.programa))
+            self.genBlock(proc.block, nivel + 1, len(self.direcciones) - 1)
+
+        inicio = len(self.programa)
+        if salto is not None:
+            self.programa.parchear(salto, inicio)
+        if numero is not None:
+            # Las llamadas posteriores entran directamente en el cuerpo
+            self.direcciones[numero] = inicio
+
+        emitir(INT, 0, CABECERA + len(bloque.vars))
+        if bloque.body is not None:
+            self.genSentencia(bloque.body, nivel)
+        emitir(OPR, 0, RET)
+
+    # Sentencias
+
+    def genSentencia(self, nodo, nivel):
+        if nodo is not None:
+            self.sentencias[type(nodo)](nodo, nivel)
+
+    def genAssign(self, nodo, nivel):
+        entrada = nodo.ref
+        self.genExpresion(nodo.expr, nivel)
+        self.programa.emitir(STO, nivel - entrada[1], entrada[2])
+
+    def genCall(self, nodo, nivel):
+        entrada = nodo.ref
+        self.programa.emitir(CAL, nivel - entrada[1], self.direcciones[entrada[2]])
+
+    def genBegin(self, nodo, nivel):
+        for sentencia in nodo.statements:
+            self.genSentencia(sentencia, nivel)
+
+    def genIf(self, nodo, nivel):
+        self.genExpresion(nodo.cond, nivel)
+        salto = self.programa.emitir(JPC, 0, 0)
+        self.genSentencia(nodo.body, nivel)
+        self.programa.parchear(salto, len(self.programa))
+
+    def genWhile(self, nodo, nivel):
+        inicio = len(self.programa)
+        self.genExpresion(nodo.cond, nivel)
+        salto = self.programa.emitir(JPC, 0, 0)
+        self.genSentencia(nodo.body, nivel)
+        self.programa.emitir(JMP, 0, inicio)
+        self.programa.parchear(salto, len(self.programa))
+
+    # Expresiones y condiciones
+
+    def genExpresion(self, nodo, nivel):
+        self.expresiones[type(nodo)](nodo, nivel)
+
+    def genBinOp(self, nodo, nivel):
+        self.genExpresion(nodo.left, nivel)
+        self.genExpresion(nodo.right, nivel)
+        self.programa.emitir(OPR, 0, OPERACIONES[nodo.op])
+
+    def genUnaryOp(self, nodo, nivel):
+        self.genExpresion(nodo.operand, nivel)
+        if nodo.op == '-':
+            self.programa.emitir(OPR, 0, NEG)
+
+    def genOdd(self, nodo, nivel):
+        self.genExpresion(nodo.expr, nivel)
+        self.programa.emitir(OPR, 0, ODD)
+
+    def genNum(self, nodo, nivel):
+        self.programa.emitir(LIT, 0, nodo.value)
+
+    def genVar(self, nodo, nivel):
+        entrada = nodo.ref
+        if entrada[0] == 'const':
+            self.programa.emitir(LIT, 0, entrada[1])
+        else:
+            self.programa.emitir(LOD, nivel - entrada[1], entrada[2])
+
+
+# Función de conveniencia: AST -> Programa. Resuelve antes los identificadores
+# y, si hay errores semánticos, los lanza todos juntos en un RuntimeError.
+# Después pliega las constantes con Optimizador, salvo con optimizar=False.
+# errores son los del análisis sintáctico (ver analizarConErrores): un AST con
+# errores de sintaxis, o sin AST, se rechaza con el mismo RuntimeError.
+def generar(ast, errores=(), optimizar=True):
+    if ast is None or errores:
+        raise RuntimeError('\n'.join(errores) or 'Error: no hay árbol sintáctico')
+    errores = resolver(ast)
+    if errores:
+        raise RuntimeError('\n'.join(errores))
+    if optimizar:
+        ast = Optimizador.optimizar(ast)
+    return GeneradorCodigo().generar(ast)
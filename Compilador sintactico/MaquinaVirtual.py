@@ -0,0 +1,183 @@
+import sys
+import codecs  # Para manejar archivos con codificación
+from CodigoP import (LIT, OPR, LOD, STO, CAL, INT, JMP, JPC, CABECERA,
+                     RET, NEG, ADD, SUB, MUL, DIV, ODD, EQ, NE, LT, GE, GT, LE)
+
+# Máquina virtual de pila que ejecuta código P.
+#
+# Cada registro de activación empieza en la base b con la cabecera
+#   s[b]   enlace estático (base del procedimiento que lo contiene)
+#   s[b+1] enlace dinámico (base de quien llamó)
+#   s[b+2] dirección de retorno
+# seguida de las variables locales. El programa principal retorna a la
+# dirección 0, lo que detiene la máquina.
+
+TAMANO_PILA = 100000  # Número de posiciones de la pila
+
+
+class MaquinaVirtual:
+    def __init__(self, programa, tamanoPila=TAMANO_PILA):
+        self.programa = programa
+        self.tamanoPila = tamanoPila
+        self.pila = None
+        self.pasos = 0  # Instrucciones ejecutadas en la última ejecución
+
+    # Ejecuta el programa y devuelve las variables globales como diccionario
+    def ejecutar(self):
+        # Todo lo que se usa en el bucle se copia a variables locales; el bucle
+        # no crea objetos aparte de los enteros que resultan de las operaciones.
+        F = self.programa.f
+        L = self.programa.l
+        A = self.programa.a
+        s = [0] * self.tamanoPila
+        p = 0       # Contador de programa
+        b = 0       # Base del registro de activación actual
+        t = -1      # Cima de la pila
+        pasos = 0
+        # Los códigos de operación también: comparar con una variable local es
+        # más rápido que buscar la constante del módulo en cada instrucción
+        lit, opr, lod, sto, cal, int_, jmp, jpc = LIT, OPR, LOD, STO, CAL, INT, JMP, JPC
+        ret, neg, add, sub, mul, div, odd = RET, NEG, ADD, SUB, MUL, DIV, ODD
+        eq, ne, lt, ge, gt, le = EQ, NE, LT, GE, GT, LE
+
+        try:
+            while True:
+                f = F[p]
+                a = A[p]
+                pasos += 1
+                if f == lod:
+                    l = L[p]
+                    p += 1
+                    base = b
+                    while l:
+                        base = s[base]
+                        l -= 1
+                    t += 1
+                    s[t] = s[base + a]
+                elif f == lit:
+                    p += 1
+                    t += 1
+                    s[t] = a
+                elif f == opr:
+                    p += 1
+                    if a == add:
+                        t -= 1
+                        s[t] += s[t + 1]
+                    elif a == sub:
+                        t -= 1
+                        s[t] -= s[t + 1]
+                    elif a == lt:
+                        t -= 1
+                        s[t] = 1 if s[t] < s[t + 1] else 0
+                    elif a == mul:
+                        t -= 1
+                        s[t] *= s[t + 1]
+                    elif a == div:
+                        t -= 1
+                        x = s[t]
+                        y = s[t + 1]
+                        if y == 0:
+                            raise RuntimeError(f'Error: división por cero en la instrucción {p - 1}')
+                        # División entera truncando hacia cero, como en Pascal
+                        q = abs(x) // abs(y)
+                        s[t] = -q if (x < 0) != (y < 0) else q
+                    elif a == eq:
+                        t -= 1
+                        s[t] = 1 if s[t] == s[t + 1] else 0
+                    elif a == ne:
+                        t -= 1
+                        s[t] = 1 if s[t] != s[t + 1] else 0
+                    elif a == gt:
+                        t -= 1
+                        s[t] = 1 if s[t] > s[t + 1] else 0
+                    elif a == le:
+                        t -= 1
+                        s[t] = 1 if s[t] <= s[t + 1] else 0
+                    elif a == ge:
+                        t -= 1
+                        s[t] = 1 if s[t] >= s[t + 1] else 0
+                    elif a == odd:
+                        s[t] &= 1
+                    elif a == neg:
+                        s[t] = -s[t]
+                    elif a == ret:
+                        t = b - 1
+                        p = s[t + 3]
+                        b = s[t + 2]
+                        if p == 0:
+                            break
+                    else:
+                        raise RuntimeError(f'Error: operación OPR desconocida {a}')
+                elif f == sto:
+                    l = L[p]
+                    p += 1
+                    base = b
+                    while l:
+                        base = s[base]
+                        l -= 1
+                    s[base + a] = s[t]
+                    t -= 1
+                elif f == jpc:
+                    p = a if s[t] == 0 else p + 1
+                    t -= 1
+                elif f == jmp:
+                    p = a
+                elif f == int_:
+                    p += 1
+                    t += a
+                elif f == cal:
+                    l = L[p]
+                    p += 1
+                    base = b
+                    while l:
+                        base = s[base]
+                        l -= 1
+                    s[t + 1] = base
+                    s[t + 2] = b
+                    s[t + 3] = p
+                    b = t + 1
+                    p = a
+                else:
+                    raise RuntimeError(f'Error: instrucción desconocida {f} en {p}')
+        except IndexError:
+            raise RuntimeError('Error: desbordamiento de la pila de ejecución') from None
+
+        self.pila = s
+        self.pasos = pasos
+        return self.globales()
+
+    # Valores de las variables del programa principal tras la ejecución
+    def globales(self):
+        nombres = self.programa.globales
+        return dict(zip(nombres, self.pila[CABECERA:CABECERA + len(nombres)]))
+
+
+# Función de conveniencia: ejecuta un Programa y devuelve sus variables globales
+def ejecutar(programa, tamanoPila=TAMANO_PILA):
+    return MaquinaVirtual(programa, tamanoPila).ejecutar()
+
+
+if __name__ == '__main__':
+    from AnalizadorSintactico import analizarConErrores
+    from GeneradorCodigo import generar
+
+    if len(sys.argv) < 2:
+        print('Uso: python MaquinaVirtual.py archivo.pl0 [--listado] [--sin-optimizar]')
+        sys.exit(1)
+
+    with codecs.open(sys.argv[1], "r", "utf-8") as fp:  # Abrimos el programa fuente
+        cadena = fp.read()
+
+    # Con errores de sintaxis o semánticos no se genera ni se ejecuta nada; un
+    # error de ejecución (división por cero, desbordamiento de la pila) detiene
+    # la máquina. En ambos casos se muestra el mensaje y se termina con error.
+    try:
+        programa = generar(*analizarConErrores(cadena), optimizar='--sin-optimizar' not in sys.argv)
+        if '--listado' in sys.argv:
+            print(programa.listado())
+        globales = ejecutar(programa)
+    except RuntimeError as e:
+        print(e)
+        sys.exit(1)
+    for nombre, valor in globales.items():
+        print(f'{nombre} = {valor}')
@@ -0,0 +1,221 @@
+from ArbolSintactico import (Block, ProcDecl, Assign, Call, Begin, If, While,
+                             BinOp, UnaryOp, Odd, Num, Var)
+from CodigoP import ARGUMENTO_MINIMO, ARGUMENTO_MAXIMO
+
+# Optimizador de PL/0: plegado y propagación de constantes sobre el AST.
+#
+# Se aplica a un AST sin errores y ya resuelto por AnalizadorSemantico, antes
+# de generar el código:
+#   - Los usos de constantes (Var cuya entrada es ('const', valor)) se
+#     sustituyen por su valor.
+#   - Las operaciones con operandos constantes se calculan: aritméticas,
+#     relacionales, el signo y odd. También se juntan las constantes de
+#     (x + 2) - 5 o (x * 2) * 3 y se quitan x + 0, x - 0, x * 1 y x / 1.
+#   - Un if con la condición siempre falsa se elimina y uno con la condición
+#     siempre cierta se sustituye por su cuerpo. Un while con la condición
+#     siempre falsa también se elimina.
+# Los resultados son los mismos que daría la máquina virtual: la división
+# trunca hacia cero y una división por cero no se pliega, para que siga dando
+# el error al ejecutarse. Tampoco se pliega un valor que no cabe en el
+# argumento de una instrucción LIT.
+#
+# El AST original no se modifica: el resultado es un árbol nuevo que comparte
+# con él los nodos que no cambian (el AST de una SesionIncremental, por
+# ejemplo, se sigue usando después).
+
+# Operadores aritméticos y relacionales, con la operación que calculan
+CALCULOS = {
+    '+': lambda x, y: x + y,
+    '-': lambda x, y: x - y,
+    '*': lambda x, y: x * y,
+    '=': lambda x, y: int(x == y),
+    '<>': lambda x, y: int(x != y),
+    '<': lambda x, y: int(x < y),
+    '>': lambda x, y: int(x > y),
+    '<=': lambda x, y: int(x <= y),
+    '>=': lambda x, y: int(x >= y),
+}
+
+
+# División entera como la de la máquina virtual (None si el divisor es 0)
+def dividir(x, y):
+    if y == 0:
+        return None
+    q = abs(x) // abs(y)
+    return -q if (x < 0) != (y < 0) else q
+
+
+# Nodo Num con un valor calculado, o None si no cabe en una instrucción
+def numero(valor):
+    if valor is None or not ARGUMENTO_MINIMO <= valor <= ARGUMENTO_MAXIMO:
+        return None
+    return Num(valor)
+
+
+class Optimizador:
+    def __init__(self):
+        # Tabla de despacho por tipo de sentencia
+        self.sentencias = {
+            Assign: self.optAssign,
+            Call: self.optCall,
+            Begin: self.optBegin,
+            If: self.optIf,
+            While: self.optWhile,
+        }
+
+    def optimizar(self, ast):
+        return self.optBlock(ast)
+
+    def optBlock(self, bloque):
+        procs = [self.optProc(proc) for proc in bloque.procs]
+        cuerpo = self.optSentencia(bloque.body)
+        if cuerpo is bloque.body and all(p is q for p, q in zip(procs, bloque.procs)):
+            return bloque
+        return Block(bloque.consts, bloque.vars, procs, cuerpo)
+
+    def optProc(self, proc):
+        bloque = self.optBlock(proc.block)
+        return proc if bloque is proc.block else ProcDecl(proc.name, bloque)
+
+    # Sentencias. Devuelven el nodo optimizado, o None si la sentencia
+    # desaparece.
+
+    def optSentencia(self, nodo):
+        if nodo is None:
+            return None
+        return self.sentencias[type(nodo)](nodo)
+
+    def optAssign(self, nodo):
+        expr = self.optExpresion(nodo.expr)
+        if expr is nodo.expr:
+            return nodo
+        nuevo = Assign(nodo.name, expr)
+        nuevo.ref = nodo.ref
+        return nuevo
+
+    def optCall(self, nodo):
+        return nodo
+
+    def optBegin(self, nodo):
+        sentencias = [self.optSentencia(s) for s in nodo.statements]
+        if all(s is t for s, t in zip(sentencias, nodo.statements)):
+            return nodo
+        return Begin([s for s in sentencias if s is not None])
+
+    def optIf(self, nodo):
+        cond = self.optExpresion(nodo.cond)
+        cuerpo = self.optSentencia(nodo.body)
+        if type(cond) is Num:
+            return cuerpo if cond.value else None
+        if cond is nodo.cond and cuerpo is nodo.body:
+            return nodo
+        return If(cond, cuerpo)
+
+    def optWhile(self, nodo):
+        cond = self.optExpresion(nodo.cond)
+        if type(cond) is Num and not cond.value:
+            return None
+        cuerpo = self.optSentencia(nodo.body)
+        if cond is nodo.cond and cuerpo is nodo.body:
+            return nodo
+        return While(cond, cuerpo)
+
+    # Expresiones y condiciones. Se recorren en postorden con una pila en
+    # lugar de con recursión, porque una expresión larga como a + b + c + ...
+    # es un árbol tan profundo como términos tiene. resultados guarda los
+    # nodos ya optimizados de los operandos.
+    def optExpresion(self, nodo):
+        resultados = []
+        pendientes = [(nodo, False)]
+        while pendientes:
+            nodo, visitado = pendientes.pop()
+            tipo = type(nodo)
+            if tipo is BinOp:
+                if not visitado:
+                    pendientes.append((nodo, True))
+                    pendientes.append((nodo.right, False))
+                    pendientes.append((nodo.left, False))
+                    continue
+                derecho = resultados.pop()
+                resultados.append(self.optBinOp(nodo, resultados.pop(), derecho))
+            elif tipo is UnaryOp or tipo is Odd:
+                if not visitado:
+                    pendientes.append((nodo, True))
+                    pendientes.append((nodo.operand if tipo is UnaryOp else nodo.expr, False))
+                    continue
+                operando = resultados.pop()
+                if tipo is UnaryOp:
+                    resultados.append(self.optUnaryOp(nodo, operando))
+                else:
+                    resultados.append(self.optOdd(nodo, operando))
+            elif tipo is Var:
+                entrada = nodo.ref
+                if entrada is not None and entrada[0] == 'const':
+                    resultados.append(numero(entrada[1]) or nodo)
+                else:
+                    resultados.append(nodo)
+            else:
+                resultados.append(nodo)  # Num (o None en una condición descartada)
+        return resultados[0]
+
+    def optBinOp(self, nodo, izquierdo, derecho):
+        op = nodo.op
+        if type(derecho) is Num:
+            c = derecho.value
+            if type(izquierdo) is Num:
+                if op == '/':
+                    plegado = numero(dividir(izquierdo.value, c))
+                else:
+                    plegado = numero(CALCULOS[op](izquierdo.value, c))
+                if plegado is not None:
+                    return plegado
+            elif op in ('+', '-'):
+                # (x + a) - c se queda en x + (a - c); x + 0 y x - 0 en x
+                total = c if op == '+' else -c
+                x = izquierdo
+                if type(x) is BinOp and x.op in ('+', '-') and type(x.right) is Num:
+                    total += x.right.value if x.op == '+' else -x.right.value
+                    x = x.left
+                if total == 0:
+                    return x
+                if x is not izquierdo or total < 0:
+                    constante = numero(abs(total))
+                    if constante is not None:
+                        return BinOp('+' if total > 0 else '-', x, constante)
+            elif op == '*':
+                # (x * a) * c se queda en x * (a * c); x * 1 en x
+                if type(izquierdo) is BinOp and izquierdo.op == '*' and type(izquierdo.right) is Num:
+                    constante = numero(izquierdo.right.value * c)
+                    if constante is not None:
+                        return BinOp('*', izquierdo.left, constante)
+                if c == 1:
+                    return izquierdo
+            elif op == '/' and c == 1:
+                return izquierdo
+        elif type(izquierdo) is Num:
+            if op == '+' and izquierdo.value == 0 or op == '*' and izquierdo.value == 1:
+                return derecho
+        if izquierdo is nodo.left and derecho is nodo.right:
+            return nodo
+        return BinOp(op, izquierdo, derecho)
+
+    def optUnaryOp(self, nodo, operando):
+        if nodo.op == '+':
+            return operando  # El signo + no genera código
+        if type(operando) is Num:
+            plegado = numero(-operando.value)
+            if plegado is not None:
+                return plegado
+        elif type(operando) is UnaryOp and operando.op == '-':
+            return operando.operand
+        return nodo if operando is nodo.operand else UnaryOp(nodo.op, operando)
+
+    def optOdd(self, nodo, operando):
+        if type(operando) is Num:
+            return Num(operando.value & 1)
+        return nodo if operando is nodo.expr else Odd(operando)
+
+
+# Función de conveniencia: devuelve el AST optimizado
+def optimizar(ast):
+    return Optimizador().optimizar(ast)
@@ -0,0 +1,675 @@
+# ParserGenerado.py
+# This file is automatically generated by ply/ygen.py from the grammar in
+# AnalizadorSintactico.py.  Do not edit it: regenerate it when the grammar changes.
+
+import sys
+from ply import yacc
+from ply import ygen
+
+_tabversion = '3.8'
+
+# Grammar this module was generated from (see check())
+_start = None
+_tokens = ['ID', 'NUMBER', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'ASSIGN', 'NE', 'LT', 'LTE', 'GT', 'GTE', 'LPARENT', 'RPARENT', 'COMMA', 'SEMICOLON', 'UPDATE', 'BEGIN', 'END', 'IF', 'THEN', 'WHILE', 'DO', 'CALL', 'CONST', 'VAR', 'PROCEDURE', 'ODD']
+_precedence = [('right', 'ASSIGN'), ('right', 'UPDATE'), ('left', 'NE'), ('left', 'LT', 'LTE', 'GT', 'GTE'), ('left', 'PLUS', 'MINUS'), ('left', 'TIMES', 'DIVIDE'), ('right', 'ODD'), ('left', 'LPARENT', 'RPARENT')]
+_rules = (
+    ('p_addingOperator1', 'addingOperator : PLUS'),
+    ('p_addingOperator2', 'addingOperator : MINUS'),
+    ('p_block', 'block : constDecl varDecl procDecl statement'),
+    ('p_condition1', 'condition : ODD expression'),
+    ('p_condition2', 'condition : expression relation expression'),
+    ('p_constAssignmentList1', 'constAssignmentList : ID ASSIGN NUMBER'),
+    ('p_constAssignmentList2', 'constAssignmentList : constAssignmentList COMMA ID ASSIGN NUMBER'),
+    ('p_constDecl', 'constDecl : CONST constAssignmentList SEMICOLON'),
+    ('p_constDeclEmpty', 'constDecl : empty'),
+    ('p_constDeclError', 'constDecl : CONST error SEMICOLON'),
+    ('p_empty', 'empty :'),
+    ('p_expression1', 'expression : term'),
+    ('p_expression2', 'expression : addingOperator term'),
+    ('p_expression3', 'expression : expression addingOperator term'),
+    ('p_factor1', 'factor : ID'),
+    ('p_factor2', 'factor : NUMBER'),
+    ('p_factor3', 'factor : LPARENT expression RPARENT'),
+    ('p_identList1', 'identList : ID'),
+    ('p_identList2', 'identList : identList COMMA ID'),
+    ('p_multiplyingOperator1', 'multiplyingOperator : TIMES'),
+    ('p_multiplyingOperator2', 'multiplyingOperator : DIVIDE'),
+    ('p_procDecl1', 'procDecl : PROCEDURE ID SEMICOLON block SEMICOLON'),
+    ('p_procDeclEmpty', 'procDecl : empty'),
+    ('p_program', 'program : block'),
+    ('p_relation1', 'relation : ASSIGN'),
+    ('p_relation2', 'relation : NE'),
+    ('p_relation3', 'relation : LT'),
+    ('p_relation4', 'relation : GT'),
+    ('p_relation5', 'relation : LTE'),
+    ('p_relation6', 'relation : GTE'),
+    ('p_statement1', 'statement : ID UPDATE expression'),
+    ('p_statement2', 'statement : CALL ID'),
+    ('p_statement3', 'statement : BEGIN statementList END'),
+    ('p_statement4', 'statement : IF condition THEN statement'),
+    ('p_statement4Error', 'statement : IF error THEN statement'),
+    ('p_statement5', 'statement : WHILE condition DO statement'),
+    ('p_statement5Error', 'statement : WHILE error DO statement'),
+    ('p_statementEmpty', 'statement : empty'),
+    ('p_statementList1', 'statementList : statement'),
+    ('p_statementList2', 'statementList : statementList SEMICOLON statement'),
+    ('p_statementListError1', 'statementList : error'),
+    ('p_statementListError2', 'statementList : statementList SEMICOLON error'),
+    ('p_term1', 'term : factor'),
+    ('p_term2', 'term : term multiplyingOperator factor'),
+    ('p_varDecl1', 'varDecl : VAR identList SEMICOLON'),
+    ('p_varDeclEmpty', 'varDecl : empty'),
+    ('p_varDeclError', 'varDecl : VAR error SEMICOLON'),
+)
+
+# Productions: (str, name, len, func, file, line)
+_productions = (
+    ("S' -> program", "S'", 1, None, '', 0),
+    ('program -> block', 'program', 1, 'p_program', 'AnalizadorSintactico.py', 38),
+    ('block -> constDecl varDecl procDecl statement', 'block', 4, 'p_block', 'AnalizadorSintactico.py', 46),
+    ('constDecl -> CONST constAssignmentList SEMICOLON', 'constDecl', 3, 'p_constDecl', 'AnalizadorSintactico.py', 55),
+    ('constDecl -> CONST error SEMICOLON', 'constDecl', 3, 'p_constDeclError', 'AnalizadorSintactico.py', 63),
+    ('constDecl -> empty', 'constDecl', 1, 'p_constDeclEmpty', 'AnalizadorSintactico.py', 70),
+    ('constAssignmentList -> ID ASSIGN NUMBER', 'constAssignmentList', 3, 'p_constAssignmentList1', 'AnalizadorSintactico.py', 77),
+    ('constAssignmentList -> constAssignmentList COMMA ID ASSIGN NUMBER', 'constAssignmentList', 5, 'p_constAssignmentList2', 'AnalizadorSintactico.py', 84),
+    ('varDecl -> VAR identList SEMICOLON', 'varDecl', 3, 'p_varDecl1', 'AnalizadorSintactico.py', 94),
+    ('varDecl -> VAR error SEMICOLON', 'varDecl', 3, 'p_varDeclError', 'AnalizadorSintactico.py', 102),
+    ('varDecl -> empty', 'varDecl', 1, 'p_varDeclEmpty', 'AnalizadorSintactico.py', 109),
+    ('identList -> ID', 'identList', 1, 'p_identList1', 'AnalizadorSintactico.py', 118),
+    ('identList -> identList COMMA ID', 'identList', 3, 'p_identList2', 'AnalizadorSintactico.py', 125),
+    ('procDecl -> PROCEDURE ID SEMICOLON block SEMICOLON', 'procDecl', 5, 'p_procDecl1', 'AnalizadorSintactico.py', 135),
+    ('procDecl -> empty', 'procDecl', 1, 'p_procDeclEmpty', 'AnalizadorSintactico.py', 142),
+    ('statement -> ID UPDATE expression', 'statement', 3, 'p_statement1', 'AnalizadorSintactico.py', 151),
+    ('statement -> CALL ID', 'statement', 2, 'p_statement2', 'AnalizadorSintactico.py', 158),
+    ('statement -> BEGIN statementList END', 'statement', 3, 'p_statement3', 'AnalizadorSintactico.py', 165),
+    ('statement -> IF condition THEN statement', 'statement', 4, 'p_statement4', 'AnalizadorSintactico.py', 172),
+    ('statement -> WHILE condition DO statement', 'statement', 4, 'p_statement5', 'AnalizadorSintactico.py', 179),
+    ('statement -> IF error THEN statement', 'statement', 4, 'p_statement4Error', 'AnalizadorSintactico.py', 186),
+    ('statement -> WHILE error DO statement', 'statement', 4, 'p_statement5Error', 'AnalizadorSintactico.py', 193),
+    ('statement -> empty', 'statement', 1, 'p_statementEmpty', 'AnalizadorSintactico.py', 200),
+    ('statementList -> statement', 'statementList', 1, 'p_statementList1', 'AnalizadorSintactico.py', 209),
+    ('statementList -> statementList SEMICOLON statement', 'statementList', 3, 'p_statementList2', 'AnalizadorSintactico.py', 216),
+    ('statementList -> error', 'statementList', 1, 'p_statementListError1', 'AnalizadorSintactico.py', 232),
+    ('statementList -> statementList SEMICOLON error', 'statementList', 3, 'p_statementListError2', 'AnalizadorSintactico.py', 238),
+    ('condition -> ODD expression', 'condition', 2, 'p_condition1', 'AnalizadorSintactico.py', 248),
+    ('condition -> expression relation expression', 'condition', 3, 'p_condition2', 'AnalizadorSintactico.py', 255),
+    ('relation -> ASSIGN', 'relation', 1, 'p_relation1', 'AnalizadorSintactico.py', 264),
+    ('relation -> NE', 'relation', 1, 'p_relation2', 'AnalizadorSintactico.py', 272),
+    ('relation -> LT', 'relation', 1, 'p_relation3', 'AnalizadorSintactico.py', 280),
+    ('relation -> GT', 'relation', 1, 'p_relation4', 'AnalizadorSintactico.py', 288),
+    ('relation -> LTE', 'relation', 1, 'p_relation5', 'AnalizadorSintactico.py', 296),
+    ('relation -> GTE', 'relation', 1, 'p_relation6', 'AnalizadorSintactico.py', 304),
+    ('expression -> term', 'expression', 1, 'p_expression1', 'AnalizadorSintactico.py', 314),
+    ('expression -> addingOperator term', 'expression', 2, 'p_expression2', 'AnalizadorSintactico.py', 322),
+    ('expression -> expression addingOperator term', 'expression', 3, 'p_expression3', 'AnalizadorSintactico.py', 329),
+    ('addingOperator -> PLUS', 'addingOperator', 1, 'p_addingOperator1', 'AnalizadorSintactico.py', 338),
+    ('addingOperator -> MINUS', 'addingOperator', 1, 'p_addingOperator2', 'AnalizadorSintactico.py', 346),
+    ('term -> factor', 'term', 1, 'p_term1', 'AnalizadorSintactico.py', 356),
+    ('term -> term multiplyingOperator factor', 'term', 3, 'p_term2', 'AnalizadorSintactico.py', 364),
+    ('multiplyingOperator -> TIMES', 'multiplyingOperator', 1, 'p_multiplyingOperator1', 'AnalizadorSintactico.py', 373),
+    ('multiplyingOperator -> DIVIDE', 'multiplyingOperator', 1, 'p_multiplyingOperator2', 'AnalizadorSintactico.py', 381),
+    ('factor -> ID', 'factor', 1, 'p_factor1', 'AnalizadorSintactico.py', 391),
+    ('factor -> NUMBER', 'factor', 1, 'p_factor2', 'AnalizadorSintactico.py', 398),
+    ('factor -> LPARENT expression RPARENT', 'factor', 3, 'p_factor3', 'AnalizadorSintactico.py', 405),
+    ('empty -> <empty>', 'empty', 0, 'p_empty', 'AnalizadorSintactico.py', 412),
+)
+
+# Dense tables (see yacc.LRParser.set_dense())
+_terminals = (
+    '$end', 'ASSIGN', 'BEGIN', 'CALL', 'COMMA', 'CONST', 'DIVIDE', 'DO', 'END', 'GT', 'GTE', 'ID', 'IF', 'LPARENT', 'LT', 'LTE',
+    'MINUS', 'NE', 'NUMBER', 'ODD', 'PLUS', 'PROCEDURE', 'RPARENT', 'SEMICOLON', 'THEN', 'TIMES', 'UPDATE', 'VAR', 'WHILE', 'error',
+)
+_nonterminals = (
+    'addingOperator', 'block', 'condition', 'constAssignmentList', 'constDecl', 'empty', 'expression', 'factor', 'identList', 'multiplyingOperator', 'procDecl', 'program', 'relation', 'statement', 'statementList', 'term',
+    'varDecl',
+)
+_action = (
+    -47, None, -47, -47, None, 4, None, None, None, None, None, -47, -47, None, None, None, None, None, None, None, None, -47, None, None, None, None, None, -47, -47, None, None,
+    0, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -1, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -47, None, -47, -47, None, None, None, None, None, None, None, -47, -47, None, None, None, None, None, None, None, None, -47, None, -47, None, None, None, 7, -47, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 11, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 10, None,
+    -5, None, -5, -5, None, None, None, None, None, None, None, -5, -5, None, None, None, None, None, None, None, None, -5, None, -5, None, None, None, -5, -5, None, None,
+    -47, None, -47, -47, None, None, None, None, None, None, None, -47, -47, None, None, None, None, None, None, None, None, 13, None, -47, None, None, None, None, -47, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 17, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 16, None,
+    -10, None, -10, -10, None, None, None, None, None, None, None, -10, -10, None, None, None, None, None, None, None, None, -10, None, -10, None, None, None, None, -10, None, None,
+    None, None, None, None, 19, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 18, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 20, None, None, None, None, None, None, None,
+    None, 21, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -47, None, 25, 24, None, None, None, None, None, None, None, 23, 26, None, None, None, None, None, None, None, None, None, None, -47, None, None, None, None, 27, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 29, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -14, None, -14, -14, None, None, None, None, None, None, None, -14, -14, None, None, None, None, None, None, None, None, None, None, -14, None, None, None, None, -14, None, None,
+    None, None, None, None, 31, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 30, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 32, None, None, None, None, None, None, None,
+    None, None, None, None, -11, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -11, None, None, None, None, None, None, None,
+    -3, None, -3, -3, None, None, None, None, None, None, None, -3, -3, None, None, None, None, None, None, None, None, -3, None, -3, None, None, None, -3, -3, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 33, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -4, None, -4, -4, None, None, None, None, None, None, None, -4, -4, None, None, None, None, None, None, None, None, -4, None, -4, None, None, None, -4, -4, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 34, None, None, None, None, None, None, None, None, None, None, None, None,
+    -2, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -2, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 35, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 36, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, 25, 24, None, None, None, None, -47, None, None, 23, 26, None, None, None, None, None, None, None, None, None, None, -47, None, None, None, None, 27, 39, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, 48, None, 50, 42, 47, None, None, None, None, None, None, None, None, 41, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, 48, None, 50, 42, 47, None, None, None, None, None, None, None, None, 53, None,
+    -22, None, None, None, None, None, None, None, -22, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -22, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 54, None, None, None, None, None, None, None,
+    -8, None, -8, -8, None, None, None, None, None, None, None, -8, -8, None, None, None, None, None, None, None, None, -8, None, -8, None, None, None, None, -8, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 55, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -9, None, -9, -9, None, None, None, None, None, None, None, -9, -9, None, None, None, None, None, None, None, None, -9, None, -9, None, None, None, None, -9, None, None,
+    None, 56, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, -6, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -6, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, 48, None, 50, None, 47, None, None, None, None, None, None, None, None, None, None,
+    -16, None, None, None, None, None, None, None, -16, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -16, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 58, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 59, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -23, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -23, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -25, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -25, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 60, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 61, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, 48, None, 50, None, 47, None, None, None, None, None, None, None, None, None, None,
+    None, 65, None, None, None, None, None, None, None, 68, 70, None, None, None, 67, 69, 48, 66, None, None, 47, None, None, None, None, None, None, None, None, None, None,
+    -35, -35, None, None, None, None, 73, -35, -35, -35, -35, None, None, None, -35, -35, -35, -35, None, None, -35, None, -35, -35, -35, 72, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, None, None, 50, None, None, None, None, None, None, None, None, None, None, None, None,
+    -40, -40, None, None, None, None, -40, -40, -40, -40, -40, None, None, None, -40, -40, -40, -40, None, None, -40, None, -40, -40, -40, -40, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -38, None, -38, None, None, None, None, -38, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -39, None, -39, None, None, None, None, -39, None, None, None, None, None, None, None, None, None, None, None, None,
+    -44, -44, None, None, None, None, -44, -44, -44, -44, -44, None, None, None, -44, -44, -44, -44, None, None, -44, None, -44, -44, -44, -44, None, None, None, None, None,
+    -45, -45, None, None, None, None, -45, -45, -45, -45, -45, None, None, None, -45, -45, -45, -45, None, None, -45, None, -45, -45, -45, -45, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, 48, None, 50, None, 47, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 76, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 77, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, -47, -47, None, 4, None, None, None, None, None, -47, -47, None, None, None, None, None, None, None, None, -47, None, -47, None, None, None, -47, -47, None, None,
+    None, None, None, None, -12, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -12, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 79, None, None, None, None, None, None, None, None, None, None, None, None,
+    -15, None, None, None, None, None, None, None, -15, None, None, None, None, None, None, None, 48, None, None, None, 47, None, None, -15, None, None, None, None, None, None, None,
+    -17, None, None, None, None, None, None, None, -17, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -17, None, None, None, None, None, None, None,
+    None, None, 25, 24, None, None, None, None, -47, None, None, 23, 26, None, None, None, None, None, None, None, None, None, None, -47, None, None, None, None, 27, 81, None,
+    -47, None, 25, 24, None, None, None, None, -47, None, None, 23, 26, None, None, None, None, None, None, None, None, None, None, -47, None, None, None, None, 27, None, None,
+    -47, None, 25, 24, None, None, None, None, -47, None, None, 23, 26, None, None, None, None, None, None, None, None, None, None, -47, None, None, None, None, 27, None, None,
+    None, None, None, None, None, None, None, -27, None, None, None, None, None, None, None, None, 48, None, None, None, 47, None, None, None, -27, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, 48, None, 50, None, 47, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, None, None, 50, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -29, None, -29, None, None, -29, None, -29, None, -29, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -30, None, -30, None, None, -30, None, -30, None, -30, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -31, None, -31, None, None, -31, None, -31, None, -31, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -32, None, -32, None, None, -32, None, -32, None, -32, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -33, None, -33, None, None, -33, None, -33, None, -33, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -34, None, -34, None, None, -34, None, -34, None, -34, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 49, None, 51, None, None, None, None, 50, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -42, None, -42, None, None, None, None, -42, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, -43, None, -43, None, None, None, None, -43, None, None, None, None, None, None, None, None, None, None, None, None,
+    -36, -36, None, None, None, None, 73, -36, -36, -36, -36, None, None, None, -36, -36, -36, -36, None, None, -36, None, -36, -36, -36, 72, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 48, None, None, None, 47, None, 87, None, None, None, None, None, None, None, None,
+    -47, None, 25, 24, None, None, None, None, -47, None, None, 23, 26, None, None, None, None, None, None, None, None, None, None, -47, None, None, None, None, 27, None, None,
+    -47, None, 25, 24, None, None, None, None, -47, None, None, 23, 26, None, None, None, None, None, None, None, None, None, None, -47, None, None, None, None, 27, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 90, None, None, None, None, None, None, None,
+    None, None, None, None, -7, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -7, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -24, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -24, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -26, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -26, None, None, None, None, None, None, None,
+    -18, None, None, None, None, None, None, None, -18, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -18, None, None, None, None, None, None, None,
+    -20, None, None, None, None, None, None, None, -20, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -20, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, -28, None, None, None, None, None, None, None, None, 48, None, None, None, 47, None, None, None, -28, None, None, None, None, None, None,
+    -37, -37, None, None, None, None, 73, -37, -37, -37, -37, None, None, None, -37, -37, -37, -37, None, None, -37, None, -37, -37, -37, 72, None, None, None, None, None,
+    -41, -41, None, None, None, None, -41, -41, -41, -41, -41, None, None, None, -41, -41, -41, -41, None, None, -41, None, -41, -41, -41, -41, None, None, None, None, None,
+    -46, -46, None, None, None, None, -46, -46, -46, -46, -46, None, None, None, -46, -46, -46, -46, None, None, -46, None, -46, -46, -46, -46, None, None, None, None, None,
+    -19, None, None, None, None, None, None, None, -19, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -19, None, None, None, None, None, None, None,
+    -21, None, None, None, None, None, None, None, -21, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -21, None, None, None, None, None, None, None,
+    -13, None, -13, -13, None, None, None, None, None, None, None, -13, -13, None, None, None, None, None, None, None, None, None, None, -13, None, None, None, None, -13, None, None,
+)
+_goto = (
+    -1, 2, -1, -1, 3, 5, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 6,
+    -1, -1, -1, 9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 14, -1, -1, -1, -1, 12, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, 15, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, 22, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, 38, 37, -1, -1,
+    45, -1, 40, -1, -1, -1, 43, 46, -1, -1, -1, -1, -1, -1, -1, 44, -1,
+    45, -1, 52, -1, -1, -1, 43, 46, -1, -1, -1, -1, -1, -1, -1, 44, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    45, -1, -1, -1, -1, -1, 57, 46, -1, -1, -1, -1, -1, -1, -1, 44, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    45, -1, -1, -1, -1, -1, 62, 46, -1, -1, -1, -1, -1, -1, -1, 44, -1,
+    64, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 63, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, 46, -1, -1, -1, -1, -1, -1, -1, 74, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    45, -1, -1, -1, -1, -1, 75, 46, -1, -1, -1, -1, -1, -1, -1, 44, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, 78, -1, -1, 3, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    64, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, 80, -1, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, 82, -1, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, 83, -1, -1, -1,
+    64, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    45, -1, -1, -1, -1, -1, 84, 46, -1, -1, -1, -1, -1, -1, -1, 44, -1,
+    -1, -1, -1, -1, -1, -1, -1, 46, -1, -1, -1, -1, -1, -1, -1, 85, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, 86, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1,
+    64, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, 88, -1, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, 89, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    64, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+)
+_defaulted = (
+    None, None, -1, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_prodgoto = (
+    -1, 11, 1, 4, 4, 4, 3, 3, 16, 16, 16, 8, 8, 10, 10, 13,
+    13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 2, 2, 12, 12, 12,
+    12, 12, 12, 6, 6, 6, 0, 0, 15, 15, 9, 9, 7, 7, 7, 5,
+)
+
+_nterm = len(_terminals) + 1
+_nnonterm = len(_nonterminals)
+_unknownid = len(_terminals)
+_names = tuple(p[1] for p in _productions)
+_lens = tuple(p[2] for p in _productions)
+
+# Cache of yacc.is_value_rule() for the rule functions
+_value_rules = {}
+
+def value_rule(f):
+    try:
+        return _value_rules[f]
+    except KeyError:
+        result = _value_rules[f] = yacc.is_value_rule(f)
+        return result
+
+# Returns True if pdict holds the grammar this module was generated from
+def check(pdict):
+    return (yacc.__tabversion__ == _tabversion and pdict.get('start') == _start and
+            list(pdict.get('tokens', ())) == _tokens and
+            ygen.grammar_precedence(pdict) == _precedence and
+            tuple(ygen.grammar_rules(pdict)) == _rules)
+
+class Parser(yacc.LRParser):
+    def __init__(self, pdict):
+        lr = yacc.LRTable()
+        lr.lr_method = 'LALR'
+        lr.lr_productions = [yacc.MiniProduction(*p) for p in _productions]
+        # The last column of _action is the one of the unknown token types
+        lr.lr_action = yacc._BinaryRows(_action, _terminals + ('',), None)
+        lr.lr_action.defaulted_states = dict((s, r) for s, r in enumerate(_defaulted) if r is not None)
+        lr.lr_goto = yacc._BinaryRows(_goto, _nonterminals, -1)
+        lr.bind_callables(pdict)
+        yacc.LRParser.__init__(self, lr, pdict.get('p_error'))
+
+        self.termids = dict((t, i) for i, t in enumerate(_terminals))
+        self.nontermids = dict((n, i) for i, n in enumerate(_nonterminals))
+        self.denseaction = _action
+        self.densegoto = _goto
+        self.densedefaulted = _defaulted
+        self.prodgoto = _prodgoto
+        self.dense = True
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        if debug or tracking or yacc.yaccdevel:
+            return yacc.LRParser.parse(self, input, lexer, debug, tracking, tokenfunc)
+        return self.parsegenerated(input, lexer, debug, tracking, tokenfunc)
+
+    # Same algorithm as yacc.LRParser.parsedense(), with the tables of this
+    # module and the name, length and rule of each production read from
+    # lists indexed by the production number.  Two reductions are cheaper:
+    #   - a passthrough reduction of a symbol made by the parser retypes it
+    #     in place instead of copying it
+    #   - rules that only use p[n] (see yacc.is_value_rule()) are called with
+    #     a list of values, built by code unrolled for each rule length,
+    #     instead of the YaccProduction object
+    def parsegenerated(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        lookahead = None                         # Current lookahead symbol
+        newsymbol = self.symbolclass             # Class of the grammar symbols
+        lookaheadstack = []                      # Stack of lookahead symbols
+        actions = _action                        # Flat action table
+        goto    = _goto                          # Flat goto table
+        termids = self.termids                   # Integer id of each terminal
+        unknownid = _unknownid                   # Id of the token types not in the grammar
+        nterm   = _nterm                         # Row length of the action table
+        nnonterm = _nnonterm                     # Row length of the goto table
+        names   = _names                         # Name of each production
+        lens    = _lens                          # Length of each production
+        prodgoto = _prodgoto                     # Goto column of each production
+        funcs   = [p.callable for p in self.productions]  # Rule of each production
+        valuerules = [value_rule(f) for f in funcs]       # Rules called with a list of values
+        passthrough = self.passthrough           # Productions reduced without calling their rule
+        defaulted_states = _defaulted            # Default reduction of each state (or None)
+        error_count = yacc.error_count           # Symbols to shift before leaving error recovery
+        pslice  = yacc.YaccProduction(None)      # Production object passed to grammar rules
+        errorcount = 0                           # Used during error recovery
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from ply import lex
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        if tokenfunc is None:
+            # Tokenize function
+            get_token = lexer.token
+        else:
+            get_token = tokenfunc
+
+        # Tokens carry their id if the lexer tags them with our ids
+        tagged = getattr(lexer, 'lextypeids', None) is termids
+
+        # Set the parser() token method (sometimes used in error recovery)
+        self.token = get_token
+
+        # Set up the state and symbol stacks
+        statestack = []                # Stack of parsing states
+        self.statestack = statestack
+        symstack   = []                # Stack of grammar symbols
+        self.symstack = symstack
+
+        pslice.stack = symstack         # Put in the production
+        errtoken   = None               # Err token
+
+        # The start state is assumed to be (0,$end)
+        statestack.append(0)
+        sym = newsymbol()
+        sym.type = '$end'
+        symstack.append(sym)
+        state = 0
+        while True:
+            t = defaulted_states[state]
+            if t is None:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()     # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = newsymbol()
+                        lookahead.type = '$end'
+
+                # Check the action table.  The $end and error symbols made
+                # by the parser are not tagged.
+                if tagged:
+                    try:
+                        ltid = lookahead.typeid
+                    except AttributeError:
+                        ltid = termids.get(lookahead.type, unknownid)
+                else:
+                    ltid = termids.get(lookahead.type, unknownid)
+                t = actions[state * nterm + ltid]
+
+            if t is not None:
+                if t > 0:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+                    symstack.append(lookahead)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                if t < 0:
+                    # reduce a symbol on the stack, emit a production
+                    rule = -t
+                    pname = names[rule]
+
+                    if passthrough[rule]:
+                        # Unit production whose rule only does p[0] = p[1]
+                        t1 = symstack[-1]
+                        if t1.__class__ is newsymbol:
+                            t1.type = pname
+                        else:
+                            sym = newsymbol()
+                            sym.type = pname
+                            sym.value = t1.value
+                            symstack[-1] = sym
+                        state = goto[statestack[-2] * nnonterm + prodgoto[rule]]
+                        statestack[-1] = state
+                        continue
+
+                    plen = lens[rule]
+
+                    if valuerules[rule]:
+                        # The rule only uses p[n] with constant n >= 0, so it
+                        # gets a plain list with the values of the symbols
+                        if plen == 1:
+                            values = [None, symstack[-1].value]
+                        elif plen == 3:
+                            values = [None, symstack[-3].value, symstack[-2].value, symstack[-1].value]
+                        elif plen == 4:
+                            values = [None, symstack[-4].value, symstack[-3].value, symstack[-2].value, symstack[-1].value]
+                        elif plen == 2:
+                            values = [None, symstack[-2].value, symstack[-1].value]
+                        elif plen == 5:
+                            values = [None, symstack[-5].value, symstack[-4].value, symstack[-3].value, symstack[-2].value, symstack[-1].value]
+                        else:
+                            values = [None]
+                        try:
+                            if plen:
+                                del symstack[-plen:]
+                                del statestack[-plen:]
+                            funcs[rule](values)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym = newsymbol()
+                            sym.type = 'error'
+                            sym.value = values[0]
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                            continue
+                        sym = newsymbol()
+                        sym.type = pname
+                        sym.value = values[0]
+                        symstack.append(sym)
+                        state = goto[statestack[-1] * nnonterm + prodgoto[rule]]
+                        statestack.append(state)
+                        continue
+
+                    sym = newsymbol()
+                    sym.type = pname       # Production name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            del statestack[-plen:]
+                            funcs[rule](pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1] * nnonterm + prodgoto[rule]]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                    else:
+                        pslice.slice = [sym]
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            funcs[rule](pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1] * nnonterm + prodgoto[rule]]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                if t == 0:
+                    n = symstack[-1]
+                    result = getattr(n, 'value', None)
+                    return result
+
+            if t is None:
+                # Syntax error: the same recovery as yacc.LRParser.parsedebug()
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == '$end':
+                        errtoken = None               # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, 'lexer'):
+                            errtoken.lexer = lexer
+                        tok = yacc.call_errorfunc(self.errorfunc, errtoken, self)
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, 'lineno'):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                            else:
+                                sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                        else:
+                            sys.stderr.write('yacc: Parse error in input. EOF\n')
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  The whole
+                # parse has been rolled back: discard the token and go on.
+                if len(statestack) <= 1 and lookahead.type != '$end':
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+                if lookahead.type == '$end':
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != 'error':
+                    sym = symstack[-1]
+                    if sym.type == 'error':
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = newsymbol()
+                    t.type = 'error'
+
+                    if hasattr(lookahead, 'lineno'):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, 'lexpos'):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                else:
+                    sym = symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # Call an error function here
+            raise RuntimeError('yacc: internal parser error!!!\n')
@@ -0,0 +1,219 @@
+# Benchmark del analizador léxico y del analizador sintáctico.
+#
+# Para cada tipo de programa sintético (ver generador.py) y cada fase
+# (léxica y sintáctica) mide:
+#   - tiempo de carga de las tablas (construcción del lexer con lex.lex() y
+#     carga del parser con yacc.yacc())
+#   - tokens por segundo y, en la fase sintáctica, reducciones por segundo
+#   - pico de memoria residente (RSS) del proceso
+# Cada medida se hace en un proceso nuevo, para que la carga de tablas y el
+# pico de RSS sean los de esa fase y no los de las anteriores.
+#
+# Los resultados se pueden guardar en JSON (-o) y comparar con los de otro
+# commit (--comparar).
+#
+# Con --dfa el analizador léxico usa el autómata de ply/lexdfa.py en lugar de
+# las expresiones regulares.
+#
+# Uso: python benchmarks/bench_analizador.py [--escala 1.0] [--repeticiones 3] [--dfa]
+#                                            [-o resultados.json] [--comparar anterior.json]
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+DIRECTORIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIRECTORIO)
+
+from generador import GENERADORES, generar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FASES = ('lexico', 'sintactico')
+
+# Tamaño de cada tipo de programa con --escala 1
+TAMANOS = {
+    'anidado': 1000,
+    'largo': 20000,
+    'procedimientos': 500,
+    'expresiones': 5000,
+}
+
+
+# Pico de memoria residente del proceso en KiB (None si no se puede saber)
+def picoRss():
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico // 1024 if sys.platform == 'darwin' else pico  # macOS lo da en bytes
+
+
+def mejorTiempo(funcion, repeticiones):
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        duracion = time.perf_counter() - inicio
+        if mejor is None or duracion < mejor:
+            mejor = duracion
+    return mejor
+
+
+# Cuenta las reducciones de un análisis envolviendo las acciones de las reglas
+def contarReducciones(parser, analizar, fuente):
+    contador = [0]
+
+    def envolver(accion):
+        def envoltura(p):
+            contador[0] += 1
+            return accion(p)
+        return envoltura
+
+    originales = [produccion.callable for produccion in parser.productions]
+    for produccion in parser.productions:
+        if produccion.callable:
+            produccion.callable = envolver(produccion.callable)
+    try:
+        analizar(fuente)
+    finally:
+        for produccion, accion in zip(parser.productions, originales):
+            produccion.callable = accion
+    return contador[0]
+
+
+# Mide una fase con un programa. Se ejecuta en el proceso hijo.
+def medirFase(fase, tipo, n, repeticiones, dfa=False):
+    inicio = time.perf_counter()
+    import AnalizadorLexico
+    if dfa:
+        AnalizadorLexico.analizador.builddfa()
+    cargaLexico = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    import AnalizadorSintactico
+    cargaSintactico = time.perf_counter() - inicio
+
+    fuente = generar(tipo, n)
+    lexer = AnalizadorLexico.analizador
+
+    def tokenizar():
+        lexer.input(fuente)
+        lexer.lineno = 1
+        return sum(1 for _ in lexer)
+
+    ntokens = tokenizar()
+    resultado = {
+        'fase': fase,
+        'programa': tipo,
+        'n': n,
+        'caracteres': len(fuente),
+        'tokens': ntokens,
+        'dfa': dfa,
+    }
+    rssInicial = picoRss()
+    if fase == 'lexico':
+        segundos = mejorTiempo(tokenizar, repeticiones)
+        resultado['carga_tablas_s'] = cargaLexico
+    else:
+        analizar = AnalizadorSintactico.analizar
+        resultado['reducciones'] = contarReducciones(AnalizadorSintactico.parser, analizar, fuente)
+        if AnalizadorSintactico.errores or AnalizadorSintactico.erroresLexicos:
+            raise RuntimeError(f'El programa {tipo} generado tiene errores')
+        segundos = mejorTiempo(lambda: analizar(fuente), repeticiones)
+        resultado['carga_tablas_s'] = cargaSintactico
+        resultado['reducciones_s'] = resultado['reducciones'] / segundos
+    resultado['segundos'] = segundos
+    resultado['tokens_s'] = ntokens / segundos
+    resultado['rss_inicial_kib'] = rssInicial
+    resultado['rss_pico_kib'] = picoRss()
+    return resultado
+
+
+def commitActual():
+    try:
+        salida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DIRECTORIO,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return salida.stdout.strip()
+
+
+def ejecutarEnHijo(fase, tipo, n, repeticiones, dfa):
+    orden = [sys.executable, os.path.abspath(__file__), '--interno', fase, tipo, str(n), str(repeticiones),
+             str(int(dfa))]
+    salida = subprocess.run(orden, cwd=DIRECTORIO, capture_output=True, text=True)
+    if salida.returncode != 0:
+        raise RuntimeError(f'Falló la medida {fase}/{tipo}:\n{salida.stderr}')
+    return json.loads(salida.stdout.splitlines()[-1])
+
+
+def formato(valor, patron):
+    return '-' if valor is None else format(valor, patron)
+
+
+def mostrar(resultados, anteriores=None):
+    previos = {}
+    for r in anteriores or []:
+        previos[r['fase'], r['programa']] = r
+    print(f"{'fase':<11} {'programa':<15} {'tokens':>8} {'tokens/s':>11} {'reducc./s':>11} "
+          f"{'carga (ms)':>10} {'RSS pico (KiB)':>14}" + ('  vs. anterior' if anteriores else ''))
+    for r in resultados:
+        linea = (f"{r['fase']:<11} {r['programa']:<15} {r['tokens']:>8d} {r['tokens_s']:>11,.0f} "
+                 f"{formato(r.get('reducciones_s'), '>11,.0f'):>11} {r['carga_tablas_s'] * 1000:>10.1f} "
+                 f"{formato(r['rss_pico_kib'], '>14d'):>14}")
+        previo = previos.get((r['fase'], r['programa']))
+        if previo is not None:
+            linea += f"  {r['tokens_s'] / previo['tokens_s']:>6.2f}x"
+        print(linea)
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Benchmark del analizador léxico y sintáctico')
+    argumentos.add_argument('--escala', type=float, default=1.0, help='Multiplica el tamaño de los programas')
+    argumentos.add_argument('--repeticiones', type=int, default=3, help='Ejecuciones por medida (se toma la mejor)')
+    argumentos.add_argument('--programas', nargs='+', choices=sorted(GENERADORES), default=list(GENERADORES),
+                            help='Tipos de programa que se miden')
+    argumentos.add_argument('--dfa', action='store_true', help='Analizador léxico con autómata (DFA)')
+    argumentos.add_argument('-o', '--salida', help='Guarda los resultados en este archivo JSON')
+    argumentos.add_argument('--comparar', help='Archivo JSON de una ejecución anterior para comparar')
+    opciones = argumentos.parse_args()
+
+    resultados = []
+    for tipo in opciones.programas:
+        n = max(1, int(TAMANOS[tipo] * opciones.escala))
+        for fase in FASES:
+            resultados.append(ejecutarEnHijo(fase, tipo, n, opciones.repeticiones, opciones.dfa))
+
+    anteriores = None
+    if opciones.comparar:
+        with open(opciones.comparar, encoding='utf-8') as fp:
+            anteriores = json.load(fp)['resultados']
+    mostrar(resultados, anteriores)
+
+    if opciones.salida:
+        informe = {
+            'commit': commitActual(),
+            'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'escala': opciones.escala,
+            'repeticiones': opciones.repeticiones,
+            'resultados': resultados,
+        }
+        with open(opciones.salida, 'w', encoding='utf-8') as fp:
+            json.dump(informe, fp, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 7 and sys.argv[1] == '--interno':
+        # Proceso hijo: mide una fase y escribe el resultado como JSON
+        fase, tipo, n, repeticiones, dfa = sys.argv[2], sys.argv[3], int(sys.argv[4]), int(sys.argv[5]), sys.argv[6]
+        print(json.dumps(medirFase(fase, tipo, n, repeticiones, dfa == '1')))
+    else:
+        main()
@@ -0,0 +1,90 @@
+# Benchmark del análisis incremental (AnalisisIncremental.py).
+#
+# Sobre un programa sintético 'largo' (ver generador.py) se abre una
+# SesionIncremental y se mide el tiempo desde cada edición hasta tener sus
+# errores, comparado con volver a analizar el texto entero con analizar():
+#   caracter    - cambia un número dentro de una sentencia y lo deshace
+#   escritura   - escribe una sentencia nueva tecla a tecla en mitad del
+#                 programa (los pasos intermedios tienen errores)
+#   declaracion - añade una variable a la declaración del programa principal
+# De cada edición se toma la peor latencia de todas las repeticiones.
+#
+# Uso: python benchmarks/bench_incremental.py [--lineas 50000] [--repeticiones 5]
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generador import generar
+import AnalizadorSintactico
+from AnalisisIncremental import SesionIncremental
+
+
+def editarCaracter(sesion):
+    posicion = sesion.texto.index(':=', len(sesion.texto) // 2) + 3
+    yield posicion, posicion, '1'
+    yield posicion, posicion + 1, ''
+
+
+def editarEscritura(sesion):
+    posicion = sesion.texto.index(';', len(sesion.texto) // 2) + 1
+    for i, tecla in enumerate(' nueva := 1;'):
+        yield posicion + i, posicion + i, tecla
+    yield posicion, posicion + len(' nueva := 1;'), ''
+
+
+def editarDeclaracion(sesion):
+    posicion = sesion.texto.index('var') + 4
+    yield posicion, posicion, 'nueva, '
+    yield posicion, posicion + len('nueva, '), ''
+
+
+EDICIONES = [
+    ('caracter', editarCaracter),
+    ('escritura', editarEscritura),
+    ('declaracion', editarDeclaracion),
+]
+
+
+def medir(sesion, ediciones, repeticiones):
+    peor = 0.0
+    total = 0
+    for _ in range(repeticiones):
+        for inicio, fin, texto in list(ediciones(sesion)):
+            comienzo = time.perf_counter()
+            sesion.editar(inicio, fin, texto)
+            peor = max(peor, time.perf_counter() - comienzo)
+            total += 1
+    return total, peor
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Benchmark del análisis incremental')
+    argumentos.add_argument('--lineas', type=int, default=50000, help='Líneas del programa generado')
+    argumentos.add_argument('--repeticiones', type=int, default=5, help='Veces que se repite cada edición')
+    opciones = argumentos.parse_args()
+
+    fuente = generar('largo', opciones.lineas)
+    comienzo = time.perf_counter()
+    AnalizadorSintactico.analizar(fuente)
+    completo = time.perf_counter() - comienzo
+    comienzo = time.perf_counter()
+    sesion = SesionIncremental(fuente)
+    inicial = time.perf_counter() - comienzo
+    resultados = [(nombre, medir(sesion, ediciones, opciones.repeticiones)) for nombre, ediciones in EDICIONES]
+    if sesion.texto != fuente or sesion.errores:
+        raise RuntimeError('Las ediciones no han dejado el programa como estaba')
+
+    print(f'{fuente.count(chr(10)) + 1} líneas, {len(fuente)} caracteres')
+    print(f'analizar() completo: {completo * 1000:10.1f} ms')
+    print(f'sesión inicial:      {inicial * 1000:10.1f} ms')
+    print(f"{'edición':<15} {'ediciones':>10} {'peor ms':>10} {'completo/peor':>14}")
+    for nombre, (total, peor) in resultados:
+        print(f'{nombre:<15} {total:>10d} {peor * 1000:>10.2f} {completo / peor:>13.0f}x')
+
+
+if __name__ == '__main__':
+    main()
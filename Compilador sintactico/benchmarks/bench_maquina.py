@@ -0,0 +1,98 @@
+# Benchmark de la máquina virtual de código P.
+#
+# Compila varios programas PL/0 con bucles intensivos y mide cuántas
+# instrucciones por segundo ejecuta la máquina virtual.
+#
+# Con --sin-optimizar los programas se compilan sin plegar las constantes.
+#
+# Uso: python benchmarks/bench_maquina.py [--n 300] [--repeticiones 3] [--sin-optimizar]
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AnalizadorSintactico import analizarConErrores
+from GeneradorCodigo import generar
+from MaquinaVirtual import MaquinaVirtual
+
+# Bucles anidados con aritmética
+BUCLES = '''
+var i, j, s;
+begin
+  i := 0; s := 0;
+  while i < {n} do begin
+    j := 0;
+    while j < {n} do begin
+      s := s + i * j - (i / 3);
+      j := j + 1
+    end;
+    i := i + 1
+  end
+end
+'''
+
+# Llamadas a procedimiento dentro de un bucle (CAL, INT, retorno y accesos no locales)
+LLAMADAS = '''
+var i, s;
+procedure incrementa;
+  var k;
+  begin k := i; s := s + k; i := i + 1 end;
+begin
+  i := 0; s := 0;
+  while i < {n} * {n} do call incrementa
+end
+'''
+
+# Secuencias de Collatz: condiciones con odd, división y saltos
+COLLATZ = '''
+var i, n, m, t, pasos;
+begin
+  i := 1; pasos := 0;
+  while i <= {n} * 4 do begin
+    n := i;
+    while n <> 1 do begin
+      m := n / 2;
+      if odd n then t := 3 * n + 1;
+      if m * 2 = n then t := m;
+      n := t;
+      pasos := pasos + 1
+    end;
+    i := i + 1
+  end
+end
+'''
+
+PROGRAMAS = [('bucles', BUCLES), ('llamadas', LLAMADAS), ('collatz', COLLATZ)]
+
+
+def medir(fuente, repeticiones, optimizar=True):
+    maquina = MaquinaVirtual(generar(*analizarConErrores(fuente), optimizar=optimizar))
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        maquina.ejecutar()
+        duracion = time.perf_counter() - inicio
+        if mejor is None or duracion < mejor:
+            mejor = duracion
+    return maquina.pasos, mejor
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Benchmark de la máquina virtual de código P')
+    argumentos.add_argument('--n', type=int, default=300, help='Tamaño de los bucles')
+    argumentos.add_argument('--repeticiones', type=int, default=3, help='Ejecuciones por programa (se toma la mejor)')
+    argumentos.add_argument('--sin-optimizar', action='store_true', help='Compila sin el optimizador')
+    opciones = argumentos.parse_args()
+
+    print(f"{'programa':<10} {'instrucciones':>14} {'segundos':>10} {'instr/s':>14}")
+    for nombre, plantilla in PROGRAMAS:
+        pasos, duracion = medir(plantilla.format(n=opciones.n), opciones.repeticiones,
+                                not opciones.sin_optimizar)
+        print(f'{nombre:<10} {pasos:>14d} {duracion:>10.3f} {pasos / duracion:>14,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# Benchmark del analizador sintáctico solo, sin el léxico.
+#
+# Cada programa sintético (ver generador.py) se convierte primero en una lista
+# de tokens con tokenize_all(); después se mide únicamente el bucle del parser
+# LALR sobre esa lista con tres variantes:
+#   dict     - parseopt_notrack(): tablas de diccionarios, acciones por nombre
+#   denso    - parsedense() con tokens sin marcar: el parser busca el número
+#              de cada tipo de token por su nombre
+#   marcado  - parsedense() con tokens marcados por el analizador léxico con
+#              el número de su tipo (analizador.settypeids(parser.termids))
+#   generado - parsegenerated() de ParserGenerado.py, con tokens marcados
+#              (solo si AnalizadorSintactico ha cargado ese módulo)
+# Las variantes se ejecutan intercaladas y se toma el mejor tiempo de cada una.
+#
+# Con --sin-acciones las reglas de la gramática no construyen el AST, de modo
+# que el tiempo medido es casi todo del propio parser.
+#
+# Uso: python benchmarks/bench_parser.py [--escala 1.0] [--repeticiones 5] [--sin-acciones]
+
+import os
+import sys
+import time
+import argparse
+import functools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generador import GENERADORES, generar
+import AnalizadorSintactico
+from AnalizadorSintactico import analizador, parser
+
+# Tamaño de cada tipo de programa con --escala 1
+TAMANOS = {
+    'anidado': 2000,
+    'largo': 40000,
+    'procedimientos': 1000,
+    'expresiones': 10000,
+}
+
+VARIANTES = [
+    ('dict', parser.parseopt_notrack, None),
+    ('denso', parser.parsedense, None),
+    ('marcado', parser.parsedense, parser.termids),
+]
+if hasattr(parser, 'parsegenerated'):
+    VARIANTES.append(('generado', parser.parsegenerated, parser.termids))
+
+
+def listaTokens(fuente, typeids):
+    analizador.settypeids(typeids)
+    analizador.input(fuente)
+    analizador.lineno = 1
+    return analizador.tokenize_all()
+
+
+def analizarTokens(analizar, tokens):
+    del AnalizadorSintactico.errores[:]
+    inicio = time.perf_counter()
+    analizar(lexer=analizador, tokenfunc=functools.partial(next, iter(tokens), None))
+    return time.perf_counter() - inicio
+
+
+def medir(fuente, repeticiones):
+    listas = [listaTokens(fuente, typeids) for _, _, typeids in VARIANTES]
+    mejores = [None] * len(VARIANTES)
+    for _ in range(repeticiones):
+        for i, (_, analizar, typeids) in enumerate(VARIANTES):
+            analizador.settypeids(typeids)  # El parser comprueba si el léxico marca los tokens
+            duracion = analizarTokens(analizar, listas[i])
+            if mejores[i] is None or duracion < mejores[i]:
+                mejores[i] = duracion
+    if AnalizadorSintactico.errores:
+        raise RuntimeError('El programa generado tiene errores')
+    return len(listas[0]), mejores
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Benchmark del analizador sintáctico sin el léxico')
+    argumentos.add_argument('--escala', type=float, default=1.0, help='Multiplica el tamaño de los programas')
+    argumentos.add_argument('--repeticiones', type=int, default=5, help='Ejecuciones por medida (se toma la mejor)')
+    argumentos.add_argument('--programas', nargs='+', choices=sorted(GENERADORES), default=list(GENERADORES),
+                            help='Tipos de programa que se miden')
+    argumentos.add_argument('--sin-acciones', action='store_true',
+                            help='Sustituye las acciones de las reglas por una función vacía')
+    opciones = argumentos.parse_args()
+
+    originales = [produccion.callable for produccion in parser.productions]
+    if opciones.sin_acciones:
+        for produccion in parser.productions:
+            if produccion.callable:
+                produccion.callable = lambda p: None
+
+    typeidsOriginal = analizador.lextypeids
+    print(f"{'programa':<15} {'tokens':>8}" + ''.join(f' {nombre + " tok/s":>14}' for nombre, _, _ in VARIANTES)
+          + f" {VARIANTES[-1][0] + '/dict':>14}")
+    try:
+        for tipo in opciones.programas:
+            n = max(1, int(TAMANOS[tipo] * opciones.escala))
+            ntokens, mejores = medir(generar(tipo, n), opciones.repeticiones)
+            print(f'{tipo:<15} {ntokens:>8d}' + ''.join(f' {ntokens / s:>14,.0f}' for s in mejores)
+                  + f' {mejores[0] / mejores[-1]:>13.2f}x')
+    finally:
+        analizador.settypeids(typeidsOriginal)
+        for produccion, accion in zip(parser.productions, originales):
+            produccion.callable = accion
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# Benchmark de los tokens y símbolos con __slots__ de PLY.
+#
+# Analiza un programa PL/0 grande dos veces: con las clases LexToken y
+# YaccSymbol (con __slots__) y con DictLexToken y DictYaccSymbol (con
+# diccionario por instancia, como antes). Muestra la memoria que ocupa la
+# lista de tokens y la velocidad del análisis léxico y sintáctico.
+#
+# Uso: python benchmarks/bench_slots.py [--sentencias 20000] [--repeticiones 3]
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ply.lex as lex
+import ply.yacc as yacc
+import AnalizadorSintactico
+from AnalizadorSintactico import analizador, parser
+
+VARIANTES = [
+    ('slots', lex.LexToken, yacc.YaccSymbol),
+    ('dict', lex.DictLexToken, yacc.DictYaccSymbol),
+]
+
+
+# Programa PL/0 con el número de sentencias indicado
+def generarPrograma(sentencias):
+    lineas = ['var a, b, c, d;', 'begin', '  a := 1; b := 2; c := 3; d := 0']
+    for i in range(sentencias):
+        if i % 4 == 3:
+            lineas.append(f'  ; while a < {i} do begin a := a + (b * {i % 7 + 1}) - c / 2; d := d + 1 end')
+        else:
+            lineas.append(f'  ; if b <> {i} then c := (a + {i}) * b - d')
+    lineas.append('end')
+    return '\n'.join(lineas)
+
+
+def mejorTiempo(funcion, repeticiones):
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        duracion = time.perf_counter() - inicio
+        if mejor is None or duracion < mejor:
+            mejor = duracion
+    return mejor
+
+
+def listaTokens(fuente):
+    analizador.input(fuente)
+    return list(analizador)
+
+
+def medir(fuente, repeticiones):
+    # Memoria ocupada por la lista con todos los tokens
+    tracemalloc.start()
+    tokens = listaTokens(fuente)
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    ntokens = len(tokens)
+    del tokens
+
+    lexico = mejorTiempo(lambda: listaTokens(fuente), repeticiones)
+    sintactico = mejorTiempo(lambda: AnalizadorSintactico.analizar(fuente), repeticiones)
+    return ntokens, memoria, lexico, sintactico
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Benchmark de LexToken y YaccSymbol con __slots__')
+    argumentos.add_argument('--sentencias', type=int, default=20000, help='Sentencias del programa generado')
+    argumentos.add_argument('--repeticiones', type=int, default=3, help='Ejecuciones por medida (se toma la mejor)')
+    opciones = argumentos.parse_args()
+
+    fuente = generarPrograma(opciones.sentencias)
+    print(f"{'variante':<9} {'tokens':>9} {'bytes/token':>12} {'tokens/s':>12} {'análisis (s)':>13}")
+    try:
+        for nombre, claseToken, claseSimbolo in VARIANTES:
+            analizador.lextokenclass = claseToken
+            parser.symbolclass = claseSimbolo
+            ntokens, memoria, lexico, sintactico = medir(fuente, opciones.repeticiones)
+            print(f'{nombre:<9} {ntokens:>9d} {memoria / ntokens:>12.1f} {ntokens / lexico:>12,.0f} {sintactico:>13.3f}')
+    finally:
+        analizador.lextokenclass = lex.LexToken
+        parser.symbolclass = yacc.YaccSymbol
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# Benchmark de la generación de las tablas LALR.
+#
+# Mide lo que tarda ply.yacc.LRGeneratedTable en construir las tablas de:
+#   pl0       - la gramática de AnalizadorSintactico.py
+#   ampliada  - una gramática sintética de un PL/0 más grande (tipos array y
+#               record, funciones con parámetros, else, read/write...) con n
+#               niveles de precedencia de operadores binarios y n sentencias
+#               con palabra reservada propia. El número de estados y el tamaño
+#               de los conjuntos de items crecen con n.
+# Para cada gramática se muestran los estados, los conflictos y un resumen
+# (MD5) de las tablas, que permite comprobar que dos versiones de ply/yacc.py
+# generan exactamente las mismas.
+#
+# Uso: python benchmarks/bench_tablas.py [--tamanos 10 40 80 160] [--metodo LALR]
+#                                        [--repeticiones 1]
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ply import yacc
+
+
+# Producciones de la gramática ampliada de tamaño n, como (nombre, símbolos)
+def produccionesAmpliada(n):
+    producciones = []
+
+    def regla(nombre, *alternativas):
+        for alternativa in alternativas:
+            producciones.append((nombre, alternativa.split()))
+
+    regla('program', 'block')
+    regla('block', 'constDecl varDecl typeDecl procList statement')
+    regla('constDecl', 'CONST constList SEMICOLON', 'empty')
+    regla('constList', 'ID EQ NUMBER', 'constList COMMA ID EQ NUMBER')
+    regla('varDecl', 'VAR varList SEMICOLON', 'empty')
+    regla('varList', 'varItem', 'varList COMMA varItem')
+    regla('varItem', 'ID', 'ID COLON type')
+    regla('type', 'ID', 'ARRAY LBRACKET NUMBER RBRACKET OF type', 'RECORD fieldList END')
+    regla('fieldList', 'field', 'fieldList SEMICOLON field')
+    regla('field', 'ID COLON type')
+    regla('typeDecl', 'TYPE ID EQ type SEMICOLON', 'empty')
+    regla('procList', 'procList procDecl', 'empty')
+    regla('procDecl', 'PROCEDURE ID params SEMICOLON block SEMICOLON',
+          'FUNCTION ID params COLON type SEMICOLON block SEMICOLON')
+    regla('params', 'LPARENT paramList RPARENT', 'empty')
+    regla('paramList', 'ID', 'paramList COMMA ID')
+    regla('statement', 'designator ASSIGN expr0', 'CALL ID args', 'BEGIN statementList END',
+          'IF condition THEN statement', 'IF condition THEN statement ELSE statement',
+          'WHILE condition DO statement', 'READ LPARENT designator RPARENT',
+          'WRITE LPARENT exprList RPARENT', 'RETURN expr0', 'empty')
+    for i in range(n):
+        regla('statement', f'KEYWORD{i} condition DO statement')
+    regla('statementList', 'statement', 'statementList SEMICOLON statement')
+    regla('designator', 'ID', 'designator LBRACKET expr0 RBRACKET', 'designator DOT ID')
+    regla('condition', 'ODD expr0', 'expr0 RELATION expr0')
+    for i in range(n):
+        regla(f'expr{i}', f'expr{i} OPERATOR{i} expr{i + 1}', f'expr{i + 1}')
+    regla(f'expr{n}', 'designator', 'NUMBER', 'LPARENT expr0 RPARENT', 'ID LPARENT exprList RPARENT')
+    regla('args', 'LPARENT exprList RPARENT', 'empty')
+    regla('exprList', 'expr0', 'exprList COMMA expr0')
+    regla('empty', '')
+    return producciones
+
+
+def gramaticaAmpliada(n):
+    producciones = produccionesAmpliada(n)
+    nombres = set(nombre for nombre, _ in producciones)
+    tokens = sorted(set(s for _, simbolos in producciones for s in simbolos if s not in nombres))
+    gramatica = yacc.Grammar(tokens)
+    for linea, (nombre, simbolos) in enumerate(producciones, 1):
+        gramatica.add_production(nombre, simbolos, f'p_{linea}', 'bench_tablas.py', linea)
+    gramatica.set_start('program')
+    return gramatica
+
+
+# La gramática de AnalizadorSintactico.py, leída como lo hace yacc.yacc()
+def gramaticaPl0():
+    import AnalizadorSintactico
+    info = yacc.ParserReflect(dict(vars(AnalizadorSintactico)), log=yacc.NullLogger())
+    info.get_all()
+    info.validate_all()
+    gramatica = yacc.Grammar(info.tokens)
+    for simbolo, asociatividad, nivel in info.preclist:
+        gramatica.set_precedence(simbolo, asociatividad, nivel)
+    for nombreFuncion, (archivo, linea, nombre, simbolos) in info.grammar:
+        gramatica.add_production(nombre, simbolos, nombreFuncion, archivo, linea)
+    gramatica.set_start(info.start)
+    return gramatica
+
+
+def resumenTablas(tablas):
+    estados = range(len(tablas.lr_action))
+    contenido = [sorted(tablas.lr_action[e].items()) for e in estados]
+    contenido += [sorted(tablas.lr_goto[e].items()) for e in estados]
+    return hashlib.md5(json.dumps(contenido).encode('utf-8')).hexdigest()[:12]
+
+
+def medir(crearGramatica, metodo, repeticiones):
+    mejor = None
+    for _ in range(repeticiones):
+        gramatica = crearGramatica()  # Las tablas se generan sobre una gramática nueva cada vez
+        inicio = time.perf_counter()
+        tablas = yacc.LRGeneratedTable(gramatica, metodo)
+        duracion = time.perf_counter() - inicio
+        if mejor is None or duracion < mejor:
+            mejor = duracion
+    return tablas, mejor
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Benchmark de la generación de las tablas LALR')
+    argumentos.add_argument('--tamanos', type=int, nargs='+', default=[10, 40, 80, 160],
+                            help='Tamaños n de la gramática ampliada')
+    argumentos.add_argument('--metodo', choices=['LALR', 'SLR'], default='LALR')
+    argumentos.add_argument('--repeticiones', type=int, default=1, help='Ejecuciones por medida (se toma la mejor)')
+    opciones = argumentos.parse_args()
+
+    gramaticas = [('pl0', gramaticaPl0)]
+    gramaticas += [(f'ampliada {n}', lambda n=n: gramaticaAmpliada(n)) for n in opciones.tamanos]
+
+    print(f"{'gramática':<15} {'reglas':>7} {'estados':>8} {'segundos':>9} {'s/r':>4} {'r/r':>4}  tablas")
+    for nombre, crearGramatica in gramaticas:
+        tablas, segundos = medir(crearGramatica, opciones.metodo, opciones.repeticiones)
+        print(f'{nombre:<15} {len(tablas.lr_productions) - 1:>7d} {len(tablas.lr_action):>8d} {segundos:>9.3f}'
+              f' {len(tablas.sr_conflicts):>4d} {len(tablas.rr_conflicts):>4d}  {resumenTablas(tablas)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Generador de programas PL/0 sintéticos para los benchmarks.
+#
+# Cada función recibe un tamaño n y devuelve el código fuente de un programa
+# válido para la gramática de AnalizadorSintactico.py:
+#   anidado          - n sentencias while/if anidadas unas dentro de otras
+#   largo            - una lista de n sentencias en un único begin ... end
+#   procedimientos   - n procedimientos (la gramática solo admite uno por
+#                      bloque, así que cada uno se declara dentro del anterior)
+#   expresiones      - asignaciones con expresiones de n términos
+#
+# Uso: python benchmarks/generador.py TIPO N > programa.pl0
+
+import sys
+
+VARIABLES = 'var a, b, c, d;'
+
+
+def generarAnidado(n):
+    lineas = [VARIABLES, 'begin', 'a := 0; b := 1;']
+    for i in range(n):
+        if i % 2:
+            lineas.append(f'if a < {i} then')
+        else:
+            lineas.append(f'while b <> {i} do')
+    lineas.append('begin a := a + 1; b := b * 2 end')
+    lineas.append('end')
+    return '\n'.join(lineas)
+
+
+def generarLargo(n):
+    sentencias = []
+    for i in range(n):
+        if i % 5 == 4:
+            sentencias.append(f'  while a < {i} do a := a + 1')
+        elif i % 5 == 3:
+            sentencias.append(f'  if odd b then c := c - {i}')
+        else:
+            sentencias.append(f'  {"abcd"[i % 4]} := a + {i} * b - c / 3')
+    return '\n'.join([VARIABLES, 'begin', ';\n'.join(sentencias), 'end'])
+
+
+def generarProcedimientos(n):
+    lineas = [VARIABLES]
+    for i in range(n):
+        lineas.append(f'procedure p{i};')
+        lineas.append(f'  var x{i};')
+    # Los bloques se cierran del más interno al más externo
+    for i in reversed(range(n)):
+        lineas.append(f'  begin x{i} := a + {i}; b := x{i} * 2; call p{i} end;')
+    lineas.append('begin a := 1; call p0 end' if n else 'begin a := 1 end')
+    return '\n'.join(lineas)
+
+
+def generarExpresiones(n):
+    sentencias = []
+    operadores = '+-*/'
+    for k in range(4):
+        terminos = []
+        for i in range(n):
+            if i % 7 == 6:
+                terminos.append(f'({"abcd"[i % 4]} - {i})')
+            else:
+                terminos.append(str(i + 1) if i % 2 else 'abcd'[(i + k) % 4])
+        expresion = terminos[0]
+        for i, termino in enumerate(terminos[1:]):
+            expresion += f' {operadores[(i + k) % 4]} {termino}'
+        sentencias.append(f'  {"abcd"[k]} := {expresion}')
+    return '\n'.join([VARIABLES, 'begin', ';\n'.join(sentencias), 'end'])
+
+
+GENERADORES = {
+    'anidado': generarAnidado,
+    'largo': generarLargo,
+    'procedimientos': generarProcedimientos,
+    'expresiones': generarExpresiones,
+}
+
+
+def generar(tipo, n):
+    return GENERADORES[tipo](n)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] not in GENERADORES:
+        print(f'Uso: python generador.py {{{"|".join(GENERADORES)}}} N', file=sys.stderr)
+        sys.exit(1)
+    print(generar(sys.argv[1], int(sys.argv[2])))
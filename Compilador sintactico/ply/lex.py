@@ -40,6 +40,9 @@ import types
 import copy
 import os
 import inspect
+import bisect
+import codecs
+from array import array
 
 # This tuple contains known string types
 try:
@@ -52,6 +55,9 @@ except AttributeError:
 # This regular expression is used to match valid token names
 _is_identifier = re.compile(r'^[a-zA-Z0-9_]+$')
 
+# Number of bytes of binary input passed to t_error() as the token value
+_binary_error_context = 64
+
 # Exception thrown when invalid token encountered and no default error
 # handler is defined.
 class LexError(Exception):
@@ -60,8 +66,13 @@ class LexError(Exception):
         self.text = s
 
 
-# Token class.  This class is used to represent the tokens produced.
+# Token class.  It uses __slots__, so there is no per-instance dictionary;
+# this matters because one is created for every token of the input.  Code
+# that needs to attach other attributes to tokens can set a lexer's
+# lextokenclass to DictLexToken.
 class LexToken(object):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer', 'typeid')
+
     def __str__(self):
         return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
 
@@ -69,6 +80,111 @@ class LexToken(object):
         return str(self)
 
 
+# LexToken that also accepts arbitrary attributes
+class DictLexToken(LexToken):
+    pass
+
+
+# -----------------------------------------------------------------------------
+#                        === Columnar token buffer ===
+#
+# Compact storage for all of the tokens of an input.  Instead of one LexToken
+# per token, the type id, start offset, end offset and line number are kept
+# in parallel array('I') columns.  Values are sliced from the input only when
+# they are asked for; the few values that rule functions replace (e.g. a
+# number converted to int) are kept in a sparse dictionary.
+#
+# The buffer also has a token() method, so it can be handed to the parser
+# in place of a lexer: parser.parse(lexer=buf)
+# -----------------------------------------------------------------------------
+
+class TokenBuffer(object):
+    def __init__(self, lexdata, encoding='utf-8'):
+        self.lexdata = lexdata
+        self.lexbinary = not isinstance(lexdata, str)
+        self.lexencoding = encoding
+        self.types = []            # Type names, indexed by type id
+        self.typeids = {}          # Type name -> type id
+        self.type = array('I')     # Type id of each token
+        self.start = array('I')    # Offset of the first character
+        self.end = array('I')      # Offset just past the last character
+        self.line = array('I')     # Line number
+        self.values = {}           # Token index -> value that differs from the source text
+        self.index = 0             # Next token returned by token()
+        self.lineno = 1
+        self.lexpos = 0
+
+    def __len__(self):
+        return len(self.type)
+
+    def typeid(self, name):
+        i = self.typeids.get(name)
+        if i is None:
+            i = self.typeids[name] = len(self.types)
+            self.types.append(name)
+        return i
+
+    # Append a token given by its type name and position
+    def append(self, toktype, start, end, lineno):
+        self.type.append(self.typeid(toktype))
+        self.start.append(start)
+        self.end.append(end)
+        self.line.append(lineno)
+
+    # Append a LexToken produced by a rule function.  end is the lexer
+    # position after the rule returned.
+    def appendtoken(self, tok, end):
+        n = len(self.type)
+        self.append(tok.type, tok.lexpos, end, tok.lineno)
+        if tok.value != self.text(n):
+            self.values[n] = tok.value
+
+    def text(self, n):
+        text = self.lexdata[self.start[n]:self.end[n]]
+        if self.lexbinary:
+            text = text.decode(self.lexencoding)
+        return text
+
+    def gettype(self, n):
+        return self.types[self.type[n]]
+
+    def value(self, n):
+        if n in self.values:
+            return self.values[n]
+        return self.text(n)
+
+    # Materialize token n as a LexToken
+    def __getitem__(self, n):
+        if n < 0:
+            n += len(self.type)
+        tok = LexToken()
+        tok.type = self.types[self.type[n]]
+        tok.value = self.value(n)
+        tok.lineno = self.line[n]
+        tok.lexpos = self.start[n]
+        return tok
+
+    def __iter__(self):
+        for n in range(len(self.type)):
+            yield self[n]
+
+    # Parser interface: return the tokens one at a time
+    def token(self):
+        n = self.index
+        if n >= len(self.type):
+            return None
+        self.index = n + 1
+        tok = self[n]
+        self.lineno = tok.lineno
+        self.lexpos = tok.lexpos
+        return tok
+
+    def rewind(self):
+        self.index = 0
+        self.lineno = 1
+        self.lexpos = 0
+
+
 # This object is a stand-in for a logging object created by the
 # logging module.
 
@@ -140,9 +256,19 @@ class Lexer:
         self.lexmodule = None         # Module
         self.lineno = 1               # Current line number
         self.lexoptimize = False      # Optimized mode
+        self.lextokenclass = LexToken # Class of the tokens created by the lexer
+        self.lexbinary = False        # Input is a bytes-like object (bytes, mmap, ...)
+        self.lexencoding = 'utf-8'    # Encoding used to decode token values of binary input
+        self.lexbinaryre = {}         # Cache of master regexs compiled for binary input
+        self.lexstatedfa = {}         # Dictionary mapping lexer states to DFA scanners (see lexdfa.py)
+        self.lexdfa = None            # DFA scanner of the current state (None: use the regexs)
+        self.lexlineindex = None      # Offsets of the newlines of the input (built by lineindex())
+        self.lextypeids = None        # Integer id of each token type, set on tokens as typeid (see settypeids())
+        self.lexunknownid = None      # Integer id of the token types missing from lextypeids
 
     def clone(self, object=None):
         c = copy.copy(self)
+        c.lexbinaryre = {}
 
         # If the object parameter has been supplied, it means we are attaching the
         # lexer to a new object.  In this case, we have to rebind all methods in
@@ -166,6 +292,9 @@ class Lexer:
             for key, ef in self.lexstateerrorf.items():
                 c.lexstateerrorf[key] = getattr(object, ef.__name__)
             c.lexmodule = object
+            # The automata hold the old rule functions; build them again
+            if self.lexstatedfa:
+                c.builddfa()
         return c
 
     # ------------------------------------------------------------
@@ -247,6 +376,11 @@ class Lexer:
 
     # ------------------------------------------------------------
     # input() - Push a new string into the lexer
+    #
+    # Besides str, any bytes-like object that supports slicing
+    # (bytes, bytearray, mmap.mmap) is accepted.  Binary input is
+    # scanned in place with bytes versions of the master regexs and
+    # only the text of each token is decoded (see binarytoken()).
     # ------------------------------------------------------------
     def input(self, s):
         # Pull off the first character to see if s looks like a string
@@ -256,6 +390,91 @@ class Lexer:
         self.lexdata = s
         self.lexpos = 0
         self.lexlen = len(s)
+        self.lexbinary = not isinstance(s, str)
+        self.lexlineindex = None
+
+    # ------------------------------------------------------------
+    # builddfa() - Compile the rules of every state into a DFA
+    #
+    # Once built, token() scans str input with the automata instead
+    # of the master regexs (see lexdfa.py).  States whose rules use
+    # regex features that have no automaton equivalent keep using
+    # the regexs; a warning is written to errorlog for each one.
+    # Returns True if every state got an automaton.
+    # ------------------------------------------------------------
+    def builddfa(self, errorlog=None):
+        try:
+            from . import lexdfa
+        except ImportError:
+            import lexdfa
+        if errorlog is None:
+            errorlog = PlyLogger(sys.stderr)
+        self.lexstatedfa = {}
+        for state, lexre in self.lexstatere.items():
+            try:
+                self.lexstatedfa[state] = lexdfa.build(lexre)
+            except lexdfa.DFAUnsupported as e:
+                errorlog.warning("No DFA for lexer state '%s': %s", state, e)
+        self.lexdfa = self.lexstatedfa.get(self.lexstate)
+        return len(self.lexstatedfa) == len(self.lexstatere)
+
+    # ------------------------------------------------------------
+    # regexmatch() - Match the master regexs of the current state at pos
+    # ------------------------------------------------------------
+    def regexmatch(self, pos):
+        for lexre, lexindexfunc in self.lexre:
+            m = lexre.match(self.lexdata, pos)
+            if m:
+                return m
+        return None
+
+    # ------------------------------------------------------------
+    # binaryre() - Return (master regexs, ignore, literals) of the
+    # current state for binary input.  They are built on first use.
+    # ------------------------------------------------------------
+    def binaryre(self):
+        entry = self.lexbinaryre.get(self.lexstate)
+        if entry is None:
+            lexre = [(re.compile(cre.pattern.encode(self.lexencoding), cre.flags & ~re.UNICODE), findex)
+                     for cre, findex in self.lexre]
+            entry = (lexre, self.lexignore.encode(self.lexencoding), self.lexliterals.encode(self.lexencoding))
+            self.lexbinaryre[self.lexstate] = entry
+        return entry
+
+    # ------------------------------------------------------------
+    # lineindex() - Return the offsets of all newlines in the input
+    #
+    # The index is built the first time a position is requested, so
+    # lexing itself does not need a t_newline rule to count lines.
+    # ------------------------------------------------------------
+    def lineindex(self):
+        if self.lexlineindex is None:
+            if self.lexdata is None:
+                raise RuntimeError('No input string given with input()')
+            index = array('I')
+            find = self.lexdata.find
+            newline = b'\n' if self.lexbinary else '\n'
+            i = find(newline)
+            while i >= 0:
+                index.append(i)
+                i = find(newline, i + 1)
+            self.lexlineindex = index
+        return self.lexlineindex
+
+    # ------------------------------------------------------------
+    # position() - Return (line, column) of an input offset
+    #
+    # Both start at 1 and are counted from the start of the input
+    # given to input().  The column is in characters, also for binary
+    # input, where lexpos is a byte offset.
+    # ------------------------------------------------------------
+    def position(self, lexpos):
+        index = self.lineindex()
+        n = bisect.bisect_left(index, lexpos)    # Newlines before lexpos
+        start = index[n - 1] + 1 if n else 0
+        if self.lexbinary:
+            return n + 1, len(self.lexdata[start:lexpos].decode(self.lexencoding, 'replace')) + 1
+        return n + 1, lexpos - start + 1
 
     # ------------------------------------------------------------
     # begin() - Changes the lexing state
@@ -268,6 +487,7 @@ class Lexer:
         self.lexignore = self.lexstateignore.get(state, '')
         self.lexerrorf = self.lexstateerrorf.get(state, None)
         self.lexeoff = self.lexstateeoff.get(state, None)
+        self.lexdfa = self.lexstatedfa.get(state)
         self.lexstate = state
 
     # ------------------------------------------------------------
@@ -291,9 +511,37 @@ class Lexer:
 
     # ------------------------------------------------------------
     # skip() - Skip ahead n characters
+    #
+    # For binary input a character may take several bytes, so the
+    # bytes are fed to a decoder until n characters come out.
     # ------------------------------------------------------------
     def skip(self, n):
-        self.lexpos += n
+        if not self.lexbinary:
+            self.lexpos += n
+            return
+        decoder = codecs.getincrementaldecoder(self.lexencoding)()
+        lexpos = self.lexpos
+        while n > 0 and lexpos < self.lexlen:
+            n -= len(decoder.decode(self.lexdata[lexpos:lexpos+1]))
+            lexpos += 1
+        self.lexpos = lexpos
+
+    # ------------------------------------------------------------
+    # settypeids() - Tag the tokens with integer type ids
+    #
+    # Every token returned afterwards has a typeid attribute with the
+    # id of its type in typeids (usually the termids of a parser, see
+    # LRParser.set_dense()).  Types missing from typeids get the id
+    # len(typeids).  settypeids(None) turns tagging off.
+    # ------------------------------------------------------------
+    def settypeids(self, typeids):
+        self.lextypeids = typeids
+        self.lexunknownid = None if typeids is None else len(typeids)
+
+    def tagtoken(self, tok):
+        if tok is not None and self.lextypeids is not None:
+            tok.typeid = self.lextypeids.get(tok.type, self.lexunknownid)
+        return tok
 
     # ------------------------------------------------------------
     # opttoken() - Return the next token from the Lexer
@@ -303,11 +551,18 @@ class Lexer:
     # you are doing
     # ------------------------------------------------------------
     def token(self):
+        if self.lexbinary:
+            return self.tagtoken(self.binarytoken())
+        if self.lexdfa is not None:
+            return self.tagtoken(self.dfatoken())
+
         # Make local copies of frequently referenced attributes
         lexpos    = self.lexpos
         lexlen    = self.lexlen
         lexignore = self.lexignore
         lexdata   = self.lexdata
+        newtoken  = self.lextokenclass
+        typeids   = self.lextypeids
 
         while lexpos < lexlen:
             # This code provides some short-circuit code for whitespace, tabs, and other ignored characters
@@ -322,7 +577,7 @@ class Lexer:
                     continue
 
                 # Create a token for return
-                tok = LexToken()
+                tok = newtoken()
                 tok.value = m.group()
                 tok.lineno = self.lineno
                 tok.lexpos = lexpos
@@ -334,6 +589,8 @@ class Lexer:
                     # If no token type was set, it's an ignored token
                     if tok.type:
                         self.lexpos = m.end()
+                        if typeids is not None:
+                            tok.typeid = typeids.get(tok.type, self.lexunknownid)
                         return tok
                     else:
                         lexpos = m.end()
@@ -362,21 +619,25 @@ class Lexer:
                             func.__code__.co_filename, func.__code__.co_firstlineno,
                             func.__name__, newtok.type), lexdata[lexpos:])
 
+                if typeids is not None:
+                    newtok.typeid = typeids.get(newtok.type, self.lexunknownid)
                 return newtok
             else:
                 # No match, see if in literals
                 if lexdata[lexpos] in self.lexliterals:
-                    tok = LexToken()
+                    tok = newtoken()
                     tok.value = lexdata[lexpos]
                     tok.lineno = self.lineno
                     tok.type = tok.value
                     tok.lexpos = lexpos
                     self.lexpos = lexpos + 1
+                    if typeids is not None:
+                        tok.typeid = typeids.get(tok.type, self.lexunknownid)
                     return tok
 
                 # No match. Call t_error() if defined.
                 if self.lexerrorf:
-                    tok = LexToken()
+                    tok = newtoken()
                     tok.value = self.lexdata[lexpos:]
                     tok.lineno = self.lineno
                     tok.type = 'error'
@@ -390,13 +651,13 @@ class Lexer:
                     lexpos = self.lexpos
                     if not newtok:
                         continue
-                    return newtok
+                    return self.tagtoken(newtok)
 
                 self.lexpos = lexpos
                 raise LexError("Illegal character '%s' at index %d" % (lexdata[lexpos], lexpos), lexdata[lexpos:])
 
         if self.lexeoff:
-            tok = LexToken()
+            tok = newtoken()
             tok.type = 'eof'
             tok.value = ''
             tok.lineno = self.lineno
@@ -404,13 +665,562 @@ class Lexer:
             tok.lexer = self
             self.lexpos = lexpos
             newtok = self.lexeoff(tok)
-            return newtok
+            return self.tagtoken(newtok)
 
         self.lexpos = lexpos + 1
         if self.lexdata is None:
             raise RuntimeError('No input string given with input()')
         return None
 
+    # ------------------------------------------------------------
+    # dfatoken() - Return the next token using the DFA scanner
+    #
+    # Same algorithm as token(), but each token is matched by the
+    # automaton of the current state, which gives the same match as
+    # the master regexs.  The automaton loop is inlined from
+    # lexdfa.DFA.match() for speed.
+    # ------------------------------------------------------------
+    def dfatoken(self):
+        lexpos    = self.lexpos
+        lexlen    = self.lexlen
+        lexignore = self.lexignore
+        lexdata   = self.lexdata
+        newtoken  = self.lextokenclass
+        dfa       = self.lexdfa
+        trans     = dfa.trans
+
+        while lexpos < lexlen:
+            if lexdata[lexpos] in lexignore:
+                lexpos += 1
+                continue
+
+            s = 0
+            pos = lexpos
+            end = -1
+            while pos < lexlen:
+                c = lexdata[pos]
+                try:
+                    s, r = trans[s][c]
+                except KeyError:
+                    s, r = dfa.step(s, c)
+                if s < 0:
+                    break
+                pos += 1
+                if r:
+                    end = pos
+                    rule = r
+
+            if end >= 0:
+                func, toktype = rule
+                if not func:
+                    if toktype:
+                        tok = newtoken()
+                        tok.value = lexdata[lexpos:end]
+                        tok.lineno = self.lineno
+                        tok.lexpos = lexpos
+                        tok.type = toktype
+                        self.lexpos = end
+                        return tok
+                    lexpos = end
+                    continue
+
+                tok = newtoken()
+                tok.value = lexdata[lexpos:end]
+                tok.lineno = self.lineno
+                tok.lexpos = lexpos
+                tok.type = toktype
+                tok.lexer = self
+                self.lexmatch = self.regexmatch(lexpos) if func in dfa.needmatch else None
+                self.lexpos = end
+
+                newtok = func(tok)
+
+                if not newtok:
+                    lexpos    = self.lexpos
+                    lexignore = self.lexignore
+                    if self.lexdfa is not dfa:
+                        # The rule changed the lexer state
+                        dfa = self.lexdfa
+                        if dfa is None:
+                            self.lexpos = lexpos
+                            return self.token()
+                        trans = dfa.trans
+                    continue
+
+                if not self.lexoptimize:
+                    if newtok.type not in self.lextokens_all:
+                        raise LexError("%s:%d: Rule '%s' returned an unknown token type '%s'" % (
+                            func.__code__.co_filename, func.__code__.co_firstlineno,
+                            func.__name__, newtok.type), lexdata[lexpos:])
+
+                return newtok
+
+            # No match, see if in literals
+            if lexdata[lexpos] in self.lexliterals:
+                tok = newtoken()
+                tok.value = lexdata[lexpos]
+                tok.lineno = self.lineno
+                tok.type = tok.value
+                tok.lexpos = lexpos
+                self.lexpos = lexpos + 1
+                return tok
+
+            # No match. Call t_error() if defined.
+            if self.lexerrorf:
+                tok = newtoken()
+                tok.value = lexdata[lexpos:]
+                tok.lineno = self.lineno
+                tok.type = 'error'
+                tok.lexer = self
+                tok.lexpos = lexpos
+                self.lexpos = lexpos
+                newtok = self.lexerrorf(tok)
+                if lexpos == self.lexpos:
+                    raise LexError("Scanning error. Illegal character '%s'" % (lexdata[lexpos]), lexdata[lexpos:])
+                lexpos = self.lexpos
+                lexignore = self.lexignore
+                if self.lexdfa is not dfa:
+                    dfa = self.lexdfa
+                    if dfa is None:
+                        return self.token()
+                    trans = dfa.trans
+                if not newtok:
+                    continue
+                return newtok
+
+            self.lexpos = lexpos
+            raise LexError("Illegal character '%s' at index %d" % (lexdata[lexpos], lexpos), lexdata[lexpos:])
+
+        if self.lexeoff:
+            tok = newtoken()
+            tok.type = 'eof'
+            tok.value = ''
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            tok.lexer = self
+            self.lexpos = lexpos
+            newtok = self.lexeoff(tok)
+            return newtok
+
+        self.lexpos = lexpos + 1
+        return None
+
+    # ------------------------------------------------------------
+    # binarytoken() - Return the next token from binary input
+    #
+    # Same algorithm as token(), but lexdata is a bytes-like object.
+    # Token values are decoded to str before rule functions see them,
+    # so t_ rules work unchanged.  For t_error() the value holds only
+    # the next few characters instead of the whole remaining input.
+    # That text is decoded strictly: input that is not valid in the
+    # encoding raises UnicodeDecodeError, with the offsets of the whole
+    # input, just as decoding it to a str before lexing would.
+    # ------------------------------------------------------------
+    def binarytoken(self):
+        lexpos    = self.lexpos
+        lexlen    = self.lexlen
+        lexdata   = self.lexdata
+        encoding  = self.lexencoding
+        newtoken  = self.lextokenclass
+        lexre, lexignore, lexliterals = self.binaryre()
+
+        while lexpos < lexlen:
+            if lexdata[lexpos] in lexignore:
+                lexpos += 1
+                continue
+
+            for cre, lexindexfunc in lexre:
+                m = cre.match(lexdata, lexpos)
+                if not m:
+                    continue
+
+                tok = newtoken()
+                tok.value = m.group().decode(encoding)
+                tok.lineno = self.lineno
+                tok.lexpos = lexpos
+
+                i = m.lastindex
+                func, tok.type = lexindexfunc[i]
+
+                if not func:
+                    if tok.type:
+                        self.lexpos = m.end()
+                        return tok
+                    else:
+                        lexpos = m.end()
+                        break
+
+                lexpos = m.end()
+
+                tok.lexer = self
+                self.lexmatch = m
+                self.lexpos = lexpos
+
+                newtok = func(tok)
+
+                if not newtok:
+                    lexpos = self.lexpos
+                    # The rule may have changed the lexer state
+                    lexre, lexignore, lexliterals = self.binaryre()
+                    break
+
+                if not self.lexoptimize:
+                    if newtok.type not in self.lextokens_all:
+                        raise LexError("%s:%d: Rule '%s' returned an unknown token type '%s'" % (
+                            func.__code__.co_filename, func.__code__.co_firstlineno,
+                            func.__name__, newtok.type), newtok.value)
+
+                return newtok
+            else:
+                if lexdata[lexpos] in lexliterals:
+                    tok = newtoken()
+                    tok.value = lexdata[lexpos:lexpos+1].decode(encoding)
+                    tok.lineno = self.lineno
+                    tok.type = tok.value
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos + 1
+                    return tok
+
+                text = self.binarytext(lexpos)
+                if self.lexerrorf:
+                    tok = newtoken()
+                    tok.value = text
+                    tok.lineno = self.lineno
+                    tok.type = 'error'
+                    tok.lexer = self
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos
+                    newtok = self.lexerrorf(tok)
+                    if lexpos == self.lexpos:
+                        raise LexError("Scanning error. Illegal character '%s'" % text[:1], text)
+                    lexpos = self.lexpos
+                    if not newtok:
+                        continue
+                    return newtok
+
+                self.lexpos = lexpos
+                raise LexError("Illegal character '%s' at index %d" % (text[:1], lexpos), text)
+
+        if self.lexeoff:
+            tok = newtoken()
+            tok.type = 'eof'
+            tok.value = ''
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            tok.lexer = self
+            self.lexpos = lexpos
+            newtok = self.lexeoff(tok)
+            return newtok
+
+        self.lexpos = lexpos + 1
+        return None
+
+    # Decode the error context that starts at byte offset lexpos
+    def binarytext(self, lexpos):
+        end = lexpos + _binary_error_context
+        decoder = codecs.getincrementaldecoder(self.lexencoding)()
+        try:
+            # A character cut by the end of the context is not an error
+            return decoder.decode(self.lexdata[lexpos:end], end >= self.lexlen)
+        except UnicodeDecodeError as e:
+            raise UnicodeDecodeError(e.encoding, bytes(self.lexdata[:lexpos + e.end]),
+                                     lexpos + e.start, lexpos + e.end, e.reason) from None
+
+    # ------------------------------------------------------------
+    # tokenize_all() - Return a list with all of the remaining tokens
+    #
+    # Runs the scan loop of token() once over the whole input
+    # instead of entering token() for every token.  Binary input,
+    # the DFA scanner and lexers with a t_eof() rule (which may push
+    # more input) go through token().  See also tokenbuffer().
+    # ------------------------------------------------------------
+    def tokenize_all(self):
+        if self.lexdata is None:
+            raise RuntimeError('No input string given with input()')
+        if self.lexbinary or self.lexdfa is not None or self.lexeoff:
+            return list(iter(self.token, None))
+
+        toks      = []
+        append    = toks.append
+        lexpos    = self.lexpos
+        lexlen    = self.lexlen
+        lexignore = self.lexignore
+        lexdata   = self.lexdata
+        newtoken  = self.lextokenclass
+        typeids   = self.lextypeids
+        unknownid = self.lexunknownid
+
+        while lexpos < lexlen:
+            if lexdata[lexpos] in lexignore:
+                lexpos += 1
+                continue
+
+            for lexre, lexindexfunc in self.lexre:
+                m = lexre.match(lexdata, lexpos)
+                if not m:
+                    continue
+
+                tok = newtoken()
+                tok.value = m.group()
+                tok.lineno = self.lineno
+                tok.lexpos = lexpos
+
+                func, tok.type = lexindexfunc[m.lastindex]
+
+                if not func:
+                    if tok.type:
+                        if typeids is not None:
+                            tok.typeid = typeids.get(tok.type, unknownid)
+                        append(tok)
+                    lexpos = m.end()
+                    break
+
+                lexpos = m.end()
+
+                tok.lexer = self
+                self.lexmatch = m
+                self.lexpos = lexpos
+
+                newtok = func(tok)
+
+                lexpos    = self.lexpos
+                lexignore = self.lexignore
+                if newtok:
+                    if not self.lexoptimize and newtok.type not in self.lextokens_all:
+                        raise LexError("%s:%d: Rule '%s' returned an unknown token type '%s'" % (
+                            func.__code__.co_filename, func.__code__.co_firstlineno,
+                            func.__name__, newtok.type), lexdata[lexpos:])
+                    if typeids is not None:
+                        newtok.typeid = typeids.get(newtok.type, unknownid)
+                    append(newtok)
+                break
+            else:
+                if lexdata[lexpos] in self.lexliterals:
+                    tok = newtoken()
+                    tok.value = lexdata[lexpos]
+                    tok.lineno = self.lineno
+                    tok.type = tok.value
+                    tok.lexpos = lexpos
+                    if typeids is not None:
+                        tok.typeid = typeids.get(tok.type, unknownid)
+                    append(tok)
+                    lexpos += 1
+                    continue
+
+                if self.lexerrorf:
+                    tok = newtoken()
+                    tok.value = lexdata[lexpos:]
+                    tok.lineno = self.lineno
+                    tok.type = 'error'
+                    tok.lexer = self
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos
+                    newtok = self.lexerrorf(tok)
+                    if lexpos == self.lexpos:
+                        raise LexError("Scanning error. Illegal character '%s'" % (lexdata[lexpos]), lexdata[lexpos:])
+                    lexpos = self.lexpos
+                    lexignore = self.lexignore
+                    if newtok:
+                        append(self.tagtoken(newtok))
+                    continue
+
+                self.lexpos = lexpos
+                raise LexError("Illegal character '%s' at index %d" % (lexdata[lexpos], lexpos), lexdata[lexpos:])
+
+        self.lexpos = lexpos
+        return toks
+
+    # ------------------------------------------------------------
+    # tokenbuffer() - Scan the rest of the input into a TokenBuffer
+    #
+    # Tokens matched by plain string rules and literals go straight
+    # into the buffer columns without creating a LexToken.  Rule
+    # functions, t_error() and t_eof() still receive a LexToken as
+    # usual.  Binary input is scanned with token().
+    # ------------------------------------------------------------
+    def tokenbuffer(self):
+        if self.lexdata is None:
+            raise RuntimeError('No input string given with input()')
+        buf = TokenBuffer(self.lexdata, self.lexencoding)
+
+        if self.lexbinary:
+            tok = self.token()
+            while tok:
+                buf.appendtoken(tok, self.lexpos)
+                tok = self.token()
+            return buf
+
+        append    = buf.append
+        newtoken  = self.lextokenclass
+        lexpos    = self.lexpos
+        lexlen    = self.lexlen
+        lexignore = self.lexignore
+        lexdata   = self.lexdata
+
+        while lexpos < lexlen:
+            if lexdata[lexpos] in lexignore:
+                lexpos += 1
+                continue
+
+            for lexre, lexindexfunc in self.lexre:
+                m = lexre.match(lexdata, lexpos)
+                if not m:
+                    continue
+
+                func, toktype = lexindexfunc[m.lastindex]
+                if not func:
+                    if toktype:
+                        append(toktype, lexpos, m.end(), self.lineno)
+                    lexpos = m.end()
+                    break
+
+                tok = newtoken()
+                tok.value = m.group()
+                tok.lineno = self.lineno
+                tok.lexpos = lexpos
+                tok.type = toktype
+                tok.lexer = self
+                self.lexmatch = m
+                self.lexpos = m.end()
+
+                newtok = func(tok)
+
+                lexpos    = self.lexpos
+                lexignore = self.lexignore
+                if newtok:
+                    if not self.lexoptimize and newtok.type not in self.lextokens_all:
+                        raise LexError("%s:%d: Rule '%s' returned an unknown token type '%s'" % (
+                            func.__code__.co_filename, func.__code__.co_firstlineno,
+                            func.__name__, newtok.type), lexdata[lexpos:])
+                    buf.appendtoken(newtok, lexpos)
+                break
+            else:
+                if lexdata[lexpos] in self.lexliterals:
+                    append(lexdata[lexpos], lexpos, lexpos + 1, self.lineno)
+                    lexpos += 1
+                    continue
+
+                if self.lexerrorf:
+                    tok = newtoken()
+                    tok.value = lexdata[lexpos:]
+                    tok.lineno = self.lineno
+                    tok.type = 'error'
+                    tok.lexer = self
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos
+                    newtok = self.lexerrorf(tok)
+                    if lexpos == self.lexpos:
+                        raise LexError("Scanning error. Illegal character '%s'" % (lexdata[lexpos]), lexdata[lexpos:])
+                    lexpos = self.lexpos
+                    lexignore = self.lexignore
+                    if newtok:
+                        buf.appendtoken(newtok, lexpos)
+                    continue
+
+                self.lexpos = lexpos
+                raise LexError("Illegal character '%s' at index %d" % (lexdata[lexpos], lexpos), lexdata[lexpos:])
+
+        self.lexpos = lexpos
+        if self.lexeoff:
+            tok = newtoken()
+            tok.type = 'eof'
+            tok.value = ''
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            tok.lexer = self
+            newtok = self.lexeoff(tok)
+            if newtok:
+                buf.appendtoken(newtok, self.lexpos)
+        return buf
+
+    # ------------------------------------------------------------
+    # relex() - Update a token list after an edit of the input
+    #
+    # tokens is the list of all of the tokens of the current input,
+    # in order (e.g. from tokenize_all()).  The edit replaces the
+    # deleted characters at offset with the string inserted.  The
+    # input of the lexer becomes the edited text and tokens is
+    # updated in place.  Returns (first, last): the new tokens are
+    # tokens[first:last]; the ones after them are the old tokens,
+    # with lexpos and lineno shifted.
+    #
+    # Scanning restarts at the start of the token before the first
+    # one that reaches the edit: a token that ends right at the edit
+    # may grow, and the one before it found its end by looking at the
+    # next character.  It stops as soon as a new token starts after
+    # the edit at the shifted position of an old token of the same
+    # type; the rest of the input is the same, so the old tokens are
+    # kept.  t_error() is called again for illegal characters in the
+    # rescanned text.  Lexers with several states can not be
+    # restarted in the middle of the input; they rescan all of it.
+    #
+    # Rules must not look further ahead than that: for example, an
+    # unterminated comment that the edit closes far behind its start
+    # is not found.
+    # ------------------------------------------------------------
+    def relex(self, tokens, offset, deleted, inserted):
+        if self.lexdata is None:
+            raise RuntimeError('No input string given with input()')
+        if offset < 0 or deleted < 0 or offset + deleted > self.lexlen:
+            raise ValueError('Edit outside of the input')
+        lexdata = self.lexdata[:offset] + inserted + self.lexdata[offset + deleted:]
+        delta = len(inserted) - deleted
+        editend = offset + len(inserted)     # End of the edit in the new input
+        lineno = self.lineno
+
+        # First token that starts at or after the edit
+        lo, hi = 0, len(tokens)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tokens[mid].lexpos < offset:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo - 2
+        if first < 0 or len(self.lexstatere) > 1:
+            first = 0
+            self.lexpos = 0
+            self.lineno = 1
+        else:
+            self.lexpos = tokens[first].lexpos
+            self.lineno = tokens[first].lineno
+        if len(self.lexstatere) > 1:
+            self.lexstatestack = []
+            self.begin('INITIAL')
+        self.lexdata = lexdata
+        self.lexlen = len(lexdata)
+        self.lexlineindex = None
+
+        # Scan until a new token meets an old one
+        new = []
+        old = first
+        oldcount = len(tokens)
+        tok = self.token()
+        while tok is not None:
+            pos = tok.lexpos
+            if pos >= editend and len(self.lexstatere) == 1:
+                while old < oldcount and tokens[old].lexpos + delta < pos:
+                    old += 1
+                if old < oldcount and tokens[old].lexpos + delta == pos and tokens[old].type == tok.type:
+                    break
+            new.append(tok)
+            tok = self.token()
+        else:
+            old = oldcount
+
+        # Shift the old tokens that are kept
+        if old < oldcount:
+            lines = tok.lineno - tokens[old].lineno
+            if delta or lines:
+                for i in range(old, oldcount):
+                    t = tokens[i]
+                    t.lexpos += delta
+                    t.lineno += lines
+            self.lineno = lineno + lines
+        self.lexpos = self.lexlen
+        tokens[first:old] = new
+        return first, first + len(new)
+
     # Iterator interface
     def __iter__(self):
         return self
@@ -858,7 +1668,7 @@ class LexerReflect(object):
 # Build all of the regular expression rules from definitions in the supplied module
 # -----------------------------------------------------------------------------
 def lex(module=None, object=None, debug=False, optimize=False, lextab='lextab',
-        reflags=0, nowarn=False, outputdir=None, debuglog=None, errorlog=None):
+        reflags=0, nowarn=False, outputdir=None, debuglog=None, errorlog=None, dfa=False):
 
     if lextab is None:
         lextab = 'lextab'
@@ -909,6 +1719,8 @@ def lex(module=None, object=None, debug=False, optimize=False, lextab='lextab',
     if optimize and lextab:
         try:
             lexobj.readtab(lextab, ldict)
+            if dfa:
+                lexobj.builddfa(errorlog)
             token = lexobj.token
             input = lexobj.input
             lexer = lexobj
@@ -1013,6 +1825,10 @@ def lex(module=None, object=None, debug=False, optimize=False, lextab='lextab',
             if s not in linfo.ignore:
                 linfo.ignore[s] = linfo.ignore.get('INITIAL', '')
 
+    # Compile the rules into automata if requested
+    if dfa:
+        lexobj.builddfa(errorlog)
+
     # Create global versions of the token() and input() functions
     token = lexobj.token
     input = lexobj.input
@@ -0,0 +1,479 @@
+# -----------------------------------------------------------------------------
+# ply: lexdfa.py
+#
+# Deterministic automaton backend for ply.lex.
+#
+# The master regular expressions built by lex() are parsed and compiled into
+# a single NFA per lexer state.  The NFA is then turned into a DFA by subset
+# construction.  The construction is lazy: each DFA transition is computed the
+# first time a character is seen in a given state and cached in a dictionary,
+# so the automaton only contains the part of the state space that the input
+# actually uses (and non-ASCII character classes such as \w need no tables).
+#
+# The automaton returns the same match as the re module does for the master
+# regex: the first rule in the master regex that matches at all wins (function
+# rules in definition order, then string rules by decreasing regex length),
+# even if a later rule would match more text, and within a rule alternatives
+# are tried in order and quantifiers are greedy.  This is the leftmost-first
+# semantics of a backtracking matcher, which the automaton gets without
+# backtracking by keeping its NFA states in priority order (as in a Pike VM):
+# a DFA state is the ordered tuple of NFA states still alive, and once one of
+# them accepts, the lower priority ones behind it are dropped.
+#
+# Only the regular subset of the re syntax is supported: literals, escapes,
+# character classes, '.', groups, alternation and the greedy quantifiers
+# * + ? {m,n}.  Anchors, lookarounds, backreferences, lazy quantifiers and
+# case-insensitive matching raise DFAUnsupported.
+# -----------------------------------------------------------------------------
+
+import re
+
+# Transition value for "no match is possible from here"
+DEAD = -1
+
+
+class DFAUnsupported(Exception):
+    pass
+
+
+# -----------------------------------------------------------------------------
+#                          === Character sets ===
+# -----------------------------------------------------------------------------
+
+_categories = {
+    'd': lambda c: c.isdecimal(),
+    'w': lambda c: c.isalnum() or c == '_',
+    's': lambda c: c.isspace(),
+}
+
+
+class CharSet(object):
+    __slots__ = ('chars', 'ranges', 'categories', 'negated')
+
+    def __init__(self, chars=(), ranges=(), categories=(), negated=False):
+        self.chars = frozenset(chars)      # Single characters
+        self.ranges = tuple(ranges)        # (low, high) character pairs
+        self.categories = tuple(categories)  # (test, negated) pairs for \d \w \s \D \W \S
+        self.negated = negated
+
+    def __contains__(self, c):
+        found = c in self.chars
+        if not found:
+            for low, high in self.ranges:
+                if low <= c <= high:
+                    found = True
+                    break
+        if not found:
+            for test, negated in self.categories:
+                if test(c) != negated:
+                    found = True
+                    break
+        return found != self.negated
+
+
+# -----------------------------------------------------------------------------
+#                          === Regex parser ===
+#
+# Produces a small syntax tree:
+#     ('set', CharSet)
+#     ('cat', [nodes])
+#     ('alt', [nodes])
+#     ('rep', node, min, max)      max is None for no upper bound
+#     ('rule', name, node)         a top-level named group
+# -----------------------------------------------------------------------------
+
+_escapes = {'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v', 'a': '\a'}
+_hexdigits = frozenset('0123456789abcdefABCDEF')
+_octdigits = frozenset('01234567')
+
+
+class _RegexParser(object):
+    def __init__(self, pattern, flags):
+        if flags & (re.IGNORECASE | re.LOCALE | re.ASCII):
+            raise DFAUnsupported('unsupported regex flags')
+        self.pattern = pattern
+        self.pos = 0
+        self.verbose = bool(flags & re.VERBOSE)
+        self.dotall = bool(flags & re.DOTALL)
+        self.depth = 0
+
+    def error(self, msg):
+        raise DFAUnsupported('%s at position %d of %r' % (msg, self.pos, self.pattern))
+
+    # Skip whitespace and comments in verbose mode
+    def skip(self):
+        if not self.verbose:
+            return
+        p = self.pattern
+        while self.pos < len(p):
+            c = p[self.pos]
+            if c in ' \t\n\r\f\v':
+                self.pos += 1
+            elif c == '#':
+                end = p.find('\n', self.pos)
+                self.pos = len(p) if end < 0 else end + 1
+            else:
+                break
+
+    def peek(self):
+        self.skip()
+        if self.pos < len(self.pattern):
+            return self.pattern[self.pos]
+        return None
+
+    def parse(self):
+        node = self.parse_alt()
+        if self.peek() is not None:
+            self.error('unbalanced parenthesis')
+        return node
+
+    def parse_alt(self):
+        items = [self.parse_seq()]
+        while self.peek() == '|':
+            self.pos += 1
+            items.append(self.parse_seq())
+        return items[0] if len(items) == 1 else ('alt', items)
+
+    def parse_seq(self):
+        items = []
+        while True:
+            c = self.peek()
+            if c is None or c in '|)':
+                break
+            items.append(self.parse_repeat())
+        return items[0] if len(items) == 1 else ('cat', items)
+
+    def parse_repeat(self):
+        node = self.parse_atom()
+        while True:
+            c = self.peek()
+            if c == '*':
+                low, high = 0, None
+            elif c == '+':
+                low, high = 1, None
+            elif c == '?':
+                low, high = 0, 1
+            elif c == '{':
+                m = re.compile(r'\{(\d*)(,?)(\d*)\}').match(self.pattern, self.pos)
+                if not m or not (m.group(1) or m.group(3)):
+                    break           # A literal '{', as in re
+                low = int(m.group(1) or 0)
+                high = low if not m.group(2) else (int(m.group(3)) if m.group(3) else None)
+                self.pos = m.end() - 1
+            else:
+                break
+            self.pos += 1
+            if self.pos < len(self.pattern) and self.pattern[self.pos] in '?+':
+                self.error('lazy or possessive quantifier')
+            node = ('rep', node, low, high)
+        return node
+
+    def parse_atom(self):
+        p = self.pattern
+        c = p[self.pos]
+        self.pos += 1
+        if c == '(':
+            name = None
+            if p.startswith('?P<', self.pos):
+                end = p.index('>', self.pos)
+                name = p[self.pos+3:end]
+                self.pos = end + 1
+            elif p.startswith('?:', self.pos):
+                self.pos += 2
+            elif p.startswith('?', self.pos):
+                self.error('unsupported group')
+            self.depth += 1
+            node = self.parse_alt()
+            self.depth -= 1
+            if self.peek() != ')':
+                self.error('missing )')
+            self.pos += 1
+            if name is not None and self.depth == 0:
+                return ('rule', name, node)
+            return node
+        if c == '[':
+            return ('set', self.parse_class())
+        if c == '.':
+            return ('set', CharSet(() if self.dotall else '\n', negated=True))
+        if c == '\\':
+            return ('set', self.parse_escape(False))
+        if c in '^$':
+            self.error('anchors')
+        if c in '*+?':
+            self.error('nothing to repeat')
+        return ('set', CharSet(c))
+
+    # Escape sequence.  Inside a character class returns a CharSet as well.
+    def parse_escape(self, inclass):
+        p = self.pattern
+        if self.pos >= len(p):
+            self.error('bad escape')
+        c = p[self.pos]
+        self.pos += 1
+        if c in 'dws':
+            return CharSet(categories=[(_categories[c], False)])
+        if c in 'DWS':
+            return CharSet(categories=[(_categories[c.lower()], True)])
+        if c in _escapes:
+            return CharSet(_escapes[c])
+        if c == 'b' and inclass:
+            return CharSet('\b')
+        if c in 'xuU':
+            size = {'x': 2, 'u': 4, 'U': 8}[c]
+            digits = p[self.pos:self.pos+size]
+            if len(digits) != size or not all(d in _hexdigits for d in digits):
+                self.error('bad escape \\%s' % c)
+            self.pos += size
+            if int(digits, 16) > 0x10ffff:
+                self.error('bad escape \\%s' % c)
+            return CharSet(chr(int(digits, 16)))
+        if c in _octdigits:
+            # Octal escape of up to three digits, read as sre_parse does.
+            # Outside a class \1-\7 is a group reference unless three
+            # octal digits follow.
+            digits = c
+            while len(digits) < 3 and p[self.pos:self.pos+1] in _octdigits:
+                digits += p[self.pos]
+                self.pos += 1
+            if c != '0' and not inclass and len(digits) < 3:
+                self.error('group references')
+            if int(digits, 8) > 0o377:
+                self.error('octal escape value out of range')
+            return CharSet(chr(int(digits, 8)))
+        if c.isalnum():
+            self.error('unsupported escape \\%s' % c)
+        return CharSet(c)
+
+    def parse_class(self):
+        p = self.pattern
+        negated = False
+        if p.startswith('^', self.pos):
+            negated = True
+            self.pos += 1
+        chars = set()
+        ranges = []
+        categories = []
+        first = True
+        while True:
+            if self.pos >= len(p):
+                self.error('unterminated character class')
+            c = p[self.pos]
+            if c == ']' and not first:
+                self.pos += 1
+                break
+            first = False
+            self.pos += 1
+            if c == '\\':
+                item = self.parse_escape(True)
+                if item.categories:
+                    categories.extend(item.categories)
+                    continue
+                c, = item.chars
+            if p.startswith('-', self.pos) and self.pos + 1 < len(p) and p[self.pos+1] != ']':
+                self.pos += 1
+                high = p[self.pos]
+                self.pos += 1
+                if high == '\\':
+                    item = self.parse_escape(True)
+                    if item.categories:
+                        self.error('bad character range')
+                    high, = item.chars
+                ranges.append((c, high))
+            else:
+                chars.add(c)
+        return CharSet(chars, ranges, categories, negated)
+
+
+# -----------------------------------------------------------------------------
+#                               === NFA ===
+#
+# Every branch point is a state with an ordered list of epsilon moves, the
+# preferred one first, so the order of a backtracking matcher is kept in the
+# automaton: alternatives left to right, one more repetition before leaving a
+# greedy quantifier.  A state has either character edges or epsilon moves.
+# -----------------------------------------------------------------------------
+
+class _NFA(object):
+    def __init__(self):
+        self.edges = []     # State -> list of (CharSet, target)
+        self.eps = []       # State -> list of targets, in priority order
+        self.accept = {}    # State -> rule priority
+
+    def state(self):
+        self.edges.append([])
+        self.eps.append([])
+        return len(self.edges) - 1
+
+    # Add the fragment for node between states start and end
+    def build(self, node, start, end):
+        kind = node[0]
+        if kind == 'set':
+            self.edges[start].append((node[1], end))
+        elif kind == 'cat':
+            items = node[1]
+            if not items:
+                self.eps[start].append(end)
+                return
+            current = start
+            for item in items[:-1]:
+                nxt = self.state()
+                self.build(item, current, nxt)
+                current = nxt
+            self.build(items[-1], current, end)
+        elif kind == 'alt':
+            for item in node[1]:
+                self.build(item, self.branch(start), end)
+        elif kind == 'rep':
+            item, low, high = node[1], node[2], node[3]
+            current = start
+            for i in range(low):
+                nxt = self.state()
+                self.build(item, self.branch(current), nxt)
+                current = nxt
+            if high is None:
+                loop = self.branch(current)
+                body = self.state()
+                self.build(item, self.branch(loop), body)
+                self.eps[loop].append(end)
+                self.eps[body].append(loop)
+            else:
+                for i in range(high - low):
+                    nxt = self.state()
+                    self.build(item, self.branch(current), nxt)
+                    self.eps[current].append(end)
+                    current = nxt
+                self.eps[current].append(end)
+        elif kind == 'rule':
+            raise DFAUnsupported('nested rule group %s' % node[1])
+
+    # New state reached from state by an epsilon move of lower priority
+    # than the ones it already has
+    def branch(self, state):
+        target = self.state()
+        self.eps[state].append(target)
+        return target
+
+    # Follow the epsilon moves from states, in priority order.  Returns the
+    # states with character edges and the accepting states, each one only at
+    # its first (highest priority) occurrence.
+    def closure(self, states):
+        result = []
+        seen = set()
+        edges = self.edges
+        eps = self.eps
+        accept = self.accept
+        for root in states:
+            stack = [root]
+            while stack:
+                n = stack.pop()
+                if n in seen:
+                    continue
+                seen.add(n)
+                if edges[n] or n in accept:
+                    result.append(n)
+                stack.extend(reversed(eps[n]))
+        return result
+
+
+# -----------------------------------------------------------------------------
+#                               === DFA ===
+#
+# trans[s] is a dictionary character -> (next state, rule) that is filled in
+# on demand by step().  rule is the rule of ply.lex (a (func, tokname) entry
+# of lexindexfunc) that matches the text read so far, or None.  A match only
+# replaces the previous one if it comes from a higher priority NFA state, and
+# those are the only ones left after a match, so the scanner just keeps the
+# last rule it sees until the automaton dies.  When no match is possible the
+# entry is (DEAD, None).  State 0 is the start state.
+# -----------------------------------------------------------------------------
+
+class DFA(object):
+    def __init__(self, nfa, start, rules):
+        self.nfa = nfa
+        self.rules = rules          # Priority -> (func, tokname)
+        self.states = []            # DFA state -> tuple of NFA states, by priority
+        self.index = {}             # Tuple of NFA states -> DFA state
+        self.trans = []
+        self.add(self.cut(nfa.closure([start]))[0])
+        # Rule functions that read lexer.lexmatch.  The DFA does not produce
+        # match objects, so for these the lexer also runs the regex.
+        self.needmatch = frozenset(func for func, tokname in rules
+                                   if func and 'lexmatch' in func.__code__.co_names)
+
+    def add(self, nstates):
+        s = self.index.get(nstates)
+        if s is None:
+            s = len(self.states)
+            self.index[nstates] = s
+            self.states.append(nstates)
+            self.trans.append({})
+        return s
+
+    # Split an ordered list of NFA states at the first accepting one.
+    # Returns (the states before it, its rule), or (all of them, None).
+    def cut(self, nstates):
+        accept = self.nfa.accept
+        for i, n in enumerate(nstates):
+            if n in accept:
+                return tuple(nstates[:i]), self.rules[accept[n]]
+        return tuple(nstates), None
+
+    def step(self, s, c):
+        edges = self.nfa.edges
+        targets = [t for n in self.states[s] for charset, t in edges[n] if c in charset]
+        nstates, rule = self.cut(self.nfa.closure(targets))
+        if nstates or rule:
+            entry = (self.add(nstates), rule)
+        else:
+            entry = (DEAD, None)
+        self.trans[s][c] = entry
+        return entry
+
+    # Match starting at pos.  Returns (end, rule) or None.
+    def match(self, data, pos):
+        trans = self.trans
+        end = len(data)
+        s = 0
+        result = None
+        while pos < end:
+            c = data[pos]
+            try:
+                s, rule = trans[s][c]
+            except KeyError:
+                s, rule = self.step(s, c)
+            if s < 0:
+                break
+            pos += 1
+            if rule:
+                result = (pos, rule)
+        return result
+
+
+# -----------------------------------------------------------------------------
+# build() - Build the DFA for the master regexs of one lexer state
+#
+# lexre is the list of (compiled regex, lexindexfunc) pairs that ply.lex
+# keeps for the state.  Raises DFAUnsupported if a rule cannot be expressed
+# as an automaton.
+# -----------------------------------------------------------------------------
+
+def build(lexre):
+    nfa = _NFA()
+    start = nfa.state()
+    rules = []
+    for cre, lexindexfunc in lexre:
+        if not isinstance(cre.pattern, str):
+            raise DFAUnsupported('binary patterns')
+        tree = _RegexParser(cre.pattern, cre.flags).parse()
+        alternatives = tree[1] if tree[0] == 'alt' else [tree]
+        for node in alternatives:
+            if node[0] != 'rule':
+                raise DFAUnsupported('master regex is not a list of named rules')
+            entry = lexindexfunc[cre.groupindex[node[1]]]
+            if entry is None:
+                raise DFAUnsupported('rule %s has no action' % node[1])
+            end = nfa.state()
+            nfa.build(node[2], nfa.branch(start), end)
+            nfa.accept[end] = len(rules)
+            rules.append(entry)
+    return DFA(nfa, start, rules)
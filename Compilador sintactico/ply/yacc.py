@@ -60,12 +60,16 @@
 # ----------------------------------------------------------------------------
 
 import re
+import dis
 import types
 import sys
 import os.path
 import inspect
 import base64
 import warnings
+import json
+import mmap
+from array import array
 
 __version__    = '3.8'
 __tabversion__ = '3.8'
@@ -92,6 +96,9 @@ resultlimit = 40               # Size limit of results when running in debug mod
 
 pickle_protocol = 0            # Protocol to use when writing pickle files
 
+binary_magic = b'PLYLRT1\n'     # First bytes of a binary table file (see LRTable.read_binary)
+binary_noaction = -0x80000000  # Empty entry of the dense action table
+
 # String type-checking compatibility
 if sys.version_info[0] < 3:
     string_types = basestring
@@ -197,6 +204,62 @@ def call_errorfunc(errorfunc, token, parser):
         pass
     return r
 
+# Decorator that marks a rule function as a passthrough rule: the parser may
+# reduce its production by copying p[1] into p[0] without calling it.
+def passthrough(f):
+    f.passthrough = True
+    return f
+
+# Reference rule used to recognize rule functions whose body is p[0] = p[1]
+def _passthrough_rule(p):
+    'a : b'
+    p[0] = p[1]
+
+# Returns True if the rule function f can be skipped by copying p[1] into p[0]
+def is_passthrough(f):
+    if getattr(f, 'passthrough', False):
+        return True
+    code = getattr(f, '__code__', None)
+    if code is None or getattr(f, '__closure__', None) or code.co_argcount != 1:
+        return False
+    ref = _passthrough_rule.__code__
+    # The first constant is the docstring, which holds the grammar rule
+    return (code.co_code == ref.co_code and code.co_names == ref.co_names and
+            code.co_consts[1:] == ref.co_consts[1:] and f.__doc__ is not None)
+
+# Returns True if the rule function f only uses its argument p as p[n] or
+# p[n] = value with a constant n >= 0.  Such a rule works the same if it is
+# given a list with the values of the symbols instead of a YaccProduction.
+def is_value_rule(f):
+    if inspect.ismethod(f):
+        f, nargs = f.__func__, 2
+    else:
+        nargs = 1
+    code = getattr(f, '__code__', None)
+    if code is None or code.co_argcount != nargs or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return False
+    name = code.co_varnames[nargs - 1]
+    if name in code.co_cellvars:
+        return False
+    instructions = list(dis.get_instructions(code)) + [None, None]
+    for i, instr in enumerate(instructions[:-2]):
+        # Every instruction that reads, writes or deletes a local variable
+        # has FAST in its name (LOAD_FAST, STORE_FAST, LOAD_FAST_LOAD_FAST...)
+        if 'FAST' not in instr.opname:
+            continue
+        if not (instr.argval == name or isinstance(instr.argval, tuple) and name in instr.argval):
+            continue
+        if instr.opname not in ('LOAD_FAST', 'LOAD_FAST_CHECK', 'LOAD_FAST_BORROW'):
+            return False
+        index, subscr = instructions[i+1], instructions[i+2]
+        if (index is None or index.opname not in ('LOAD_CONST', 'LOAD_SMALL_INT') or
+            type(index.argval) is not int or index.argval < 0):
+            return False
+        if subscr is None or not (subscr.opname in ('BINARY_SUBSCR', 'STORE_SUBSCR') or
+                                  subscr.opname == 'BINARY_OP' and subscr.argrepr == '[]'):
+            return False
+    return True
+
 #-----------------------------------------------------------------------------
 #                        ===  LR Parsing Engine ===
 #
@@ -213,14 +276,24 @@ def call_errorfunc(errorfunc, token, parser):
 #        .endlineno  = Ending line number (optional, set automatically)
 #        .lexpos     = Starting lex position
 #        .endlexpos  = Ending lex position (optional, set automatically)
+#
+# One is created for every reduction, so it uses __slots__.  Code that needs
+# to attach other attributes to symbols can set the parser's symbolclass to
+# DictYaccSymbol.
+
+class YaccSymbol(object):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos')
 
-class YaccSymbol:
     def __str__(self):
         return self.type
 
     def __repr__(self):
         return str(self)
 
+# YaccSymbol that also accepts arbitrary attributes
+class DictYaccSymbol(YaccSymbol):
+    pass
+
 # This class is a wrapper around the objects actually passed to each
 # grammar rule.   Index lookup and assignment actually assign the
 # .value attribute of the underlying YaccSymbol object.
@@ -230,7 +303,11 @@ class YaccSymbol:
 # for a symbol.  The lexspan() method returns a tuple (lexpos,endlexpos)
 # representing the range of positional information for a symbol.
 
-class YaccProduction:
+class YaccProduction(object):
+    # Only one is created per parse; '__dict__' keeps grammar rules that store
+    # their own attributes on p working.
+    __slots__ = ('slice', 'stack', 'lexer', 'parser', '__dict__')
+
     def __init__(self, s, stack=None):
         self.slice = s
         self.stack = stack
@@ -290,6 +367,10 @@ class LRParser:
         self.errorfunc = errorf
         self.set_defaulted_states()
         self.errorok = True
+        self.symbolclass = YaccSymbol    # Class of the symbols created while parsing
+        self.dense = False               # Use parsedense() (see set_dense())
+        self.faststart = None            # (pdict, signature) if built from a stamp (see check_faststart())
+        self.set_passthrough_rules()
 
     def errok(self):
         self.errorok = True
@@ -297,7 +378,7 @@ class LRParser:
     def restart(self):
         del self.statestack[:]
         del self.symstack[:]
-        sym = YaccSymbol()
+        sym = self.symbolclass()
         sym.type = '$end'
         self.symstack.append(sym)
         self.statestack.append(0)
@@ -311,6 +392,12 @@ class LRParser:
     #
     # See:  http://www.gnu.org/software/bison/manual/html_node/Default-Reductions.html#Default-Reductions
     def set_defaulted_states(self):
+        # Binary tables store the defaulted states, so the rows do not
+        # have to be materialized to find them
+        defaulted = getattr(self.action, 'defaulted_states', None)
+        if defaulted is not None:
+            self.defaulted_states = dict(defaulted)
+            return
         self.defaulted_states = {}
         for state, actions in self.action.items():
             rules = list(actions.values())
@@ -320,6 +407,83 @@ class LRParser:
     def disable_defaulted_states(self):
         self.defaulted_states = {}
 
+    # Passthrough rule support.
+    # Unit productions (a : b) whose rule only does p[0] = p[1], or whose rule
+    # function was marked with the @passthrough decorator, are reduced by the
+    # parser itself: the value is copied without building the YaccProduction
+    # slice or calling the function.  The rules are found when the parser is
+    # created; call set_passthrough_rules() again after replacing the callable
+    # of a production.
+    def set_passthrough_rules(self):
+        self.passthrough = [p.len == 1 and is_passthrough(p.callable) for p in self.productions]
+
+    def disable_passthrough_rules(self):
+        self.passthrough = [False] * len(self.productions)
+
+    # Dense table support.
+    # Maps every terminal and nonterminal to a small integer and flattens the
+    # action and goto tables into lists indexed by state * nsymbols + id, so
+    # that parsedense() can look up an action with a single list index instead
+    # of two dictionary lookups.  Empty entries of the action table are None.
+    # The action table has an extra last column, id len(termids), for token
+    # types that do not appear in the grammar.  A lexer that tags its tokens
+    # with these ids (lexer.settypeids(parser.termids)) saves the parser the
+    # lookup of the id by type name.
+    def set_dense(self):
+        action, goto = self.action, self.goto
+        binary = isinstance(action, _BinaryRows)
+        if binary:
+            terminals = list(action.symbols)
+            nonterminals = list(goto.symbols)
+            nstates = len(action.cells) // max(len(terminals), 1)
+        else:
+            terminals = sorted(set(t for row in action.values() for t in row))
+            nonterminals = sorted(set(n for row in goto.values() for n in row))
+            nstates = max(list(action) + list(goto) + [-1]) + 1
+        nbinary = len(terminals)
+
+        # The parser looks these up even when no state has an action on them
+        for t in ('$end', 'error'):
+            if t not in terminals:
+                terminals.append(t)
+        self.termids = dict((t, i) for i, t in enumerate(terminals))
+        self.nontermids = dict((n, i) for i, n in enumerate(nonterminals))
+
+        nterm = len(terminals) + 1
+        nnonterm = len(nonterminals)
+        if binary:
+            # The binary tables already are dense arrays with the same column
+            # order: only the extra columns and the empty entries differ
+            cells = action.cells.tolist()
+            pad = [binary_noaction] * (nterm - nbinary)
+            denseaction = []
+            for i in range(0, nstates * nbinary, nbinary):
+                denseaction.extend(cells[i:i+nbinary])
+                denseaction.extend(pad)
+            # Replaces binary_noaction by None and keeps every other value
+            self.denseaction = list(map({binary_noaction: None}.get, denseaction, denseaction))
+            self.densegoto = goto.cells.tolist()
+        else:
+            self.denseaction = [None] * (nstates * nterm)
+            for state, row in action.items():
+                for t, value in row.items():
+                    self.denseaction[state * nterm + self.termids[t]] = value
+            self.densegoto = [-1] * (nstates * nnonterm)
+            for state, row in goto.items():
+                for n, value in row.items():
+                    self.densegoto[state * nnonterm + self.nontermids[n]] = value
+
+        self.densedefaulted = [None] * nstates
+        for state, rule in self.defaulted_states.items():
+            self.densedefaulted[state] = rule
+
+        # Column of the goto table used after reducing each production
+        self.prodgoto = [self.nontermids.get(p.name, -1) for p in self.productions]
+        self.dense = True
+
+    def disable_dense(self):
+        self.dense = False
+
     def parse(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
         if debug or yaccdevel:
             if isinstance(debug, int):
@@ -327,6 +491,8 @@ class LRParser:
             return self.parsedebug(input, lexer, debug, tracking, tokenfunc)
         elif tracking:
             return self.parseopt(input, lexer, debug, tracking, tokenfunc)
+        elif self.dense:
+            return self.parsedense(input, lexer, debug, tracking, tokenfunc)
         else:
             return self.parseopt_notrack(input, lexer, debug, tracking, tokenfunc)
 
@@ -348,10 +514,12 @@ class LRParser:
     def parsedebug(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
         #--! parsedebug-start
         lookahead = None                         # Current lookahead symbol
+        newsymbol = self.symbolclass             # Class of the grammar symbols
         lookaheadstack = []                      # Stack of lookahead symbols
         actions = self.action                    # Local reference to action table (to avoid lookup on self.)
         goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
         prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
+        passthrough = self.passthrough           # Productions reduced without calling their rule
         defaulted_states = self.defaulted_states # Local reference to defaulted states
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
@@ -395,7 +563,7 @@ class LRParser:
         # The start state is assumed to be (0,$end)
 
         statestack.append(0)
-        sym = YaccSymbol()
+        sym = newsymbol()
         sym.type = '$end'
         symstack.append(sym)
         state = 0
@@ -416,7 +584,7 @@ class LRParser:
                     else:
                         lookahead = lookaheadstack.pop()
                     if not lookahead:
-                        lookahead = YaccSymbol()
+                        lookahead = newsymbol()
                         lookahead.type = '$end'
 
                 # Check the action table
@@ -458,7 +626,7 @@ class LRParser:
                     plen  = p.len
 
                     # Get production function
-                    sym = YaccSymbol()
+                    sym = newsymbol()
                     sym.type = pname       # Production name
                     sym.value = None
 
@@ -473,6 +641,30 @@ class LRParser:
 
                     #--! DEBUG
 
+                    if passthrough[-t]:
+                        # Unit production whose rule only does p[0] = p[1]:
+                        # the new symbol replaces the one on top of the stack
+                        # without building the slice or calling the rule
+                        t1 = symstack[-1]
+                        sym.value = t1.value
+
+                        #--! TRACKING
+                        if tracking:
+                            sym.lineno = t1.lineno
+                            sym.lexpos = t1.lexpos
+                            sym.endlineno = getattr(t1, 'endlineno', t1.lineno)
+                            sym.endlexpos = getattr(t1, 'endlexpos', t1.lexpos)
+                        #--! TRACKING
+
+                        #--! DEBUG
+                        debug.info('Result : %s', format_result(sym.value))
+                        #--! DEBUG
+
+                        symstack[-1] = sym
+                        state = goto[statestack[-2]][pname]
+                        statestack[-1] = state
+                        continue
+
                     if plen:
                         targ = symstack[-plen-1:]
                         targ[0] = sym
@@ -651,7 +843,7 @@ class LRParser:
                         continue
 
                     # Create the error symbol for the first time and make it the new lookahead symbol
-                    t = YaccSymbol()
+                    t = newsymbol()
                     t.type = 'error'
 
                     if hasattr(lookahead, 'lineno'):
@@ -689,10 +881,12 @@ class LRParser:
     def parseopt(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
         #--! parseopt-start
         lookahead = None                         # Current lookahead symbol
+        newsymbol = self.symbolclass             # Class of the grammar symbols
         lookaheadstack = []                      # Stack of lookahead symbols
         actions = self.action                    # Local reference to action table (to avoid lookup on self.)
         goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
         prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
+        passthrough = self.passthrough           # Productions reduced without calling their rule
         defaulted_states = self.defaulted_states # Local reference to defaulted states
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
@@ -733,7 +927,7 @@ class LRParser:
         # The start state is assumed to be (0,$end)
 
         statestack.append(0)
-        sym = YaccSymbol()
+        sym = newsymbol()
         sym.type = '$end'
         symstack.append(sym)
         state = 0
@@ -750,7 +944,7 @@ class LRParser:
                     else:
                         lookahead = lookaheadstack.pop()
                     if not lookahead:
-                        lookahead = YaccSymbol()
+                        lookahead = newsymbol()
                         lookahead.type = '$end'
 
                 # Check the action table
@@ -782,11 +976,32 @@ class LRParser:
                     plen  = p.len
 
                     # Get production function
-                    sym = YaccSymbol()
+                    sym = newsymbol()
                     sym.type = pname       # Production name
                     sym.value = None
 
 
+                    if passthrough[-t]:
+                        # Unit production whose rule only does p[0] = p[1]:
+                        # the new symbol replaces the one on top of the stack
+                        # without building the slice or calling the rule
+                        t1 = symstack[-1]
+                        sym.value = t1.value
+
+                        #--! TRACKING
+                        if tracking:
+                            sym.lineno = t1.lineno
+                            sym.lexpos = t1.lexpos
+                            sym.endlineno = getattr(t1, 'endlineno', t1.lineno)
+                            sym.endlexpos = getattr(t1, 'endlexpos', t1.lexpos)
+                        #--! TRACKING
+
+
+                        symstack[-1] = sym
+                        state = goto[statestack[-2]][pname]
+                        statestack[-1] = state
+                        continue
+
                     if plen:
                         targ = symstack[-plen-1:]
                         targ[0] = sym
@@ -951,7 +1166,7 @@ class LRParser:
                         continue
 
                     # Create the error symbol for the first time and make it the new lookahead symbol
-                    t = YaccSymbol()
+                    t = newsymbol()
                     t.type = 'error'
 
                     if hasattr(lookahead, 'lineno'):
@@ -989,10 +1204,12 @@ class LRParser:
     def parseopt_notrack(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
         #--! parseopt-notrack-start
         lookahead = None                         # Current lookahead symbol
+        newsymbol = self.symbolclass             # Class of the grammar symbols
         lookaheadstack = []                      # Stack of lookahead symbols
         actions = self.action                    # Local reference to action table (to avoid lookup on self.)
         goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
         prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
+        passthrough = self.passthrough           # Productions reduced without calling their rule
         defaulted_states = self.defaulted_states # Local reference to defaulted states
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
@@ -1033,7 +1250,7 @@ class LRParser:
         # The start state is assumed to be (0,$end)
 
         statestack.append(0)
-        sym = YaccSymbol()
+        sym = newsymbol()
         sym.type = '$end'
         symstack.append(sym)
         state = 0
@@ -1050,7 +1267,7 @@ class LRParser:
                     else:
                         lookahead = lookaheadstack.pop()
                     if not lookahead:
-                        lookahead = YaccSymbol()
+                        lookahead = newsymbol()
                         lookahead.type = '$end'
 
                 # Check the action table
@@ -1082,11 +1299,25 @@ class LRParser:
                     plen  = p.len
 
                     # Get production function
-                    sym = YaccSymbol()
+                    sym = newsymbol()
                     sym.type = pname       # Production name
                     sym.value = None
 
 
+                    if passthrough[-t]:
+                        # Unit production whose rule only does p[0] = p[1]:
+                        # the new symbol replaces the one on top of the stack
+                        # without building the slice or calling the rule
+                        t1 = symstack[-1]
+                        sym.value = t1.value
+
+
+
+                        symstack[-1] = sym
+                        state = goto[statestack[-2]][pname]
+                        statestack[-1] = state
+                        continue
+
                     if plen:
                         targ = symstack[-plen-1:]
                         targ[0] = sym
@@ -1232,7 +1463,7 @@ class LRParser:
                         continue
 
                     # Create the error symbol for the first time and make it the new lookahead symbol
-                    t = YaccSymbol()
+                    t = newsymbol()
                     t.type = 'error'
 
                     if hasattr(lookahead, 'lineno'):
@@ -1254,6 +1485,489 @@ class LRParser:
 
         #--! parseopt-notrack-end
 
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # parsedense().
+    #
+    # Version of parseopt_notrack() that uses the flat tables built by
+    # set_dense(): actions are looked up by integer token id instead of by
+    # type name.  This is not generated by ply/ygen.py, so changes made to
+    # parseopt_notrack() must be copied here by hand.
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    def parsedense(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        lookahead = None                         # Current lookahead symbol
+        newsymbol = self.symbolclass             # Class of the grammar symbols
+        lookaheadstack = []                      # Stack of lookahead symbols
+        actions = self.denseaction               # Local reference to the flat action table
+        goto    = self.densegoto                 # Local reference to the flat goto table
+        termids = self.termids                   # Integer id of each terminal
+        prodgoto = self.prodgoto                 # Goto column of each production
+        unknownid = len(termids)                 # Id of the token types not in the grammar
+        nterm   = unknownid + 1                  # Row length of the action table
+        nnonterm = len(self.nontermids)          # Row length of the goto table
+        prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
+        passthrough = self.passthrough           # Productions reduced without calling their rule
+        defaulted_states = self.densedefaulted   # Default reduction of each state (or None)
+        pslice  = YaccProduction(None)           # Production object passed to grammar rules
+        errorcount = 0                           # Used during error recovery
+
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        if tokenfunc is None:
+            # Tokenize function
+            get_token = lexer.token
+        else:
+            get_token = tokenfunc
+
+        # Tokens carry their id if the lexer tags them with our ids
+        tagged = getattr(lexer, 'lextypeids', None) is termids
+
+        # Set the parser() token method (sometimes used in error recovery)
+        self.token = get_token
+
+        # Set up the state and symbol stacks
+
+        statestack = []                # Stack of parsing states
+        self.statestack = statestack
+        symstack   = []                # Stack of grammar symbols
+        self.symstack = symstack
+
+        pslice.stack = symstack         # Put in the production
+        errtoken   = None               # Err token
+
+        # The start state is assumed to be (0,$end)
+
+        statestack.append(0)
+        sym = newsymbol()
+        sym.type = '$end'
+        symstack.append(sym)
+        state = 0
+        while True:
+            # Get the next symbol on the input.  If a lookahead symbol
+            # is already set, we just use that. Otherwise, we'll pull
+            # the next token off of the lookaheadstack or from the lexer
+
+
+            t = defaulted_states[state]
+            if t is None:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()     # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = newsymbol()
+                        lookahead.type = '$end'
+
+                # Check the action table.  The $end and error symbols made
+                # by the parser are not tagged.
+                if tagged:
+                    try:
+                        ltid = lookahead.typeid
+                    except AttributeError:
+                        ltid = termids.get(lookahead.type, unknownid)
+                else:
+                    ltid = termids.get(lookahead.type, unknownid)
+                t = actions[state * nterm + ltid]
+
+
+            if t is not None:
+                if t > 0:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+
+
+                    symstack.append(lookahead)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                if t < 0:
+                    # reduce a symbol on the stack, emit a production
+                    p = prod[-t]
+                    pname = p.name
+                    plen  = p.len
+                    pgoto = prodgoto[-t]
+
+                    # Get production function
+                    sym = newsymbol()
+                    sym.type = pname       # Production name
+                    sym.value = None
+
+                    if passthrough[-t]:
+                        # Unit production whose rule only does p[0] = p[1]:
+                        # the new symbol replaces the one on top of the stack
+                        # without building the slice or calling the rule
+                        t1 = symstack[-1]
+                        sym.value = t1.value
+
+                        symstack[-1] = sym
+                        state = goto[statestack[-2] * nnonterm + pgoto]
+                        statestack[-1] = state
+                        continue
+
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+
+
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                        # The code enclosed in this section is duplicated
+                        # below as a performance optimization.  Make sure
+                        # changes get made in both locations.
+
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            del statestack[-plen:]
+                            p.callable(pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1] * nnonterm + pgoto]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+                    else:
+
+
+                        targ = [sym]
+
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                        # The code enclosed in this section is duplicated
+                        # above as a performance optimization.  Make sure
+                        # changes get made in both locations.
+
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            p.callable(pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1] * nnonterm + pgoto]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+                if t == 0:
+                    n = symstack[-1]
+                    result = getattr(n, 'value', None)
+                    return result
+
+            if t is None:
+
+
+                # We have some kind of parsing error here.  To handle
+                # this, we are going to push the current token onto
+                # the tokenstack and replace it with an 'error' token.
+                # If there are any synchronization rules, they may
+                # catch it.
+                #
+                # In addition to pushing the error token, we call call
+                # the user defined p_error() function if this is the
+                # first syntax error.  This function is only called if
+                # errorcount == 0.
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == '$end':
+                        errtoken = None               # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, 'lexer'):
+                            errtoken.lexer = lexer
+                        tok = call_errorfunc(self.errorfunc, errtoken, self)
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, 'lineno'):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                            else:
+                                sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                        else:
+                            sys.stderr.write('yacc: Parse error in input. EOF\n')
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  If we're in this state, the
+                # entire parse has been rolled back and we're completely hosed.   The token is
+                # discarded and we just keep going.
+
+                if len(statestack) <= 1 and lookahead.type != '$end':
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+
+                # Start nuking entries on the stack
+                if lookahead.type == '$end':
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != 'error':
+                    sym = symstack[-1]
+                    if sym.type == 'error':
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = newsymbol()
+                    t.type = 'error'
+
+                    if hasattr(lookahead, 'lineno'):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, 'lexpos'):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                else:
+                    sym = symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # Call an error function here
+            raise RuntimeError('yacc: internal parser error!!!\n')
+
+    # Fragment parsing support (incremental reparsing).
+    # parsefragment() parses part of the input as a single nonterminal goal,
+    # starting from the state that an earlier parse was in just before that
+    # part.  After an edit, only the part of the input that changed has to be
+    # parsed again.
+    #
+    # The stack starts with only state on it, and parsing stops as soon as a
+    # reduction leaves goal directly above it.  The method returns
+    # (status, value, lookahead), where lookahead is the token at which the
+    # parse stopped and status is one of:
+    #
+    #    True   goal was reduced and value is its value.  The caller checks
+    #           that lookahead is the token it expected after the fragment.
+    #    False  syntax error at lookahead.  The error function is called (with
+    #           None at the end of the input), but there is no error recovery.
+    #    None   the input is not a goal fragment.  Either a reduction would pop
+    #           state, a token at lexpos end or later would be shifted, the
+    #           input was accepted, or a rule raised SyntaxError.
+    #
+    # A syntax error found this way is the same first error that a parse of
+    # the whole input would report, because it comes before anything that
+    # depends on the stack below state.
+    #
+    # Every reduction of a nonterminal in record appends the tuple
+    # (name, start, state, value, lookahead) to the list records.  Here start
+    # is the first token of the symbol (the lookahead if the symbol is empty)
+    # and state is the state under the symbol.  The state depends on the type
+    # of start too: it was reached by reductions made with start as the
+    # lookahead.  Before
+    # each action, reuse(lookahead, state) may return (name, value, nexttoken)
+    # to push a nonterminal the caller already has: for example, a subtree of
+    # an earlier parse that starts at lookahead and was built on top of the
+    # same state.  Parsing then goes on with nexttoken as the lookahead.
+    #
+    # Defaulted states are not used, so every reduction has a lookahead.  The
+    # parse uses the dense tables, and builds them if the parser has none.
+    def parsefragment(self, goal, state=0, lexer=None, tokenfunc=None, end=None,
+                      record=(), records=None, reuse=None):
+        if not hasattr(self, 'denseaction'):
+            self.set_dense()
+        newsymbol = self.symbolclass             # Class of the grammar symbols
+        actions = self.denseaction               # Local reference to the flat action table
+        goto    = self.densegoto                 # Local reference to the flat goto table
+        termids = self.termids                   # Integer id of each terminal
+        nontermids = self.nontermids             # Integer id of each nonterminal
+        prodgoto = self.prodgoto                 # Goto column of each production
+        unknownid = len(termids)                 # Id of the token types not in the grammar
+        nterm   = unknownid + 1                  # Row length of the action table
+        nnonterm = len(nontermids)               # Row length of the goto table
+        prod    = self.productions               # Local reference to production list
+        passthrough = self.passthrough           # Productions reduced without calling their rule
+        goalid  = nontermids[goal]               # Goto column of the goal
+        pslice  = YaccProduction(None)           # Production object passed to grammar rules
+
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+        pslice.lexer = lexer
+        pslice.parser = self
+        get_token = lexer.token if tokenfunc is None else tokenfunc
+        self.token = get_token
+        tagged = getattr(lexer, 'lextypeids', None) is termids
+
+        statestack = [state]           # Stack of parsing states
+        self.statestack = statestack
+        sym = newsymbol()
+        sym.type = '$end'
+        symstack = [sym]               # Stack of grammar symbols
+        self.symstack = symstack
+        pslice.stack = symstack
+        startstack = [None]            # First token of each symbol
+
+        lookahead = None
+        while True:
+            if lookahead is None:
+                lookahead = get_token()
+                if not lookahead:
+                    lookahead = newsymbol()
+                    lookahead.type = '$end'
+
+            if reuse is not None and lookahead.type != '$end':
+                reused = reuse(lookahead, state)
+                if reused is not None:
+                    name, value, nexttoken = reused
+                    sym = newsymbol()
+                    sym.type = name
+                    sym.value = value
+                    startstack.append(lookahead)
+                    symstack.append(sym)
+                    state = goto[state * nnonterm + nontermids[name]]
+                    statestack.append(state)
+                    lookahead = nexttoken
+                    if not lookahead:
+                        lookahead = newsymbol()
+                        lookahead.type = '$end'
+                    if name == goal and len(statestack) == 2:
+                        return True, value, lookahead
+                    continue
+
+            if tagged:
+                try:
+                    ltid = lookahead.typeid
+                except AttributeError:
+                    ltid = termids.get(lookahead.type, unknownid)
+            else:
+                ltid = termids.get(lookahead.type, unknownid)
+            t = actions[state * nterm + ltid]
+
+            if t is None:
+                errtoken = lookahead
+                if errtoken.type == '$end':
+                    errtoken = None               # End of file!
+                if self.errorfunc:
+                    if errtoken and not hasattr(errtoken, 'lexer'):
+                        errtoken.lexer = lexer
+                    call_errorfunc(self.errorfunc, errtoken, self)
+                elif errtoken:
+                    sys.stderr.write('yacc: Syntax error, token=%s\n' % errtoken.type)
+                else:
+                    sys.stderr.write('yacc: Parse error in input. EOF\n')
+                return False, None, lookahead
+
+            if t > 0:
+                # shift a symbol on the stack, unless it is past the fragment
+                if end is not None and lookahead.lexpos >= end:
+                    return None, None, lookahead
+                statestack.append(t)
+                state = t
+                symstack.append(lookahead)
+                startstack.append(lookahead)
+                lookahead = None
+                continue
+
+            if t == 0:
+                return None, None, lookahead
+
+            # reduce a symbol on the stack, emit a production
+            p = prod[-t]
+            plen = p.len
+            if plen >= len(statestack):
+                return None, None, lookahead
+            sym = newsymbol()
+            sym.type = p.name
+            sym.value = None
+            if plen:
+                start = startstack[-plen]
+                under = statestack[-plen-1]
+            else:
+                start = lookahead
+                under = state
+
+            if passthrough[-t]:
+                sym.value = symstack[-1].value
+                del symstack[-1]
+                del statestack[-1]
+                del startstack[-1]
+            else:
+                if plen:
+                    targ = symstack[-plen-1:]
+                    targ[0] = sym
+                    del symstack[-plen:]
+                    del statestack[-plen:]
+                    del startstack[-plen:]
+                else:
+                    targ = [sym]
+                pslice.slice = targ
+                try:
+                    p.callable(pslice)
+                except SyntaxError:
+                    return None, None, lookahead
+
+            state = goto[statestack[-1] * nnonterm + prodgoto[-t]]
+            statestack.append(state)
+            symstack.append(sym)
+            startstack.append(start)
+            if records is not None and p.name in record:
+                records.append((p.name, start, under, sym.value, lookahead))
+            if prodgoto[-t] == goalid and len(statestack) == 2:
+                return True, sym.value, lookahead
+
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
 #
@@ -1810,6 +2524,27 @@ class Grammar(object):
 
         return result
 
+    # -------------------------------------------------------------------------
+    # _symbol_bits()
+    #
+    # Symbols that can appear in FIRST and FOLLOW sets, and the bit of each one
+    # in the bitsets used to compute them (see bitset_symbols())
+    # -------------------------------------------------------------------------
+    def _symbol_bits(self):
+        symbols = sorted(self.Terminals) + ['$end', '<empty>']
+        bits = dict((s, 1 << i) for i, s in enumerate(symbols))
+        return symbols, bits
+
+    # FIRST(beta) as a bitset, given the FIRST bitset of every symbol
+    def _first_bits(self, beta, first, empty):
+        result = 0
+        for x in beta:
+            f = first[x]
+            result |= f & ~empty
+            if not f & empty:
+                return result
+        return result | empty
+
     # -------------------------------------------------------------------------
     # compute_first()
     #
@@ -1819,30 +2554,36 @@ class Grammar(object):
         if self.First:
             return self.First
 
+        symbols, bits = self._symbol_bits()
+        empty = bits['<empty>']
+        first = {}
+
         # Terminals:
         for t in self.Terminals:
-            self.First[t] = [t]
+            first[t] = bits[t]
 
-        self.First['$end'] = ['$end']
+        first['$end'] = bits['$end']
 
         # Nonterminals:
 
         # Initialize to the empty set:
         for n in self.Nonterminals:
-            self.First[n] = []
+            first[n] = 0
 
         # Then propagate symbols until no change:
         while True:
             some_change = False
             for n in self.Nonterminals:
                 for p in self.Prodnames[n]:
-                    for f in self._first(p.prod):
-                        if f not in self.First[n]:
-                            self.First[n].append(f)
-                            some_change = True
+                    f = self._first_bits(p.prod, first, empty)
+                    if f & ~first[n]:
+                        first[n] |= f
+                        some_change = True
             if not some_change:
                 break
 
+        for x, f in first.items():
+            self.First[x] = bitset_symbols(f, symbols)
         return self.First
 
     # ---------------------------------------------------------------------
@@ -1861,14 +2602,24 @@ class Grammar(object):
         if not self.First:
             self.compute_first()
 
+        symbols, bits = self._symbol_bits()
+        empty = bits['<empty>']
+        first = {}
+        for x, fs in self.First.items():
+            f = 0
+            for s in fs:
+                f |= bits[s]
+            first[x] = f
+
         # Add '$end' to the follow list of the start symbol
+        follow = {}
         for k in self.Nonterminals:
-            self.Follow[k] = []
+            follow[k] = 0
 
         if not start:
             start = self.Productions[1].name
 
-        self.Follow[start] = ['$end']
+        follow[start] = bits['$end']
 
         while True:
             didadd = False
@@ -1877,22 +2628,19 @@ class Grammar(object):
                 for i, B in enumerate(p.prod):
                     if B in self.Nonterminals:
                         # Okay. We got a non-terminal in a production
-                        fst = self._first(p.prod[i+1:])
-                        hasempty = False
-                        for f in fst:
-                            if f != '<empty>' and f not in self.Follow[B]:
-                                self.Follow[B].append(f)
-                                didadd = True
-                            if f == '<empty>':
-                                hasempty = True
-                        if hasempty or i == (len(p.prod)-1):
+                        fst = self._first_bits(p.prod[i+1:], first, empty)
+                        f = fst & ~empty
+                        if fst & empty or i == (len(p.prod)-1):
                             # Add elements of follow(a) to follow(b)
-                            for f in self.Follow[p.name]:
-                                if f not in self.Follow[B]:
-                                    self.Follow[B].append(f)
-                                    didadd = True
+                            f |= follow[p.name]
+                        if f & ~follow[B]:
+                            follow[B] |= f
+                            didadd = True
             if not didadd:
                 break
+
+        for k, f in follow.items():
+            self.Follow[k] = bitset_symbols(f, symbols)
         return self.Follow
 
 
@@ -2004,12 +2752,78 @@ class LRTable(object):
         in_f.close()
         return signature
 
+    # ------------------------------------------------------------
+    # read_binary() - Read tables written by write_binary()
+    #
+    # The file is mapped into memory and the action and goto tables
+    # are used in place as dense int32 arrays indexed by (state,
+    # symbol id).  The per-state dictionaries that the parsing engine
+    # uses are only built for the states the parser actually visits,
+    # so loading takes about the same time for any grammar size.
+    # ------------------------------------------------------------
+    def read_binary(self, filename):
+        if not os.path.exists(filename):
+            raise ImportError
+
+        with open(filename, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if data[:len(binary_magic)] != binary_magic:
+            raise VersionError('%s is not a binary table file' % filename)
+        start = len(binary_magic) + 4
+        headerlen = int.from_bytes(data[len(binary_magic):start], 'little')
+        header = json.loads(data[start:start+headerlen].decode('utf-8'))
+        if header['tabversion'] != __tabversion__:
+            raise VersionError('yacc table file version is out of date')
+        if header['byteorder'] != sys.byteorder or array('i').itemsize != 4:
+            raise VersionError('yacc table file was written on a different platform')
+
+        terminals = header['terminals']
+        nonterminals = header['nonterminals']
+        nstates = header['states']
+        offset = start + headerlen
+        cells = memoryview(data)[offset:].cast('i')
+        action = cells[:nstates * len(terminals)]
+        goto = cells[nstates * len(terminals):nstates * (len(terminals) + len(nonterminals))]
+
+        self.lr_method = header['method']
+        self.lr_action = _BinaryRows(action, terminals, binary_noaction)
+        self.lr_action.defaulted_states = dict(header['defaulted'])
+        self.lr_goto = _BinaryRows(goto, nonterminals, -1)
+        self.lr_productions = []
+        for p in header['productions']:
+            self.lr_productions.append(MiniProduction(*p))
+        return header['signature']
+
     # Bind all production function names to callable objects in pdict
     def bind_callables(self, pdict):
         for p in self.lr_productions:
             p.bind(pdict)
 
 
+# Rows of a table read by LRTable.read_binary().  It is a dictionary mapping
+# state -> {symbol: value}, as in the other table formats, whose entries are
+# built from the dense array the first time each state is looked up.
+class _BinaryRows(dict):
+    def __init__(self, cells, symbols, empty):
+        dict.__init__(self)
+        self.cells = cells
+        self.symbols = symbols
+        self.empty = empty
+        self.defaulted_states = None
+
+    def __missing__(self, state):
+        n = len(self.symbols)
+        if not 0 <= state < len(self.cells) // max(n, 1):
+            raise KeyError(state)
+        row = {}
+        empty = self.empty
+        for symbol, value in zip(self.symbols, self.cells[state * n:(state + 1) * n]):
+            if value != empty:
+                row[symbol] = value
+        self[state] = row
+        return row
+
 # -----------------------------------------------------------------------------
 #                           === LR Generator ===
 #
@@ -2027,11 +2841,12 @@ class LRTable(object):
 #     F(x) = F'(x) U U{F(y) | x R y}
 #
 # This is used to compute the values of Read() sets as well as FOLLOW sets
-# in LALR(1) generation.
+# in LALR(1) generation.  The sets are bitsets (see bitset_symbols()), so
+# the union is a single | operation.
 #
 # Inputs:  X    - An input set
 #          R    - A relation
-#          FP   - Set-valued function
+#          FP   - Set-valued function, returning a bitset
 # ------------------------------------------------------------------------------
 
 def digraph(X, R, FP):
@@ -2056,9 +2871,7 @@ def traverse(x, N, stack, F, X, R, FP):
         if N[y] == 0:
             traverse(y, N, stack, F, X, R, FP)
         N[x] = min(N[x], N[y])
-        for a in F.get(y, []):
-            if a not in F[x]:
-                F[x].append(a)
+        F[x] |= F.get(y, 0)
     if N[x] == d:
         N[stack[-1]] = MAXINT
         F[stack[-1]] = F[x]
@@ -2068,6 +2881,22 @@ def traverse(x, N, stack, F, X, R, FP):
             F[stack[-1]] = F[x]
             element = stack.pop()
 
+# -----------------------------------------------------------------------------
+# bitset_symbols()
+#
+# The FIRST, FOLLOW and lookahead computations represent sets of terminals as
+# Python integers used as bitsets: bit i is set if the set holds symbols[i].
+# This function returns the symbols of a bitset, in the order of symbols.
+# -----------------------------------------------------------------------------
+
+def bitset_symbols(bits, symbols):
+    result = []
+    while bits:
+        low = bits & -bits
+        result.append(symbols[low.bit_length() - 1])
+        bits ^= low
+    return result
+
 class LALRError(YaccError):
     pass
 
@@ -2097,6 +2926,7 @@ class LRGeneratedTable(LRTable):
         self.lr_productions  = grammar.Productions    # Copy of grammar Production array
         self.lr_goto_cache = {}        # Cache of computed gotos
         self.lr0_cidhash   = {}        # Cache of closures
+        self.lr0_transitions = []      # Transitions of each LR(0) state: symbol -> state
 
         self._add_count    = 0         # Internal counter used to detect cycles
 
@@ -2148,24 +2978,30 @@ class LRGeneratedTable(LRTable):
         if g:
             return g
 
-        # Now we generate the goto set in a way that guarantees uniqueness
-        # of the result
+        gs = []
+        for p in I:
+            n = p.lr_next
+            if n and n.lr_before == x:
+                gs.append(n)
+        g = self.lr0_goto_kernel(x, gs)
+        self.lr_goto_cache[(id(I), x)] = g
+        return g
 
+    # Returns the goto set whose kernel is the list of items gs (the items of
+    # a set I advanced over the symbol x).  The same kernel always gives the
+    # same Python object.
+    def lr0_goto_kernel(self, x, gs):
         s = self.lr_goto_cache.get(x)
         if not s:
             s = {}
             self.lr_goto_cache[x] = s
 
-        gs = []
-        for p in I:
-            n = p.lr_next
-            if n and n.lr_before == x:
-                s1 = s.get(id(n))
-                if not s1:
-                    s1 = {}
-                    s[id(n)] = s1
-                gs.append(n)
-                s = s1
+        for n in gs:
+            s1 = s.get(id(n))
+            if not s1:
+                s1 = {}
+                s[id(n)] = s1
+            s = s1
         g = s.get('$end')
         if not g:
             if gs:
@@ -2173,7 +3009,6 @@ class LRGeneratedTable(LRTable):
                 s['$end'] = g
             else:
                 s['$end'] = gs
-        self.lr_goto_cache[(id(I), x)] = g
         return g
 
     # Compute the LR(0) sets of item function
@@ -2196,12 +3031,28 @@ class LRGeneratedTable(LRTable):
                 for s in ii.usyms:
                     asyms[s] = None
 
+            # Kernels of all the goto(I,X) sets, built in a single pass over I
+            kernels = {}
+            for ii in I:
+                n = ii.lr_next
+                if n:
+                    if n.lr_before not in kernels:
+                        kernels[n.lr_before] = []
+                    kernels[n.lr_before].append(n)
+
+            trans = {}
             for x in asyms:
-                g = self.lr0_goto(I, x)
-                if not g or id(g) in self.lr0_cidhash:
+                if x not in kernels:
                     continue
-                self.lr0_cidhash[id(g)] = len(C)
-                C.append(g)
+                g = self.lr0_goto_kernel(x, kernels[x])
+                self.lr_goto_cache[(id(I), x)] = g
+                j = self.lr0_cidhash.get(id(g))
+                if j is None:
+                    j = len(C)
+                    self.lr0_cidhash[id(g)] = j
+                    C.append(g)
+                trans[x] = j
+            self.lr0_transitions.append(trans)
 
         return C
 
@@ -2264,12 +3115,14 @@ class LRGeneratedTable(LRTable):
 
     def find_nonterminal_transitions(self, C):
         trans = []
+        found = set()
         for stateno, state in enumerate(C):
             for p in state:
                 if p.lr_index < p.len - 1:
                     t = (stateno, p.prod[p.lr_index+1])
                     if t[1] in self.grammar.Nonterminals:
-                        if t not in trans:
+                        if t not in found:
+                            found.add(t)
                             trans.append(t)
         return trans
 
@@ -2279,25 +3132,24 @@ class LRGeneratedTable(LRTable):
     # Computes the DR(p,A) relationships for non-terminal transitions.  The input
     # is a tuple (state,N) where state is a number and N is a nonterminal symbol.
     #
-    # Returns a list of terminals.
+    # Returns a bitset of terminals (see bitset_symbols() and self.lr_terminals).
     # -----------------------------------------------------------------------------
 
     def dr_relation(self, C, trans, nullable):
-        dr_set = {}
         state, N = trans
-        terms = []
+        terms = 0
+        termbits = self.lr_termbits
 
-        g = self.lr0_goto(C[state], N)
+        g = C[self.lr0_transitions[state][N]]
         for p in g:
             if p.lr_index < p.len - 1:
                 a = p.prod[p.lr_index+1]
                 if a in self.grammar.Terminals:
-                    if a not in terms:
-                        terms.append(a)
+                    terms |= termbits[a]
 
         # This extra bit is to handle the start state
         if state == 0 and N == self.grammar.Productions[0].prod[0]:
-            terms.append('$end')
+            terms |= termbits['$end']
 
         return terms
 
@@ -2312,8 +3164,8 @@ class LRGeneratedTable(LRTable):
         rel = []
         state, N = trans
 
-        g = self.lr0_goto(C[state], N)
-        j = self.lr0_cidhash.get(id(g), -1)
+        j = self.lr0_transitions[state][N]
+        g = C[j]
         for p in g:
             if p.lr_index < p.len - 1:
                 a = p.prod[p.lr_index + 1]
@@ -2359,14 +3211,21 @@ class LRGeneratedTable(LRTable):
         for t in trans:
             dtrans[t] = 1
 
+        # Items of each state, grouped by the name of their production
+        itemsbyname = []
+        for I in C:
+            names = {}
+            for p in I:
+                if p.name not in names:
+                    names[p.name] = []
+                names[p.name].append(p)
+            itemsbyname.append(names)
+
         # Loop over all transitions and compute lookbacks and includes
         for state, N in trans:
             lookb = []
             includes = []
-            for p in C[state]:
-                if p.name != N:
-                    continue
-
+            for p in itemsbyname[state].get(N, ()):
                 # Okay, we have a name match.  We now follow the production all the way
                 # through the state machine until we get the . on the right hand side
 
@@ -2393,13 +3252,10 @@ class LRGeneratedTable(LRTable):
                             # Appears to be a relation between (j,t) and (state,N)
                             includes.append((j, t))
 
-                    g = self.lr0_goto(C[j], t)               # Go to next set
-                    j = self.lr0_cidhash.get(id(g), -1)      # Go to next state
+                    j = self.lr0_transitions[j][t]           # Go to next state
 
                 # When we get here, j is the final state, now we have to locate the production
-                for r in C[j]:
-                    if r.name != p.name:
-                        continue
+                for r in itemsbyname[j].get(p.name, ()):
                     if r.len != p.len:
                         continue
                     i = 0
@@ -2471,15 +3327,19 @@ class LRGeneratedTable(LRTable):
     # -----------------------------------------------------------------------------
 
     def add_lookaheads(self, lookbacks, followset):
+        added = []
         for trans, lb in lookbacks.items():
+            f = followset.get(trans, 0)
             # Loop over productions in lookback
             for state, p in lb:
                 if state not in p.lookaheads:
-                    p.lookaheads[state] = []
-                f = followset.get(trans, [])
-                for a in f:
-                    if a not in p.lookaheads[state]:
-                        p.lookaheads[state].append(a)
+                    p.lookaheads[state] = 0
+                    added.append((state, p))
+                p.lookaheads[state] |= f
+
+        # The parse table is built from lists of terminals
+        for state, p in added:
+            p.lookaheads[state] = bitset_symbols(p.lookaheads[state], self.lr_terminals)
 
     # -----------------------------------------------------------------------------
     # add_lalr_lookaheads()
@@ -2489,6 +3349,10 @@ class LRGeneratedTable(LRTable):
     # -----------------------------------------------------------------------------
 
     def add_lalr_lookaheads(self, C):
+        # Bit of each terminal in the lookahead bitsets
+        self.lr_terminals = sorted(self.grammar.Terminals) + ['$end']
+        self.lr_termbits = dict((t, 1 << i) for i, t in enumerate(self.lr_terminals))
+
         # Determine all of the nullable nonterminals
         nullable = self.compute_nullable_nonterminals()
 
@@ -2610,8 +3474,7 @@ class LRGeneratedTable(LRTable):
                         i = p.lr_index
                         a = p.prod[i+1]       # Get symbol right after the "."
                         if a in self.grammar.Terminals:
-                            g = self.lr0_goto(I, a)
-                            j = self.lr0_cidhash.get(id(g), -1)
+                            j = self.lr0_transitions[st].get(a, -1)
                             if j >= 0:
                                 # We are in a shift state
                                 actlist.append((a, p, 'shift and go to state %d' % j))
@@ -2678,8 +3541,7 @@ class LRGeneratedTable(LRTable):
                     if s in self.grammar.Nonterminals:
                         nkeys[s] = None
             for n in nkeys:
-                g = self.lr0_goto(I, n)
-                j = self.lr0_cidhash.get(id(g), -1)
+                j = self.lr0_transitions[st].get(n, -1)
                 if j >= 0:
                     st_goto[n] = j
                     log.info('    %-30s shift and go to state %d', n, j)
@@ -2837,6 +3699,68 @@ del _lr_goto_items
                     outp.append((str(p), p.name, p.len, None, None, None))
             pickle.dump(outp, outf, pickle_protocol)
 
+    # ------------------------------------------------------------
+    # write_binary() - Write the tables in the format of read_binary()
+    #
+    #     magic, header length (4 bytes, little endian), JSON header,
+    #     action table (states x terminals, int32),
+    #     goto table (states x nonterminals, int32)
+    #
+    # The file is written under a temporary name and renamed, so other
+    # processes never see a partial table.
+    # ------------------------------------------------------------
+    def write_binary(self, filename, signature=''):
+        terminals = sorted(set(t for row in self.lr_action.values() for t in row))
+        nonterminals = sorted(set(n for row in self.lr_goto.values() for n in row))
+        nstates = max(list(self.lr_action) + list(self.lr_goto) + [-1]) + 1
+        tindex = dict((t, i) for i, t in enumerate(terminals))
+        nindex = dict((n, i) for i, n in enumerate(nonterminals))
+
+        action = array('i', [binary_noaction]) * (nstates * len(terminals))
+        for state, row in self.lr_action.items():
+            for t, value in row.items():
+                action[state * len(terminals) + tindex[t]] = value
+        goto = array('i', [-1]) * (nstates * len(nonterminals))
+        for state, row in self.lr_goto.items():
+            for n, value in row.items():
+                goto[state * len(nonterminals) + nindex[n]] = value
+
+        defaulted = []
+        for state, row in sorted(self.lr_action.items()):
+            rules = list(row.values())
+            if len(rules) == 1 and rules[0] < 0:
+                defaulted.append((state, rules[0]))
+
+        productions = []
+        for p in self.lr_productions:
+            if p.func:
+                productions.append((p.str, p.name, p.len, p.func, os.path.basename(p.file), p.line))
+            else:
+                productions.append((str(p), p.name, p.len, None, None, None))
+
+        header = json.dumps({
+            'tabversion': __tabversion__,
+            'method': self.lr_method,
+            'signature': signature,
+            'byteorder': sys.byteorder,
+            'states': nstates,
+            'terminals': terminals,
+            'nonterminals': nonterminals,
+            'defaulted': defaulted,
+            'productions': productions,
+        }).encode('utf-8')
+        # Pad the header so that the tables start at a multiple of 4 bytes
+        header += b' ' * (-(len(binary_magic) + 4 + len(header)) % 4)
+
+        tmpname = '%s.%d.tmp' % (filename, os.getpid())
+        with open(tmpname, 'wb') as outf:
+            outf.write(binary_magic)
+            outf.write(len(header).to_bytes(4, 'little'))
+            outf.write(header)
+            action.tofile(outf)
+            goto.tofile(outf)
+        os.replace(tmpname, filename)
+
 # -----------------------------------------------------------------------------
 #                            === INTROSPECTION ===
 #
@@ -3182,6 +4106,105 @@ class ParserReflect(object):
 
         self.grammar = grammar
 
+# -----------------------------------------------------------------------------
+#                              === Fast start ===
+#
+# With yacc(faststart=True) and a binary or pickled table file, yacc() writes
+# a stamp file next to the tables (the table file name plus '.stamp').  It
+# records the signature of the tables, the start symbol, tokens and precedence
+# of the grammar, and the size and modification time of the files that define
+# its rules.  While all of them still match, yacc() binds the cached tables
+# without running ParserReflect: the rule docstrings are not read again and no
+# signature is computed.  check_faststart() runs the skipped validation on a
+# parser built this way.
+# -----------------------------------------------------------------------------
+
+# Values of the grammar compared by the stamp, in the form they have in JSON
+def _stamp_grammar(pdict):
+    tokens = pdict.get('tokens')
+    precedence = pdict.get('precedence')
+    return {
+        'start': pdict.get('start'),
+        'tokens': list(tokens) if isinstance(tokens, (list, tuple)) else None,
+        'precedence': [list(p) for p in precedence] if isinstance(precedence, (list, tuple)) else None,
+    }
+
+# Size and modification time of each file, or None if one cannot be read
+def _stamp_files(filenames):
+    files = []
+    for filename in filenames:
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return None
+        files.append([filename, st.st_size, st.st_mtime_ns])
+    return files
+
+def write_stamp(stampfile, signature, pinfo):
+    filenames = set()
+    if pinfo.pdict.get('__file__'):
+        filenames.add(os.path.abspath(pinfo.pdict['__file__']))
+    for line, module, name, doc in pinfo.pfuncs:
+        filename = getattr(module, '__file__', None)
+        if not filename:
+            return
+        filenames.add(os.path.abspath(filename))
+    files = _stamp_files(sorted(filenames))
+    if files is None:
+        return
+    stamp = _stamp_grammar(pinfo.pdict)
+    stamp['tabversion'] = __tabversion__
+    stamp['signature'] = signature
+    stamp['files'] = files
+    try:
+        data = json.dumps(stamp)
+    except (TypeError, ValueError):
+        return
+
+    tmpname = '%s.%d.tmp' % (stampfile, os.getpid())
+    with open(tmpname, 'w') as outf:
+        outf.write(data)
+    os.replace(tmpname, stampfile)
+
+# Returns the signature recorded in the stamp file if the stamp is still valid
+# for pdict, or None
+def read_stamp(stampfile, pdict):
+    try:
+        with open(stampfile) as f:
+            stamp = json.load(f)
+    except (IOError, ValueError):
+        return None
+    try:
+        if stamp['tabversion'] != __tabversion__:
+            return None
+        for key, value in _stamp_grammar(pdict).items():
+            if stamp[key] != value:
+                return None
+        if _stamp_files([f[0] for f in stamp['files']]) != stamp['files']:
+            return None
+        return stamp['signature']
+    except (KeyError, TypeError, IndexError):
+        return None
+
+# Runs the checks that yacc(faststart=True) skipped on a parser built from
+# cached tables: the full validation of the grammar and the comparison of its
+# signature with the one of the tables.  Returns True if both pass (and for
+# parsers that were not built from a stamp).
+def check_faststart(parser, errorlog=None):
+    if not getattr(parser, 'faststart', None):
+        return True
+    pdict, signature = parser.faststart
+    if errorlog is None:
+        errorlog = PlyLogger(sys.stderr)
+    pinfo = ParserReflect(pdict, log=errorlog)
+    pinfo.get_all()
+    if pinfo.error or pinfo.validate_all():
+        return False
+    if pinfo.signature() != signature:
+        errorlog.warning('The grammar does not match the cached parsing tables')
+        return False
+    return True
+
 # -----------------------------------------------------------------------------
 # yacc(module)
 #
@@ -3190,7 +4213,8 @@ class ParserReflect(object):
 
 def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, start=None,
          check_recursion=True, optimize=False, write_tables=True, debugfile=debug_file,
-         outputdir=None, debuglog=None, errorlog=None, picklefile=None):
+         outputdir=None, debuglog=None, errorlog=None, picklefile=None, binaryfile=None,
+         dense=False, faststart=False):
 
     if tabmodule is None:
         tabmodule = tab_module
@@ -3198,8 +4222,8 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
     # Reference to the parsing method of the last built parser
     global parse
 
-    # If pickling is enabled, table files are not created
-    if picklefile:
+    # If pickling or binary tables are enabled, table files are not created
+    if picklefile or binaryfile:
         write_tables = 0
 
     if errorlog is None:
@@ -3245,6 +4269,29 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
     if start is not None:
         pdict['start'] = start
 
+    # Fast start: load the tables without reflection if the stamp is valid
+    stampfile = None
+    if faststart and (binaryfile or picklefile):
+        stampfile = (binaryfile or picklefile) + '.stamp'
+        stamped_signature = read_stamp(stampfile, pdict)
+        if stamped_signature is not None:
+            try:
+                lr = LRTable()
+                if binaryfile:
+                    read_signature = lr.read_binary(binaryfile)
+                else:
+                    read_signature = lr.read_pickle(picklefile)
+                if read_signature == stamped_signature:
+                    lr.bind_callables(pdict)
+                    parser = LRParser(lr, pdict.get('p_error'))
+                    parser.faststart = (pdict, read_signature)
+                    if dense:
+                        parser.set_dense()
+                    parse = parser.parse
+                    return parser
+            except Exception:
+                pass
+
     # Collect parser information from the dictionary
     pinfo = ParserReflect(pdict, log=errorlog)
     pinfo.get_all()
@@ -3258,7 +4305,9 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
     # Read the tables
     try:
         lr = LRTable()
-        if picklefile:
+        if binaryfile:
+            read_signature = lr.read_binary(binaryfile)
+        elif picklefile:
             read_signature = lr.read_pickle(picklefile)
         else:
             read_signature = lr.read_table(tabmodule)
@@ -3266,6 +4315,13 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
             try:
                 lr.bind_callables(pinfo.pdict)
                 parser = LRParser(lr, pinfo.error_func)
+                if stampfile and read_signature == signature:
+                    try:
+                        write_stamp(stampfile, signature, pinfo)
+                    except IOError as e:
+                        errorlog.warning("Couldn't create %r. %s" % (stampfile, e))
+                if dense:
+                    parser.set_dense()
                 parse = parser.parse
                 return parser
             except Exception as e:
@@ -3463,9 +4519,25 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
         except IOError as e:
             errorlog.warning("Couldn't create %r. %s" % (picklefile, e))
 
+    # Write the binary version of the tables
+    if binaryfile:
+        try:
+            lr.write_binary(binaryfile, signature)
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (binaryfile, e))
+
+    # Write the stamp that lets the next run skip the reflection
+    if stampfile:
+        try:
+            write_stamp(stampfile, signature, pinfo)
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (stampfile, e))
+
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
+    if dense:
+        parser.set_dense()
 
     parse = parser.parse
     return parser
@@ -6,9 +6,15 @@
 # Users should edit the method LParser.parsedebug() in yacc.py.   The source code 
 # for that method is then used to create the other methods.   See the comments in
 # yacc.py for further details.
+#
+# It also writes standalone parser modules for a grammar (see write_parser()):
+#
+#     python ply/ygen.py grammarmodule outputfile.py
 
 import os.path
 import shutil
+import sys
+import importlib
 
 def get_source_range(lines, tag):
     srclines = enumerate(lines)
@@ -65,8 +71,497 @@ def main():
 
     print('Updated yacc.py')
 
+# -----------------------------------------------------------------------------
+#                      === Standalone parser modules ===
+#
+# write_parser() writes a Python module with the parser of one grammar.  The
+# LR tables are inlined in it as constants in the dense format of
+# LRParser.set_dense(), and its Parser class (a subclass of yacc.LRParser)
+# binds the productions straight to the rule functions of the grammar, so
+# importing it does not run yacc.yacc(): no reflection of the grammar module,
+# no signature and no table file.  parse() runs parsegenerated(), a version
+# of LRParser.parsedense() specialized for the generated tables.  Debug and
+# tracking parses use the methods inherited from LRParser.
+#
+# The module can only be used with the grammar it was generated from.  Its
+# check(pdict) function compares the start symbol, tokens, precedence and
+# rule functions of pdict with the ones recorded in the module; regenerate
+# the module when it returns False.
+# -----------------------------------------------------------------------------
+
+# Writes a sequence as a tuple literal, a few items per line
+def format_tuple(items, per_line=16):
+    items = [repr(x) for x in items]
+    if not items:
+        return '()'
+    lines = []
+    for i in range(0, len(items), per_line):
+        lines.append('    ' + ', '.join(items[i:i+per_line]) + ',')
+    return '(\n' + '\n'.join(lines) + '\n)'
+
+# Rule functions of a grammar, as (name, docstring) pairs sorted by name
+def grammar_rules(pdict):
+    rules = []
+    for name, item in pdict.items():
+        if name.startswith('p_') and name != 'p_error':
+            rules.append((name, getattr(item, '__doc__', None)))
+    rules.sort()
+    return rules
+
+def grammar_precedence(pdict):
+    return [tuple(p) for p in pdict.get('precedence', ())]
+
+# Code that builds the list of values passed to a value rule, unrolled for
+# each production length of the grammar (most frequent lengths first)
+def values_code(lengths, indent):
+    counts = {}
+    for n in lengths:
+        counts[n] = counts.get(n, 0) + 1
+    lines = []
+    for n in sorted((n for n in counts if n), key=lambda n: (-counts[n], n)):
+        items = ', '.join(['None'] + ['symstack[-%d].value' % k for k in range(n, 0, -1)])
+        lines.append('%s plen == %d:' % ('elif' if lines else 'if', n))
+        lines.append('    values = [%s]' % items)
+    if lines:
+        lines.append('else:')
+        lines.append('    values = [None]')
+    else:
+        lines.append('values = [None]')
+    return ''.join(indent + line + '\n' for line in lines)
+
+def write_parser(parser, pdict, filename):
+    from . import yacc
+
+    if not getattr(parser, 'dense', False):
+        parser.set_dense()
+    terminals = [None] * len(parser.termids)
+    for t, i in parser.termids.items():
+        terminals[i] = t
+    nonterminals = [None] * len(parser.nontermids)
+    for n, i in parser.nontermids.items():
+        nonterminals[i] = n
+
+    productions = []
+    for p in parser.productions:
+        productions.append((p.str, p.name, p.len, p.func, p.file and os.path.basename(p.file), p.line))
+
+    module = _parser_module_template % {
+        'filename': os.path.basename(filename),
+        'source': os.path.basename(pdict.get('__file__') or '<grammar>'),
+        'tabversion': yacc.__tabversion__,
+        'start': pdict.get('start'),
+        'tokens': list(pdict.get('tokens', ())),
+        'precedence': grammar_precedence(pdict),
+        'rules': format_tuple(grammar_rules(pdict), 1),
+        'productions': format_tuple(productions, 1),
+        'terminals': format_tuple(terminals),
+        'nonterminals': format_tuple(nonterminals),
+        'action': format_tuple(parser.denseaction, len(terminals) + 1),
+        'goto': format_tuple(parser.densegoto, max(len(nonterminals), 1)),
+        'defaulted': format_tuple(parser.densedefaulted),
+        'prodgoto': format_tuple(parser.prodgoto),
+    } + _parser_code
+    indent = ' ' * 24
+    module = module.replace(indent + '#--! values\n',
+                            values_code([p.len for p in parser.productions[1:]], indent))
+
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    with open(tmpname, 'w') as f:
+        f.write(module)
+    os.replace(tmpname, filename)
+
+_parser_module_template = '''\
+# %(filename)s
+# This file is automatically generated by ply/ygen.py from the grammar in
+# %(source)s.  Do not edit it: regenerate it when the grammar changes.
+
+import sys
+from ply import yacc
+from ply import ygen
+
+_tabversion = %(tabversion)r
+
+# Grammar this module was generated from (see check())
+_start = %(start)r
+_tokens = %(tokens)r
+_precedence = %(precedence)r
+_rules = %(rules)s
+
+# Productions: (str, name, len, func, file, line)
+_productions = %(productions)s
+
+# Dense tables (see yacc.LRParser.set_dense())
+_terminals = %(terminals)s
+_nonterminals = %(nonterminals)s
+_action = %(action)s
+_goto = %(goto)s
+_defaulted = %(defaulted)s
+_prodgoto = %(prodgoto)s
+'''
+
+_parser_code = r'''
+_nterm = len(_terminals) + 1
+_nnonterm = len(_nonterminals)
+_unknownid = len(_terminals)
+_names = tuple(p[1] for p in _productions)
+_lens = tuple(p[2] for p in _productions)
+
+# Cache of yacc.is_value_rule() for the rule functions
+_value_rules = {}
+
+def value_rule(f):
+    try:
+        return _value_rules[f]
+    except KeyError:
+        result = _value_rules[f] = yacc.is_value_rule(f)
+        return result
+
+# Returns True if pdict holds the grammar this module was generated from
+def check(pdict):
+    return (yacc.__tabversion__ == _tabversion and pdict.get('start') == _start and
+            list(pdict.get('tokens', ())) == _tokens and
+            ygen.grammar_precedence(pdict) == _precedence and
+            tuple(ygen.grammar_rules(pdict)) == _rules)
+
+class Parser(yacc.LRParser):
+    def __init__(self, pdict):
+        lr = yacc.LRTable()
+        lr.lr_method = 'LALR'
+        lr.lr_productions = [yacc.MiniProduction(*p) for p in _productions]
+        # The last column of _action is the one of the unknown token types
+        lr.lr_action = yacc._BinaryRows(_action, _terminals + ('',), None)
+        lr.lr_action.defaulted_states = dict((s, r) for s, r in enumerate(_defaulted) if r is not None)
+        lr.lr_goto = yacc._BinaryRows(_goto, _nonterminals, -1)
+        lr.bind_callables(pdict)
+        yacc.LRParser.__init__(self, lr, pdict.get('p_error'))
+
+        self.termids = dict((t, i) for i, t in enumerate(_terminals))
+        self.nontermids = dict((n, i) for i, n in enumerate(_nonterminals))
+        self.denseaction = _action
+        self.densegoto = _goto
+        self.densedefaulted = _defaulted
+        self.prodgoto = _prodgoto
+        self.dense = True
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        if debug or tracking or yacc.yaccdevel:
+            return yacc.LRParser.parse(self, input, lexer, debug, tracking, tokenfunc)
+        return self.parsegenerated(input, lexer, debug, tracking, tokenfunc)
+
+    # Same algorithm as yacc.LRParser.parsedense(), with the tables of this
+    # module and the name, length and rule of each production read from
+    # lists indexed by the production number.  Two reductions are cheaper:
+    #   - a passthrough reduction of a symbol made by the parser retypes it
+    #     in place instead of copying it
+    #   - rules that only use p[n] (see yacc.is_value_rule()) are called with
+    #     a list of values, built by code unrolled for each rule length,
+    #     instead of the YaccProduction object
+    def parsegenerated(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        lookahead = None                         # Current lookahead symbol
+        newsymbol = self.symbolclass             # Class of the grammar symbols
+        lookaheadstack = []                      # Stack of lookahead symbols
+        actions = _action                        # Flat action table
+        goto    = _goto                          # Flat goto table
+        termids = self.termids                   # Integer id of each terminal
+        unknownid = _unknownid                   # Id of the token types not in the grammar
+        nterm   = _nterm                         # Row length of the action table
+        nnonterm = _nnonterm                     # Row length of the goto table
+        names   = _names                         # Name of each production
+        lens    = _lens                          # Length of each production
+        prodgoto = _prodgoto                     # Goto column of each production
+        funcs   = [p.callable for p in self.productions]  # Rule of each production
+        valuerules = [value_rule(f) for f in funcs]       # Rules called with a list of values
+        passthrough = self.passthrough           # Productions reduced without calling their rule
+        defaulted_states = _defaulted            # Default reduction of each state (or None)
+        error_count = yacc.error_count           # Symbols to shift before leaving error recovery
+        pslice  = yacc.YaccProduction(None)      # Production object passed to grammar rules
+        errorcount = 0                           # Used during error recovery
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from ply import lex
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        if tokenfunc is None:
+            # Tokenize function
+            get_token = lexer.token
+        else:
+            get_token = tokenfunc
+
+        # Tokens carry their id if the lexer tags them with our ids
+        tagged = getattr(lexer, 'lextypeids', None) is termids
+
+        # Set the parser() token method (sometimes used in error recovery)
+        self.token = get_token
+
+        # Set up the state and symbol stacks
+        statestack = []                # Stack of parsing states
+        self.statestack = statestack
+        symstack   = []                # Stack of grammar symbols
+        self.symstack = symstack
+
+        pslice.stack = symstack         # Put in the production
+        errtoken   = None               # Err token
+
+        # The start state is assumed to be (0,$end)
+        statestack.append(0)
+        sym = newsymbol()
+        sym.type = '$end'
+        symstack.append(sym)
+        state = 0
+        while True:
+            t = defaulted_states[state]
+            if t is None:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()     # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = newsymbol()
+                        lookahead.type = '$end'
+
+                # Check the action table.  The $end and error symbols made
+                # by the parser are not tagged.
+                if tagged:
+                    try:
+                        ltid = lookahead.typeid
+                    except AttributeError:
+                        ltid = termids.get(lookahead.type, unknownid)
+                else:
+                    ltid = termids.get(lookahead.type, unknownid)
+                t = actions[state * nterm + ltid]
+
+            if t is not None:
+                if t > 0:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+                    symstack.append(lookahead)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                if t < 0:
+                    # reduce a symbol on the stack, emit a production
+                    rule = -t
+                    pname = names[rule]
+
+                    if passthrough[rule]:
+                        # Unit production whose rule only does p[0] = p[1]
+                        t1 = symstack[-1]
+                        if t1.__class__ is newsymbol:
+                            t1.type = pname
+                        else:
+                            sym = newsymbol()
+                            sym.type = pname
+                            sym.value = t1.value
+                            symstack[-1] = sym
+                        state = goto[statestack[-2] * nnonterm + prodgoto[rule]]
+                        statestack[-1] = state
+                        continue
+
+                    plen = lens[rule]
+
+                    if valuerules[rule]:
+                        # The rule only uses p[n] with constant n >= 0, so it
+                        # gets a plain list with the values of the symbols
+                        #--! values
+                        try:
+                            if plen:
+                                del symstack[-plen:]
+                                del statestack[-plen:]
+                            funcs[rule](values)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym = newsymbol()
+                            sym.type = 'error'
+                            sym.value = values[0]
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                            continue
+                        sym = newsymbol()
+                        sym.type = pname
+                        sym.value = values[0]
+                        symstack.append(sym)
+                        state = goto[statestack[-1] * nnonterm + prodgoto[rule]]
+                        statestack.append(state)
+                        continue
+
+                    sym = newsymbol()
+                    sym.type = pname       # Production name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            del statestack[-plen:]
+                            funcs[rule](pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1] * nnonterm + prodgoto[rule]]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                    else:
+                        pslice.slice = [sym]
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            funcs[rule](pslice)
+                            symstack.append(sym)
+                            state = goto[statestack[-1] * nnonterm + prodgoto[rule]]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                if t == 0:
+                    n = symstack[-1]
+                    result = getattr(n, 'value', None)
+                    return result
+
+            if t is None:
+                # Syntax error: the same recovery as yacc.LRParser.parsedebug()
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == '$end':
+                        errtoken = None               # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, 'lexer'):
+                            errtoken.lexer = lexer
+                        tok = yacc.call_errorfunc(self.errorfunc, errtoken, self)
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, 'lineno'):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                            else:
+                                sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                        else:
+                            sys.stderr.write('yacc: Parse error in input. EOF\n')
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  The whole
+                # parse has been rolled back: discard the token and go on.
+                if len(statestack) <= 1 and lookahead.type != '$end':
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+                if lookahead.type == '$end':
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != 'error':
+                    sym = symstack[-1]
+                    if sym.type == 'error':
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = newsymbol()
+                    t.type = 'error'
+
+                    if hasattr(lookahead, 'lineno'):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, 'lexpos'):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                else:
+                    sym = symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # Call an error function here
+            raise RuntimeError('yacc: internal parser error!!!\n')
+'''
+
+# Writes the standalone parser module of the grammar in modulename.  The
+# parser is the module's 'parser' attribute if it has one; otherwise it is
+# built with yacc.yacc().
+def generate(modulename, filename):
+    from . import yacc
+    module = importlib.import_module(modulename)
+    parser = getattr(module, 'parser', None)
+    if not isinstance(parser, yacc.LRParser):
+        parser = yacc.yacc(module=module, write_tables=False, debug=False)
+    write_parser(parser, vars(module), filename)
+    print('Wrote %s' % filename)
+
 if __name__ == '__main__':
-    main()
+    if len(sys.argv) == 3:
+        # python ply/ygen.py grammarmodule outputfile.py
+        sys.path.insert(0, os.getcwd())
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from ply import ygen
+        ygen.generate(sys.argv[1], sys.argv[2])
+    else:
+        main()
 
 
 
@@ -0,0 +1,151 @@
+# Pruebas del analizador léxico con autómata (ply/lexdfa.py).
+#
+# Cada prueba construye el mismo analizador léxico dos veces, con las
+# expresiones regulares de re (dfa=False) y con el autómata (dfa=True), y
+# comprueba que ambos dan exactamente los mismos tokens (tipo, valor y
+# posición) y los mismos caracteres ilegales sobre las mismas entradas.
+#
+# Uso: python -m unittest discover tests   (o python -m pytest tests)
+
+import os
+import re
+import sys
+import random
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ply.lex as lex
+import ply.lexdfa as lexdfa
+import AnalizadorLexico
+
+# Caracteres de las entradas aleatorias: ASCII, letras y dígitos no ASCII,
+# espacios Unicode y caracteres de control
+ALFABETO = ('abcxyzABCXYZ_0123456789#-+*/.:;,=<>()[]{}\\^$|?\'" \t\n\r\x0b\x0c\x00\x07\x08'
+            'ñÑéß٣१²½   \x1c')
+
+
+# Tokens y errores de un analizador sobre una entrada
+def tokens(lexer, datos):
+    lexer.input(datos)
+    return [(t.type, t.value, t.lexpos) for t in iter(lexer.token, None)]
+
+
+# Reglas de prueba: cada clase es un analizador léxico de PLY. PLY no admite
+# dos reglas con el mismo nombre en un archivo, así que t_error se hereda.
+class Reglas:
+    def t_error(self, t):
+        t.lexer.skip(1)
+
+
+class Categorias(Reglas):
+    tokens = ('DIGITOS', 'PALABRA', 'ESPACIO', 'NODIGITO', 'NOPALABRA', 'NOESPACIO')
+    t_DIGITOS = r'\d+'
+    t_PALABRA = r'\w+'
+    t_ESPACIO = r'\s+'
+    t_NODIGITO = r'\D\D\D'
+    t_NOPALABRA = r'\W\W'
+    t_NOESPACIO = r'\S'
+
+class Clases(Reglas):
+    tokens = ('RANGO', 'NEGADA', 'ESCAPES', 'CATEGORIAS', 'GUION', 'CORCHETE')
+    t_RANGO = r'[a-cx-zA-C]+'
+    t_NEGADA = r'[^a-z\s0-9]+'
+    t_ESCAPES = r'[\t\n\]\\]+'
+    t_CATEGORIAS = r'[\d_][\w-]*'
+    t_GUION = r'[-+]'
+    t_CORCHETE = r'[]{}]'
+
+class Escapes(Reglas):
+    tokens = ('OCTAL', 'OCTALCLASE', 'NULO', 'HEX', 'UNICODE', 'PUNTO')
+    t_OCTAL = r'\012\011'       # \n\t: tres dígitos octales cada uno
+    t_OCTALCLASE = r'[\101-\103\7]+'
+    t_NULO = r'\0\x41?'
+    t_HEX = r'\x23\x5b?'
+    t_UNICODE = r'ñ+\U000000e9?'
+    t_PUNTO = r'\.'
+    t_ignore = ' '
+
+class Punto(Reglas):
+    tokens = ('CMT', 'ID', 'CUALQUIERA')
+    t_CMT = r'\#.\#'
+    t_ID = r'[a-z]+'
+    t_CUALQUIERA = r'[.][.]?.'
+
+class ReglasRepetidas(Reglas):
+    tokens = ('AB', 'ABC', 'LLAVES', 'OPCIONAL')
+    t_AB = r'(ab){2,3}'
+    t_ABC = r'(?:a|b|c){1}c{,2}'
+    t_LLAVES = r'x{2}|y{1,}|z{'
+    t_OPCIONAL = r'0?1*2+'
+
+class PruebasLexDFA(unittest.TestCase):
+    # Construye el analizador con los dos motores y compara los tokens de
+    # las entradas dadas y de entradas aleatorias
+    def comparar(self, reglas, entradas=(), reflags=0, aleatorias=300):
+        conRe = lex.lex(object=reglas(), reflags=reflags, errorlog=lex.NullLogger())
+        conDfa = lex.lex(object=reglas(), reflags=reflags, errorlog=lex.NullLogger(), dfa=True)
+        self.assertIsNone(conRe.lexdfa)
+        self.assertIsNotNone(conDfa.lexdfa, 'las reglas deberían compilarse en un autómata')
+        generador = random.Random(reglas.__name__)
+        entradas = list(entradas)
+        for _ in range(aleatorias):
+            entradas.append(''.join(generador.choice(ALFABETO) for _ in range(generador.randint(0, 40))))
+        for datos in entradas:
+            self.assertEqual(tokens(conRe, datos), tokens(conDfa, datos), repr(datos))
+
+    def test_categorias(self):
+        self.comparar(Categorias, ['abc 123 ٣١ ñandú x', '___\x1c\x1c--', '²½ ١٢'])
+
+    def test_clases(self):
+        self.comparar(Clases, ['abcxyz ABC', 'DEF\t\n]\\', '9a-b', '_-_- ]{}', '+-'])
+
+    def test_escapes(self):
+        self.comparar(Escapes, ['\n\t', '\x0012', 'ABC\x07', '\x00A', '#[#', 'ñññé', '\\012'])
+
+    def test_punto(self):
+        self.comparar(Punto, ['ab #x# cd', '#\n#', '..\n', '.\n'])
+
+    def test_punto_dotall(self):
+        self.comparar(Punto, ['ab #x# cd', '#\n#', '..\n', '.\n'], reflags=re.DOTALL)
+
+    def test_repeticiones(self):
+        self.comparar(ReglasRepetidas, ['ababab', 'abab', 'acc', 'xxyyyz{', '0122', '12'])
+
+    def test_verbose(self):
+        self.comparar(Clases, ['abc DEF'], reflags=re.VERBOSE)
+
+    # El analizador léxico de PL/0, con sus reglas de funciones y literales
+    def test_pl0(self):
+        pl0 = AnalizadorLexico.analizador.clone()
+        pl0.lexerrorf = lambda t: t.lexer.skip(1)
+        pl0dfa = pl0.clone()
+        self.assertTrue(pl0dfa.builddfa(lex.NullLogger()))
+        fuente = 'const a = 1;\nvar x;\nprocedure p;\nbegin x := a + 2 * (x - 3) end;\nbegin call p; if odd x then x := x / 2 end'
+        generador = random.Random(0)
+        for datos in [fuente, fuente.upper(), 'BeGiN x #:= 1 end']:
+            self.assertEqual(tokens(pl0, datos), tokens(pl0dfa, datos), repr(datos))
+        for _ in range(200):
+            datos = list(fuente)
+            for _ in range(5):
+                datos.insert(generador.randrange(len(datos) + 1), generador.choice(ALFABETO))
+            datos = ''.join(datos)
+            self.assertEqual(tokens(pl0, datos), tokens(pl0dfa, datos), repr(datos))
+
+    # Las expresiones que el autómata no admite dejan el estado con re
+    def test_no_admitidas(self):
+        for regla in [r'(a)\2', r'\bxy', r'a+?', r'^a', r'(?=a)a', r'\N{DIGIT ONE}', r'(?i:a)']:
+            re.compile('(?P<t_T>%s)' % regla)  # Es válida para re, como la compila PLY
+            reglas = type('NoAdmitida', (Reglas,), {'tokens': ('T',), 't_T': regla})
+            lexer = lex.lex(object=reglas(), errorlog=lex.NullLogger(), dfa=True)
+            self.assertIsNone(lexer.lexdfa, regla)
+
+    # Los escapes mal formados son DFAUnsupported, no otra excepción
+    def test_escapes_erroneos(self):
+        for regla in [r'\xZZ', r'\x4', r'\u12G4', r'\U00110000', r'\400', r'[\9]', r'\12']:
+            with self.assertRaises(lexdfa.DFAUnsupported, msg=regla):
+                lexdfa._RegexParser(regla, 0).parse()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import os
 import codecs
 import re
+import mmap
+from array import array
 
 # Función para buscar archivos en un directorio
 def buscarFicheros(directorio):
@@ -89,102 +91,274 @@ def procesarArchivo(directorio):
         else:
             print("\nPor favor, selecciona otro archivo.\n")
 
-# Definir la ruta del directorio donde se encuentran los archivos
-directorio = 'C:\\Users\\_\\Desktop\\analizador lexico\\test'
+# Palabras clave de MiniPascal (conjunto inmutable, se construye una sola vez)
+keywords = frozenset({
+    'begin', 'end', 'var', 'integer', 'real', 'boolean', 'char', 'if', 'then', 'else', 'while', 'do',
+    'program', 'procedure', 'function', 'true', 'false', 'and', 'or', 'not', 'div', 'mod'
+})
+keyword_length = max(len(word) for word in keywords)  # Longitud de la palabra clave más larga
 
-# Ejecutar el proceso de selección y lectura de archivo
-contenidoArchivo = procesarArchivo(directorio)
+# Definición de los patrones de tokens.
+# El orden importa: en la alternancia gana el primer patrón que coincide, por
+# eso los operadores de dos caracteres van antes que los de uno.
+token_specification = [
+    ('COMMENT', r'\{.*?\}'),            # Comentarios entre llaves
+    ('MULTILINE_COMMENT', r'\(\*.*?\*\)'), # Comentarios multilínea (* ... *)
+    ('NUMBER', r'\d+(?:\.\d*)?'),       # Números enteros o reales
+    ('CHAR', r'\'[^\']\''),             # Constante de carácter (e.g., 'a')
+    ('STRING', r'\'[^\']*?\''),         # Cadenas de texto (e.g., 'texto')
+    ('ASSIGN', r':='),                  # Operador de asignación
+    ('COLON', r':'),                    # Dos puntos
+    ('SEMICOLON', r';'),                # Punto y coma
+    ('COMMA', r','),                    # Coma
+    ('DOT', r'\.'),                     # Punto
+    ('LPAREN', r'\('),                  # Paréntesis izquierdo
+    ('RPAREN', r'\)'),                  # Paréntesis derecho
+    ('LBRACKET', r'\['),                # Corchete izquierdo
+    ('RBRACKET', r'\]'),                # Corchete derecho
+    ('EQ', r'='),                       # Igual
+    ('NEQ', r'<>'),                     # No igual
+    ('LTE', r'<='),                     # Menor o igual que
+    ('GTE', r'>='),                     # Mayor o igual que
+    ('LT', r'<'),                       # Menor que
+    ('GT', r'>'),                       # Mayor que
+    ('PLUS', r'\+'),                    # Suma
+    ('MINUS', r'-'),                    # Resta
+    ('MUL', r'\*'),                     # Multiplicación
+    ('DIV', r'/'),                      # División
+    ('ID', r'[A-Za-z_]\w*'),            # Identificadores
+    ('WHITESPACE', r'\s+'),             # Espacios en blanco
+    ('MISMATCH', r'.'),                 # Cualquier otro carácter no esperado
+]
 
-# Si el archivo ha sido confirmado y leído, proceder al análisis léxico
-if contenidoArchivo:
-    print("\nAnalizando contenido léxico...\n")
-    
-    # Definir palabras clave de MiniPascal
-    keywords = {
-        'begin', 'end', 'var', 'integer', 'real', 'boolean', 'char', 'if', 'then', 'else', 'while', 'do', 
-        'program', 'procedure', 'function', 'true', 'false', 'and', 'or', 'not', 'div', 'mod'
-    }
-
-    # Definición de los patrones de tokens
-    token_specification = [
-        ('COMMENT', r'\{.*?\}'),            # Comentarios entre llaves
-        ('MULTILINE_COMMENT', r'\(\*.*?\*\)'), # Comentarios multilínea (* ... *)
-        ('NUMBER', r'\d+(\.\d*)?'),         # Números enteros o reales
-        ('CHAR', r'\'[^\']\''),             # Constante de carácter (e.g., 'a')
-        ('STRING', r'\'[^\']*?\''),         # Cadenas de texto (e.g., 'texto')
-        ('ASSIGN', r':='),                  # Operador de asignación
-        ('COLON', r':'),                    # Dos puntos
-        ('SEMICOLON', r';'),                # Punto y coma
-        ('COMMA', r','),                    # Coma
-        ('DOT', r'\.'),                     # Punto
-        ('LPAREN', r'\('),                  # Paréntesis izquierdo
-        ('RPAREN', r'\)'),                  # Paréntesis derecho
-        ('LBRACKET', r'\['),                # Corchete izquierdo
-        ('RBRACKET', r'\]'),                # Corchete derecho
-        ('EQ', r'='),                       # Igual
-        ('NEQ', r'<>'),                     # No igual
-        ('LT', r'<'),                       # Menor que
-        ('GT', r'>'),                       # Mayor que
-        ('LTE', r'<='),                     # Menor o igual que
-        ('GTE', r'>='),                     # Mayor o igual que
-        ('PLUS', r'\+'),                    # Suma
-        ('MINUS', r'-'),                    # Resta
-        ('MUL', r'\*'),                     # Multiplicación
-        ('DIV', r'/'),                      # División
-        ('ID', r'[A-Za-z_]\w*'),            # Identificadores
-        ('WHITESPACE', r'\s+'),             # Espacios en blanco
-        ('MISMATCH', r'.'),                 # Cualquier otro carácter no esperado
-    ]
-
-    # Compilar patrones de tokens
-    token_re = '|'.join('(?P<%s>%s)' % pair for pair in token_specification)
-
-# Construcción de la expresión regular que captura todos los tokens definidos
-# `token_specification` es una lista de tuplas donde cada tupla contiene
-# el nombre del token y su expresión regular correspondiente.
-token_re = '|'.join('(?P<%s>%s)' % pair for pair in token_specification)
+# Expresión regular que captura todos los tokens, compilada una sola vez.
+# Los patrones no tienen grupos propios, así que el grupo i de token_re
+# corresponde a la entrada i-1 de token_specification.
+token_re = re.compile('|'.join('(?P<%s>%s)' % pair for pair in token_specification))
 
-class Lexer:
+# La misma expresión para recorrer bytes (por ejemplo, un archivo proyectado
+# con mmap). En este modo \w, \d y \s solo reconocen caracteres ASCII, así que
+# scan_bytes() vuelve a analizar con token_re los tokens con caracteres no ASCII.
+token_re_bytes = re.compile(token_re.pattern.encode('utf-8'))
+
+# Tipos de token como enteros pequeños: el número de grupo de cada patrón.
+# Con mo.lastindex se obtiene el tipo sin buscar el nombre del grupo.
+kind_names = (None,) + tuple(name for name, pattern in token_specification)
+NUMBER = kind_names.index('NUMBER')
+ID = kind_names.index('ID')
+MISMATCH = kind_names.index('MISMATCH')
+IGNORED = frozenset(kind_names.index(name) for name in ('WHITESPACE', 'COMMENT', 'MULTILINE_COMMENT'))
+
+# Tipo extra para las palabras clave (no es un grupo de token_re: un ID que
+# está en keywords se guarda con este tipo en un TokenBuffer).
+KEYWORD = len(kind_names)
+kind_names += ('KEYWORD',)
+
+class ByteMatch:
+    # Coincidencia de un token que scan_bytes() ha vuelto a analizar con
+    # token_re. Ofrece lo mismo que un objeto de coincidencia de re sobre los
+    # bytes: el tipo en lastindex, y span() y group() con posiciones en bytes.
+    __slots__ = ('string', 'lastindex', 'start', 'end')
+
+    def __init__(self, string, lastindex, start, end):
+        self.string = string
+        self.lastindex = lastindex
+        self.start = start
+        self.end = end
+
+    def span(self):
+        return (self.start, self.end)
+
+    def group(self):
+        return self.string[self.start:self.end]
+
+def scan_bytes(code):
+    # Equivalente a token_re_bytes.finditer(code) que encuentra los mismos
+    # tokens que token_re sobre el texto decodificado. Si la coincidencia
+    # contiene un byte no ASCII o va seguida de uno (un identificador como
+    # "año", un número con dígitos Unicode), se decodifica el resto de la línea
+    # y se analiza con token_re. La decodificación es estricta: un archivo que
+    # no es UTF-8 válido lanza UnicodeDecodeError, como al leerlo como str,
+    # aunque aquí solo al llegar a ese punto del archivo.
+    size = len(code)
+    pos = 0
+    while pos < size:
+        for mo in token_re_bytes.finditer(code, pos):
+            end = mo.end()
+            if (end == size or code[end] < 0x80) and mo.group().isascii():
+                yield mo
+                continue
+            # Ningún token salvo los espacios cruza un salto de línea, y un
+            # carácter en UTF-8 nunca contiene el byte \n.
+            start = mo.start()
+            stop = code.find(b'\n', end)
+            text = code[start:stop if stop >= 0 else size].decode('utf-8')
+            mo = token_re.match(text)
+            pos = start + len(mo.group().encode('utf-8'))
+            yield ByteMatch(code, mo.lastindex, start, pos)
+            break  # Se sigue con token_re_bytes desde el final del token
+        else:
+            return
+
+class TokenBuffer:
+    # Tokens guardados por columnas en vectores array('I'): tipo, posición de
+    # inicio, posición de fin y línea. No se crea ningún objeto por token; el
+    # valor se extrae del código fuente solo cuando se pide con value().
     def __init__(self, code):
-        # Inicializa el analizador léxico con el código fuente proporcionado.
+        self.code = code
+        self.kind = array('I')
+        self.start = array('I')
+        self.end = array('I')
+        self.line = array('I')
+
+    def __len__(self):
+        return len(self.kind)
+
+    def value(self, i):
+        # Devuelve el valor del token i, igual que lo entrega Lexer.iter_tokens().
+        value = self.code[self.start[i]:self.end[i]]
+        if not isinstance(value, str):
+            value = value.decode('utf-8')
+        if self.kind[i] == NUMBER:
+            value = float(value) if '.' in value else int(value)
+        return value
+
+    def __getitem__(self, i):
+        # Token i como tupla (tipo, valor).
+        return (kind_names[self.kind[i]], self.value(i))
+
+    def __iter__(self):
+        for i in range(len(self.kind)):
+            yield self[i]
+
+class Lexer:
+    def __init__(self, code, eager=True):
+        # Inicializa el analizador léxico con el código fuente proporcionado,
+        # que puede ser un str o un objeto de bytes en UTF-8 (bytes, mmap).
+        # Con eager=False no se genera la lista de tokens al construirlo: los
+        # tokens se producen bajo demanda al recorrer el analizador con un for.
         self.code = code  # Almacena el código fuente.
         self.tokens = []  # Lista vacía para almacenar los tokens generados.
-        self.tokenize()  # Llama al método tokenize para empezar el proceso.
+        self.tokenized = False  # Indica si self.tokens ya está completa.
+        if eager:
+            self.tokenize()  # Llama al método tokenize para empezar el proceso.
 
-    def tokenize(self):
-        # Método que se encarga de encontrar y generar los tokens.
-        for mo in re.finditer(token_re, self.code):
+    def iter_tokens(self):
+        # Generador que produce los tokens uno a uno, a medida que re.finditer
+        # los va encontrando. No guarda nada, así que la memoria usada no
+        # depende del tamaño del código fuente.
+        binary = not isinstance(self.code, str)
+        for mo in scan_bytes(self.code) if binary else token_re.finditer(self.code):
             # `mo` es el objeto de coincidencia que contiene información sobre el token encontrado.
-            kind = mo.lastgroup  # Obtiene el nombre del grupo coincidente (tipo de token).
-            value = mo.group(kind)  # Extrae el valor del token encontrado.
+            kind = mo.lastindex  # Número del grupo coincidente (tipo de token).
 
             # Clasificación y procesamiento del token encontrado.
-            if kind == 'NUMBER':
-                # Convierte el valor a float o int según corresponda.
-                value = float(value) if '.' in value else int(value)
-            elif kind == 'ID' and value in keywords:
-                # Si es un identificador y está en la lista de palabras clave, cambia su tipo.
-                kind = 'KEYWORD'
-            elif kind == 'WHITESPACE' or kind == 'COMMENT' or kind == 'MULTILINE_COMMENT':
+            if kind in IGNORED:
                 # Si es un espacio en blanco o comentario, se ignora.
                 continue
-            elif kind == 'MISMATCH':
+            value = mo.group()  # Extrae el valor del token encontrado.
+            if binary:
+                # Sobre bytes solo se decodifica el texto de los tokens que se entregan.
+                value = value.decode('utf-8')
+            if kind == ID:
+                # Si es un identificador y está en la lista de palabras clave, cambia su tipo.
+                yield ('KEYWORD' if value in keywords else 'ID', value)
+                continue
+            if kind == NUMBER:
+                # Convierte el valor a float o int según corresponda.
+                value = float(value) if '.' in value else int(value)
+            elif kind == MISMATCH:
                 # Si se encuentra un carácter inesperado, lanza un error.
                 raise RuntimeError(f'Error: caracter inesperado "{value}"')
 
-            # Almacena el token como una tupla (tipo, valor) en la lista de tokens.
-            self.tokens.append((kind, value))
+            # Entrega el token como una tupla (tipo, valor).
+            yield (kind_names[kind], value)
+
+    def __iter__(self):
+        # Recorrer el analizador produce los tokens de forma perezosa.
+        return self.iter_tokens()
+
+    def token_buffer(self):
+        # Genera todos los tokens en un TokenBuffer en lugar de una lista de
+        # tuplas. Ocupa una fracción de la memoria en archivos grandes.
+        code = self.code
+        binary = not isinstance(code, str)
+        newline = b'\n' if binary else '\n'
+        count = getattr(code, 'count', None)  # mmap no tiene count()
+        buffer = TokenBuffer(code)
+        kinds, starts, ends, lines = buffer.kind.append, buffer.start.append, buffer.end.append, buffer.line.append
+        line = 1
+        last = 0
+        for mo in scan_bytes(code) if binary else token_re.finditer(code):
+            kind = mo.lastindex
+            if kind in IGNORED:
+                continue
+            start, end = mo.span()
+            if kind == ID:
+                # Solo se extrae el texto de los identificadores que por su
+                # longitud pueden ser una palabra clave.
+                if end - start <= keyword_length:
+                    word = code[start:end]
+                    if binary:
+                        word = word.decode('utf-8')
+                    if word in keywords:
+                        kind = KEYWORD
+            elif kind == MISMATCH:
+                value = mo.group()
+                if binary:
+                    value = value.decode('utf-8')
+                raise RuntimeError(f'Error: caracter inesperado "{value}"')
+            line += count(newline, last, start) if count else code[last:start].count(newline)
+            last = start
+            kinds(kind)
+            starts(start)
+            ends(end)
+            lines(line)
+        return buffer
+
+    def tokenize(self):
+        # Método que genera todos los tokens y los almacena en la lista de tokens.
+        self.tokens.extend(self.iter_tokens())
+        self.tokenized = True
 
     def get_tokens(self):
         # Método para obtener la lista de tokens generados.
+        if not self.tokenized:
+            self.tokenize()
         return self.tokens
 
-# Crear una instancia del analizador léxico con el contenido del archivo.
-lexer = Lexer(contenidoArchivo)
-# Obtener los tokens generados por el analizador léxico.
-tokens = lexer.get_tokens()
+    @classmethod
+    def from_file(cls, path):
+        # Crea un analizador perezoso sobre un archivo proyectado en memoria con
+        # mmap: el archivo no se lee ni se decodifica entero antes de analizarlo.
+        with open(path, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                data = b''  # Un archivo vacío no se puede proyectar.
+        return cls(data, eager=False)
+
+    def close(self):
+        # Libera la proyección en memoria creada por from_file().
+        if isinstance(self.code, mmap.mmap):
+            self.code.close()
+
+if __name__ == '__main__':
+    # Definir la ruta del directorio donde se encuentran los archivos
+    directorio = 'C:\\Users\\_\\Desktop\\analizador lexico\\test'
+
+    # Ejecutar el proceso de selección y lectura de archivo
+    contenidoArchivo = procesarArchivo(directorio)
+
+    # Si el archivo ha sido confirmado y leído, proceder al análisis léxico
+    if contenidoArchivo:
+        print("\nAnalizando contenido léxico...\n")
+
+        # Crear una instancia del analizador léxico con el contenido del archivo.
+        # Los tokens se generan a medida que se imprimen, sin guardarlos en una lista.
+        lexer = Lexer(contenidoArchivo, eager=False)
 
-# Mostrar los tokens generados en la consola.
-print("Tokens generados:\n")
-for token in tokens:
-    print(token)  # Imprime cada token en la consola.
+        # Mostrar los tokens generados en la consola.
+        print("Tokens generados:\n")
+        for token in lexer:
+            print(token)  # Imprime cada token en la consola.